@@ -5,9 +5,11 @@ import json
 import time
 import os
 import logging
+from itertools import count
 from typing import Dict, Any, Optional, List
-from fastapi import FastAPI, HTTPException, Request, Header
+from fastapi import FastAPI, HTTPException, Request, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field, field_validator
 import uvicorn
 
@@ -53,6 +55,14 @@ class TessellateRequest(BaseModel):
     """Request model for tessellation"""
     shape_id: str = Field(..., description="Shape ID to tessellate")
     deflection: float = Field(default=0.1, description="Tessellation quality")
+    angular_deflection: float = Field(default=0.5, description="Angular deflection in radians")
+    is_relative: bool = Field(default=False, description="Treat deflection as relative to edge size")
+    session_id: Optional[str] = Field(None, description="Session ID")
+
+
+class BatchRequest(BaseModel):
+    """Request model for running several model operations in one call"""
+    operations: List[Dict[str, Any]] = Field(..., description="Operations to run in order; \"$i\" refers to the result of operation i")
     session_id: Optional[str] = Field(None, description="Session ID")
 
 
@@ -372,6 +382,8 @@ class CADAPIServer:
     def __init__(self, host: str = "0.0.0.0", port: int = 8080):
         self.host = host
         self.port = port
+        # Suffixes for batch boolean results that don't name their own result_id
+        self._batch_result_ids = count(1)
         self.app = FastAPI(
             title="CAD Engine Server",
             description="Python CAD API Server using pythonOCC",
@@ -400,6 +412,10 @@ class CADAPIServer:
             allow_headers=["*"],
         )
         
+        # Compress mesh-sized responses for clients sending Accept-Encoding: gzip;
+        # small JSON replies are left as-is. Level 5 keeps CPU cost low for large meshes
+        self.app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+        
         # Setup routes
         self._setup_routes()
         
@@ -424,12 +440,14 @@ class CADAPIServer:
         @self.app.post("/api/v1/models")
         async def create_model(
             request: CreateModelRequest,
-            x_session_id: Optional[str] = Header(None, alias="X-Session-ID")
+            x_session_id: Optional[str] = Header(None, alias="X-Session-ID"),
+            mesh: str = Query("full", pattern="^(full|metadata)$",
+                             description="Mesh payload: full, or metadata for counts only")
         ):
             """Create model endpoint - equivalent to C++ handleCreateModel"""
             try:
                 session_id = self._get_session_id(request.session_id, x_session_id)
-                response_data = await self._handle_create_model(session_id, request)
+                response_data = await self._handle_create_model(session_id, request, mesh)
                 
                 return APIResponse(
                     success=True,
@@ -438,7 +456,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in create_model: {e}")
+                logger.error("Error in create_model: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -448,12 +466,14 @@ class CADAPIServer:
         @self.app.post("/api/v1/operations")
         async def boolean_operation(
             request: BooleanOperationRequest,
-            x_session_id: Optional[str] = Header(None, alias="X-Session-ID")
+            x_session_id: Optional[str] = Header(None, alias="X-Session-ID"),
+            mesh: str = Query("full", pattern="^(full|metadata)$",
+                             description="Mesh payload: full, or metadata for counts only")
         ):
             """Boolean operations endpoint - equivalent to C++ handleBooleanOperation"""
             try:
                 session_id = self._get_session_id(request.session_id, x_session_id)
-                response_data = await self._handle_boolean_operation(session_id, request)
+                response_data = await self._handle_boolean_operation(session_id, request, mesh)
                 
                 return APIResponse(
                     success=True,
@@ -462,7 +482,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in boolean_operation: {e}")
+                logger.error("Error in boolean_operation: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -486,7 +506,33 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in tessellate: {e}")
+                logger.error("Error in tessellate: %s", e)
+                return APIResponse(
+                    success=False,
+                    timestamp=int(time.time()),
+                    error=str(e)
+                )
+        
+        @self.app.post("/api/v1/batch")
+        async def batch(
+            request: BatchRequest,
+            x_session_id: Optional[str] = Header(None, alias="X-Session-ID"),
+            mesh: str = Query("full", pattern="^(full|metadata)$",
+                             description="Mesh payload: full, or metadata for counts only")
+        ):
+            """Batch endpoint - runs create/boolean operations in a single round-trip"""
+            try:
+                session_id = self._get_session_id(request.session_id, x_session_id)
+                response_data = await self._handle_batch(session_id, request, mesh)
+                
+                return APIResponse(
+                    success=True,
+                    timestamp=int(time.time()),
+                    data=response_data
+                )
+                
+            except Exception as e:
+                logger.error("Error in batch: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -508,7 +554,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in create_sketch_plane: {e}")
+                logger.error("Error in create_sketch_plane: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -528,7 +574,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in create_sketch: {e}")
+                logger.error("Error in create_sketch: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -548,7 +594,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in add_sketch_element: {e}")
+                logger.error("Error in add_sketch_element: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -568,7 +614,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in extrude_feature: {e}")
+                logger.error("Error in extrude_feature: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -588,7 +634,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in add_fillet: {e}")
+                logger.error("Error in add_fillet: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -608,7 +654,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in add_chamfer: {e}")
+                logger.error("Error in add_chamfer: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -628,7 +674,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error in update_line: {e}")
+                logger.error("Error in update_line: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -651,7 +697,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error in delete_sketch_element: {e}")
+                logger.error("Error in delete_sketch_element: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -671,7 +717,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in trim_line_to_line: {e}")
+                logger.error("Error in trim_line_to_line: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -691,7 +737,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in trim_line_to_geometry: {e}")
+                logger.error("Error in trim_line_to_geometry: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -711,7 +757,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in extend_line_to_line: {e}")
+                logger.error("Error in extend_line_to_line: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -731,7 +777,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in extend_line_to_geometry: {e}")
+                logger.error("Error in extend_line_to_geometry: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -751,7 +797,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in mirror_elements: {e}")
+                logger.error("Error in mirror_elements: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -771,7 +817,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in mirror_elements_by_two_points: {e}")
+                logger.error("Error in mirror_elements_by_two_points: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -791,7 +837,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in offset_element: {e}")
+                logger.error("Error in offset_element: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -811,7 +857,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in offset_element_directional: {e}")
+                logger.error("Error in offset_element_directional: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -831,7 +877,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in copy_element: {e}")
+                logger.error("Error in copy_element: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -851,7 +897,7 @@ class CADAPIServer:
                 )
                 
             except Exception as e:
-                print(f"❌ Error in move_element: {e}")
+                logger.error("Error in move_element: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -873,7 +919,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error in create_linear_array: {e}")
+                logger.error("Error in create_linear_array: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -893,7 +939,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error in create_mirror_array: {e}")
+                logger.error("Error in create_mirror_array: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -921,7 +967,7 @@ class CADAPIServer:
             except HTTPException:
                 raise
             except Exception as e:
-                print(f"❌ Error getting session info: {e}")
+                logger.error("Error getting session info: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -947,7 +993,7 @@ class CADAPIServer:
             except HTTPException:
                 raise
             except Exception as e:
-                print(f"❌ Error deleting session: {e}")
+                logger.error("Error deleting session: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -1044,7 +1090,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error creating constraint: {e}")
+                logger.error("Error creating constraint: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -1091,7 +1137,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error deleting constraint: {e}")
+                logger.error("Error deleting constraint: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -1177,7 +1223,7 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error updating constraint: {e}")
+                logger.error("Error updating constraint: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
@@ -1235,20 +1281,21 @@ class CADAPIServer:
                 )
 
             except Exception as e:
-                print(f"❌ Error validating constraint: {e}")
+                logger.error("Error validating constraint: %s", e)
                 return APIResponse(
                     success=False,
                     timestamp=int(time.time()),
                     error=str(e)
                 )
 
-        print("HTTP routes configured")
+        logger.debug("HTTP routes configured")
     
     # ==================== REQUEST HANDLERS ====================
     
-    async def _handle_create_model(self, session_id: str, request: CreateModelRequest) -> Dict[str, Any]:
+    async def _handle_create_model(self, session_id: str, request: CreateModelRequest,
+                                   mesh: str = "full") -> Dict[str, Any]:
         """Handle model creation - equivalent to C++ handleCreateModel"""
-        print(f"🔧 Creating model: {request.type} for session {session_id}")
+        logger.debug("Creating model: %s for session %s", request.type, session_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(session_id)
@@ -1282,32 +1329,24 @@ class CADAPIServer:
             raise Exception("Failed to create model")
         
         # Generate mesh data
-        print(f"🔍 Tessellating shape: {shape_id}")
+        logger.debug("Tessellating shape: %s", shape_id)
         mesh_data = engine.tessellate(shape_id)
         
         # Prepare response
         response_data = {
             "model_id": shape_id,
             "session_id": session_id,
-            "mesh_data": {
-                "vertices": mesh_data.vertices,
-                "faces": mesh_data.faces,
-                "normals": mesh_data.normals,
-                "metadata": {
-                    "vertex_count": mesh_data.vertex_count,
-                    "face_count": mesh_data.face_count,
-                    "tessellation_quality": mesh_data.tessellation_quality
-                }
-            },
+            "mesh_data": self._mesh_payload(mesh_data, mesh),
             "bounding_box": engine.get_bounding_box(shape_id) or {"min": [0.0, 0.0, 0.0], "max": [1.0, 1.0, 1.0]}
         }
         
-        print(f"✅ Model created successfully: {shape_id}")
+        logger.debug("Model created successfully: %s", shape_id)
         return response_data
     
-    async def _handle_boolean_operation(self, session_id: str, request: BooleanOperationRequest) -> Dict[str, Any]:
+    async def _handle_boolean_operation(self, session_id: str, request: BooleanOperationRequest,
+                                        mesh: str = "full") -> Dict[str, Any]:
         """Handle boolean operations - equivalent to C++ handleBooleanOperation"""
-        print(f"🔧 Boolean operation: {request.operation} for session {session_id}")
+        logger.debug("Boolean operation: %s for session %s", request.operation, session_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(session_id)
@@ -1346,24 +1385,15 @@ class CADAPIServer:
             "shape1_id": shape1_id,
             "shape2_id": shape2_id,
             "session_id": session_id,
-            "mesh_data": {
-                "vertices": mesh_data.vertices,
-                "faces": mesh_data.faces,
-                "normals": mesh_data.normals,
-                "metadata": {
-                    "vertex_count": mesh_data.vertex_count,
-                    "face_count": mesh_data.face_count,
-                    "tessellation_quality": mesh_data.tessellation_quality
-                }
-            }
+            "mesh_data": self._mesh_payload(mesh_data, mesh)
         }
         
-        print(f"✅ Boolean operation completed: {result_id}")
+        logger.debug("Boolean operation completed: %s", result_id)
         return response_data
     
     async def _handle_tessellate(self, session_id: str, request: TessellateRequest) -> Dict[str, Any]:
         """Handle tessellation - equivalent to C++ handleTessellate"""
-        print(f"🔧 Tessellating shape: {request.shape_id} for session {session_id}")
+        logger.debug("Tessellating shape: %s for session %s", request.shape_id, session_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(session_id)
@@ -1375,31 +1405,91 @@ class CADAPIServer:
             raise Exception(f"Shape {request.shape_id} does not exist")
         
         # Perform tessellation
-        mesh_data = engine.tessellate(request.shape_id, request.deflection)
+        mesh_data = engine.tessellate(request.shape_id, request.deflection,
+                                      request.angular_deflection, request.is_relative)
         
         response_data = {
             "shape_id": request.shape_id,
             "session_id": session_id,
-            "mesh_data": {
-                "vertices": mesh_data.vertices,
-                "faces": mesh_data.faces,
-                "normals": mesh_data.normals,
-                "metadata": {
-                    "vertex_count": mesh_data.vertex_count,
-                    "face_count": mesh_data.face_count,
-                    "tessellation_quality": mesh_data.tessellation_quality
-                }
-            }
+            "mesh_data": mesh_data.to_dict()
         }
         
-        print(f"✅ Tessellation completed: {request.shape_id}")
+        logger.debug("Tessellation completed: %s", request.shape_id)
         return response_data
     
+    async def _handle_batch(self, session_id: str, request: BatchRequest,
+                            mesh: str = "full") -> Dict[str, Any]:
+        """Handle a batch of create/boolean operations; the first failure rolls back the whole batch"""
+        logger.debug("Batch of %d operations for session %s", len(request.operations), session_id)
+        
+        engine = SessionManager.get_instance().get_or_create_session(session_id)
+        if engine is None:
+            raise Exception("Failed to get session")
+        
+        # Operations can add shapes, overwrite ids, or store a shape and then fail
+        # (e.g. in tessellation), so rollback restores the whole shape table
+        shapes_before = engine.snapshot_shapes()
+        
+        result_ids: List[str] = []
+        results: List[Dict[str, Any]] = []
+        
+        def resolve(ref: str) -> str:
+            # "$i" names the result of an earlier operation in this batch
+            if isinstance(ref, str) and ref.startswith("$"):
+                index = int(ref[1:])
+                if not 0 <= index < len(result_ids):
+                    raise Exception(f"Invalid batch reference: {ref}")
+                return result_ids[index]
+            return ref
+        
+        for index, op in enumerate(request.operations):
+            op_type = op.get("op")
+            try:
+                if op_type == "create":
+                    result = await self._handle_create_model(session_id, CreateModelRequest(
+                        type=op.get("type", ""),
+                        parameters=op.get("parameters", {})
+                    ), mesh)
+                    result_ids.append(result["model_id"])
+                    
+                elif op_type == "boolean":
+                    inputs = op.get("inputs", [])
+                    if len(inputs) != 2:
+                        raise Exception("Boolean operation needs exactly two inputs")
+                    operation = op.get("operation", "")
+                    result = await self._handle_boolean_operation(session_id, BooleanOperationRequest(
+                        operation=operation,
+                        parameters={
+                            "shape1_id": resolve(inputs[0]),
+                            "shape2_id": resolve(inputs[1]),
+                            "result_id": op.get("result_id", f"{operation}_batch_result_{next(self._batch_result_ids)}")
+                        }
+                    ), mesh)
+                    result_ids.append(result["result_id"])
+                    
+                else:
+                    raise Exception(f"Unknown batch operation: {op_type}")
+                    
+            except Exception as e:
+                # All or nothing: undo every shape change made by this batch
+                engine.restore_shapes(shapes_before)
+                logger.debug("Batch rolled back after operation %d", index)
+                raise Exception(f"Batch operation {index} ({op_type}) failed: {e}") from e
+            
+            results.append(result)
+        
+        logger.debug("Batch completed: %s", result_ids)
+        return {
+            "session_id": session_id,
+            "result_ids": result_ids,
+            "results": results
+        }
+    
     # ==================== SKETCH-BASED MODELING HANDLERS ====================
     
     async def _handle_create_sketch_plane(self, request: CreateSketchPlaneRequest) -> Dict[str, Any]:
         """Handle sketch plane creation - Real implementation using geometry engine"""
-        print(f"🎯 Creating sketch plane: {request.plane_type} for session {request.session_id}")
+        logger.debug("Creating sketch plane: %s for session %s", request.plane_type, request.session_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1444,12 +1534,12 @@ class CADAPIServer:
         if viz_data:
             response_data["visualization_data"] = viz_data
         
-        print(f"✅ Sketch plane created successfully: {plane_id}")
+        logger.debug("Sketch plane created successfully: %s", plane_id)
         return response_data
     
     async def _handle_create_sketch(self, request: CreateSketchRequest) -> Dict[str, Any]:
         """Handle sketch creation - Real implementation using geometry engine"""
-        print(f"📐 Creating sketch on plane: {request.plane_id} for session {request.session_id}")
+        logger.debug("Creating sketch on plane: %s for session %s", request.plane_id, request.session_id)
 
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1488,12 +1578,12 @@ class CADAPIServer:
         if sketch_info:
             response_data["sketch_info"] = sketch_info
         
-        print(f"✅ Sketch created successfully: {sketch_id}")
+        logger.debug("Sketch created successfully: %s", sketch_id)
         return response_data
     
     async def _handle_add_sketch_element(self, request: AddSketchElementRequest) -> Dict[str, Any]:
         """Handle adding sketch element - equivalent to C++ handleAddSketchElement"""
-        print(f"📏 Adding {request.element_type} to sketch: {request.sketch_id}")
+        logger.debug("Adding %s to sketch: %s", request.element_type, request.sketch_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1662,7 +1752,7 @@ class CADAPIServer:
         viz_data = engine.get_sketch_element_visualization_data(request.sketch_id, element_id)
         if viz_data:
             response_data["visualization_data"] = viz_data
-            print(f"✅ Generated element visualization data for: {element_id} (container: {viz_data.get('is_container_only', False)})")
+            logger.debug("Generated element visualization data for: %s (container: %s)", element_id, viz_data.get('is_container_only', False))
         
         # Add container flag for frontend
         if element:
@@ -1670,7 +1760,7 @@ class CADAPIServer:
         
         # Handle composite shapes (rectangles, polygons) with child elements
         if element and element.is_composite_parent and element.child_ids:
-            print(f"📐 Composite shape created with {len(element.child_ids)} child elements")
+            logger.debug("Composite shape created with %s child elements", len(element.child_ids))
             
             # Get visualization data for each child element
             child_elements = []
@@ -1685,14 +1775,14 @@ class CADAPIServer:
             if child_elements:
                 response_data["child_elements"] = child_elements
                 response_data["is_composite"] = True
-                print(f"✅ Added parent + {len(child_elements)} child visualizations to response")
+                logger.debug("Added parent + %s child visualizations to response", len(child_elements))
         
-        print(f"✅ Sketch element added: {element_id}")
+        logger.debug("Sketch element added: %s", element_id)
         return response_data
     
     async def _handle_extrude_feature(self, request: ExtrudeRequest) -> Dict[str, Any]:
         """Handle extrude feature - Real implementation using geometry engine"""
-        print(f"🚀 Extruding sketch: {request.sketch_id} distance: {request.distance}")
+        logger.debug("Extruding sketch: %s distance: %s", request.sketch_id, request.distance)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1725,12 +1815,12 @@ class CADAPIServer:
         response_data["distance"] = request.distance
         response_data["direction"] = request.direction
         
-        print(f"✅ Extrude feature created: {response_data.get('feature_id')}")
+        logger.debug("Extrude feature created: %s", response_data.get('feature_id'))
         return response_data
     
     async def _handle_add_fillet(self, request: FilletRequest) -> Dict[str, Any]:
         """Handle fillet addition - Real implementation using geometry engine"""
-        print(f"🔵 Adding fillet to sketch: {request.sketch_id} between lines {request.line1_id} & {request.line2_id}")
+        logger.debug("Adding fillet to sketch: %s between lines %s & %s", request.sketch_id, request.line1_id, request.line2_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1788,12 +1878,12 @@ class CADAPIServer:
         if updated_elements:
             response_data["updated_elements"] = updated_elements
         
-        print(f"✅ Fillet created successfully: {fillet_id}")
+        logger.debug("Fillet created successfully: %s", fillet_id)
         return response_data
     
     async def _handle_add_chamfer(self, request: ChamferRequest) -> Dict[str, Any]:
         """Handle chamfer addition - Real implementation using geometry engine"""
-        print(f"🔵 Adding chamfer to sketch: {request.sketch_id} between lines {request.line1_id} & {request.line2_id}")
+        logger.debug("Adding chamfer to sketch: %s between lines %s & %s", request.sketch_id, request.line1_id, request.line2_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1851,12 +1941,12 @@ class CADAPIServer:
         if updated_elements:
             response_data["updated_elements"] = updated_elements
         
-        print(f"✅ Chamfer created successfully: {chamfer_id}")
+        logger.debug("Chamfer created successfully: %s", chamfer_id)
         return response_data
 
     async def _handle_update_line(self, request: UpdateLineRequest) -> Dict[str, Any]:
         """Handle line endpoint update - for dimension-driven resize"""
-        print(f"📏 Updating line {request.element_id} in sketch {request.sketch_id}")
+        logger.debug("Updating line %s in sketch %s", request.element_id, request.sketch_id)
 
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1896,12 +1986,12 @@ class CADAPIServer:
         if viz_data:
             response_data["visualization_data"] = viz_data
 
-        print(f"✅ Line updated successfully: {request.element_id}")
+        logger.debug("Line updated successfully: %s", request.element_id)
         return response_data
 
     async def _handle_delete_sketch_element(self, session_id: str, sketch_id: str, element_id: str) -> Dict[str, Any]:
         """Handle sketch element deletion"""
-        print(f"🗑️ Deleting element {element_id} from sketch {sketch_id}")
+        logger.debug("Deleting element %s from sketch %s", element_id, sketch_id)
 
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(session_id)
@@ -1927,12 +2017,12 @@ class CADAPIServer:
             "message": f"Element {element_id} deleted successfully from sketch {sketch_id}"
         }
 
-        print(f"✅ Element deleted successfully: {element_id}")
+        logger.debug("Element deleted successfully: %s", element_id)
         return response_data
 
     async def _handle_trim_line_to_line(self, request: TrimLineToLineRequest) -> Dict[str, Any]:
         """Handle line-to-line trim operation - Real implementation using geometry engine"""
-        print(f"✂️ Trimming line: {request.line_to_trim_id} with line: {request.cutting_line_id}")
+        logger.debug("Trimming line: %s with line: %s", request.line_to_trim_id, request.cutting_line_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -1965,12 +2055,12 @@ class CADAPIServer:
             "message": f"Line {request.line_to_trim_id} trimmed successfully with line {request.cutting_line_id}"
         }
         
-        print(f"✅ Line trimmed successfully")
+        logger.debug("Line trimmed successfully")
         return response_data
     
     async def _handle_trim_line_to_geometry(self, request: TrimLineToGeometryRequest) -> Dict[str, Any]:
         """Handle line-to-geometry trim operation - Real implementation using geometry engine"""
-        print(f"✂️ Trimming line: {request.line_to_trim_id} with geometry: {request.cutting_geometry_id}")
+        logger.debug("Trimming line: %s with geometry: %s", request.line_to_trim_id, request.cutting_geometry_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2003,12 +2093,12 @@ class CADAPIServer:
             "message": f"Line {request.line_to_trim_id} trimmed successfully with geometry {request.cutting_geometry_id}"
         }
         
-        print(f"✅ Line trimmed successfully")
+        logger.debug("Line trimmed successfully")
         return response_data
     
     async def _handle_extend_line_to_line(self, request: ExtendLineToLineRequest) -> Dict[str, Any]:
         """Handle line-to-line extend operation - Real implementation using geometry engine"""
-        print(f"📏 Extending line: {request.line_to_extend_id} to line: {request.target_line_id}")
+        logger.debug("Extending line: %s to line: %s", request.line_to_extend_id, request.target_line_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2041,12 +2131,12 @@ class CADAPIServer:
             "message": f"Line {request.line_to_extend_id} extended successfully to line {request.target_line_id}"
         }
         
-        print(f"✅ Line extended successfully")
+        logger.debug("Line extended successfully")
         return response_data
     
     async def _handle_extend_line_to_geometry(self, request: ExtendLineToGeometryRequest) -> Dict[str, Any]:
         """Handle line-to-geometry extend operation - Real implementation using geometry engine"""
-        print(f"📏 Extending line: {request.line_to_extend_id} to geometry: {request.target_geometry_id}")
+        logger.debug("Extending line: %s to geometry: %s", request.line_to_extend_id, request.target_geometry_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2079,12 +2169,12 @@ class CADAPIServer:
             "message": f"Line {request.line_to_extend_id} extended successfully to geometry {request.target_geometry_id}"
         }
         
-        print(f"✅ Line extended successfully")
+        logger.debug("Line extended successfully")
         return response_data
     
     async def _handle_mirror_elements(self, request: MirrorElementsRequest) -> Dict[str, Any]:
         """Handle mirror elements - Real implementation using geometry engine"""
-        print(f"🪞 Mirroring elements: {request.element_ids} across line: {request.mirror_line_id}")
+        logger.debug("Mirroring elements: %s across line: %s", request.element_ids, request.mirror_line_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2118,12 +2208,12 @@ class CADAPIServer:
             "message": f"{len(mirrored_element_ids)} elements mirrored successfully across line {request.mirror_line_id}"
         }
         
-        print(f"✅ Elements mirrored successfully")
+        logger.debug("Elements mirrored successfully")
         return response_data
     
     async def _handle_mirror_elements_by_two_points(self, request: MirrorElementsByTwoPointsRequest) -> Dict[str, Any]:
         """Handle mirror elements by two points - Real implementation using geometry engine"""
-        print(f"🪞 Mirroring elements: {request.element_ids} across line defined by points: ({request.x1}, {request.y1}) and ({request.x2}, {request.y2})")
+        logger.debug("Mirroring elements: %s across line defined by points: (%s, %s) and (%s, %s)", request.element_ids, request.x1, request.y1, request.x2, request.y2)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2165,12 +2255,12 @@ class CADAPIServer:
             "message": f"{len(mirrored_element_ids)} elements mirrored successfully across line defined by two points"
         }
         
-        print(f"✅ Elements mirrored successfully")
+        logger.debug("Elements mirrored successfully")
         return response_data
     
     async def _handle_offset_element(self, request: OffsetElementRequest) -> Dict[str, Any]:
         """Handle offset element - Real implementation using geometry engine"""
-        print(f"📐 Offsetting element: {request.element_id} by distance: {request.offset_distance}")
+        logger.debug("Offsetting element: %s by distance: %s", request.element_id, request.offset_distance)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2209,12 +2299,12 @@ class CADAPIServer:
         if viz_data:
             response_data["visualization_data"] = viz_data
         
-        print(f"✅ Element offset successfully")
+        logger.debug("Element offset successfully")
         return response_data
     
     async def _handle_offset_element_directional(self, request: OffsetElementDirectionalRequest) -> Dict[str, Any]:
         """Handle directional offset element - Real implementation using geometry engine"""
-        print(f"📐 Offsetting element: {request.element_id} directionally ({request.direction}) by distance: {request.offset_distance}")
+        logger.debug("Offsetting element: %s directionally (%s) by distance: %s", request.element_id, request.direction, request.offset_distance)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2259,12 +2349,12 @@ class CADAPIServer:
         if viz_data:
             response_data["visualization_data"] = viz_data
         
-        print(f"✅ Element offset directionally successfully")
+        logger.debug("Element offset directionally successfully")
         return response_data
     
     async def _handle_copy_element(self, request: CopyElementRequest) -> Dict[str, Any]:
         """Handle copy element - Real implementation using geometry engine"""
-        print(f"📋 Copying element: {request.element_id} {request.num_copies} times")
+        logger.debug("Copying element: %s %s times", request.element_id, request.num_copies)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2302,12 +2392,12 @@ class CADAPIServer:
             "message": f"{len(copied_element_ids)} elements copied successfully"
         }
         
-        print(f"✅ Elements copied successfully")
+        logger.debug("Elements copied successfully")
         return response_data
     
     async def _handle_move_element(self, request: MoveElementRequest) -> Dict[str, Any]:
         """Handle move element - Real implementation using geometry engine"""
-        print(f"➡️ Moving element: {request.element_id}")
+        logger.debug("Moving element: %s", request.element_id)
         
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2355,14 +2445,14 @@ class CADAPIServer:
         if viz_data:
             response_data["visualization_data"] = viz_data
         
-        print(f"✅ Element moved successfully")
+        logger.debug("Element moved successfully")
         return response_data
 
     # ==================== ARRAY/PATTERN HANDLERS ====================
 
     async def _handle_create_linear_array(self, request: CreateLinearArrayRequest) -> Dict[str, Any]:
         """Handle linear array creation - Real implementation using geometry engine"""
-        print(f"📊 Creating linear array of element: {request.element_id}")
+        logger.debug("Creating linear array of element: %s", request.element_id)
 
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2391,12 +2481,12 @@ class CADAPIServer:
         response_data["session_id"] = request.session_id
         response_data["sketch_id"] = request.sketch_id
 
-        print(f"✅ Linear array created successfully")
+        logger.debug("Linear array created successfully")
         return response_data
 
     async def _handle_create_mirror_array(self, request: CreateMirrorArrayRequest) -> Dict[str, Any]:
         """Handle mirror array creation - Real implementation using geometry engine"""
-        print(f"🪞 Creating mirror array of {len(request.element_ids)} elements")
+        logger.debug("Creating mirror array of %s elements", len(request.element_ids))
 
         session_manager = SessionManager.get_instance()
         engine = session_manager.get_or_create_session(request.session_id)
@@ -2425,11 +2515,15 @@ class CADAPIServer:
         response_data["session_id"] = request.session_id
         response_data["sketch_id"] = request.sketch_id
 
-        print(f"✅ Mirror array created successfully")
+        logger.debug("Mirror array created successfully")
         return response_data
 
     # ==================== UTILITY METHODS ====================
     
+    def _mesh_payload(self, mesh_data: MeshData, mesh: str) -> Dict[str, Any]:
+        """Serialize mesh data for the requested "mesh" query mode (full or metadata)"""
+        return mesh_data.to_dict(include_geometry=(mesh == "full"))
+    
     def _get_session_id(self, body_session_id: Optional[str], header_session_id: Optional[str]) -> str:
         """Get session ID from request - equivalent to C++ getSessionId"""
         session_id = header_session_id or body_session_id or "default-session"
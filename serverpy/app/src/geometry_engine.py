@@ -2,23 +2,30 @@
 Core geometry engine using pythonOCC - Python version of OCCTEngine
 """
 import json
-import random
-import string
+import logging
 import math
-from typing import Dict, List, Optional, Tuple, Any, Union
+from collections import OrderedDict
+from itertools import chain, count
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import time
 
+import numpy as np
+
 # pythonOCC core imports
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse, BRepAlgoAPI_Cut, BRepAlgoAPI_Common
+from OCC.Core.BOPAlgo import BOPAlgo_Options
+from OCC.Core.OSD import OSD_ThreadPool
 from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
 from OCC.Core.BRepCheck import BRepCheck_Analyzer
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere, BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakePrism
 from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopTools import TopTools_ListOfShape
 from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_REVERSED
-from OCC.Core.BRep import BRep_Tool
-from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Face, topods
+from OCC.Core.BRep import BRep_Tool, BRep_Builder
+from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Face, TopoDS_Compound, topods
 from OCC.Core.Poly import Poly_Triangulation
 from OCC.Core.TopLoc import TopLoc_Location
 from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Dir, gp_Ax3, gp_Pln, gp_Pnt2d, gp_Lin2d
@@ -35,6 +42,64 @@ from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeEdge, BRepBuilderAPI_Make
 from OCC.Core.Geom import Geom_Circle, Geom_Line
 from OCC.Core.gce import gce_MakeCirc, gce_MakeLin
 
+logger = logging.getLogger("geometry-engine")
+
+# Directional offset codes, relative to the line's start->end direction
+OFFSET_LEFT = 0
+OFFSET_RIGHT = 1
+OFFSET_DIRECTION_CODES = {"left": OFFSET_LEFT, "right": OFFSET_RIGHT}
+
+# Angular deflection (radians) passed to BRepMesh alongside the linear deflection
+MESH_ANGULAR_DEFLECTION = 0.5
+
+# Maximum number of (shape_id, deflection) tessellations remembered per engine
+MESH_CACHE_SIZE = 64
+
+# Maximum number of shapes whose BRepCheck_Analyzer verdict is remembered per engine
+VALIDITY_CACHE_SIZE = 512
+
+# Maximum number of shapes whose bounding box is remembered per engine
+BBOX_CACHE_SIZE = 512
+
+# Maximum number of sketch element visualizations remembered per engine
+ELEMENT_VIZ_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=32)
+def _unit_polygon_vertices(sides: int) -> np.ndarray:
+    """Regular polygon vertices on the unit circle, first vertex on +X; read-only (sides, 2)"""
+    angles = np.arange(sides) * (2.0 * math.pi / sides)
+    vertices = np.column_stack((np.cos(angles), np.sin(angles)))
+    vertices.setflags(write=False)
+    return vertices
+
+
+@lru_cache(maxsize=8)
+def _unit_circle_samples(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """cos and sin of segments + 1 evenly spaced angles over [0, 2*pi]; read-only"""
+    angles = np.linspace(0.0, 2.0 * math.pi, segments + 1)
+    cos_t = np.cos(angles)
+    sin_t = np.sin(angles)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
+
+
+def _polygon_vertices(center_x: float, center_y: float, radius: float, sides: int) -> List[List[float]]:
+    """Vertices of a regular polygon as [x, y] pairs, scaled and moved from the unit template"""
+    return (_unit_polygon_vertices(sides) * radius + (center_x, center_y)).tolist()
+
+
+def _copy_visualization_data(viz_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Independent copy of an element visualization dict
+    
+    Its list and dict values (points_3d, parameters_2d, child_ids) hold only
+    numbers and strings, so copying them one level down shares nothing mutable.
+    """
+    return {key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in viz_data.items()}
+
 
 class SketchElementType(Enum):
     """Sketch element types - matching C++ version"""
@@ -45,7 +110,7 @@ class SketchElementType(Enum):
     POLYGON = "polygon"
 
 
-@dataclass
+@dataclass(slots=True)
 class SketchElement:
     """
     Sketch element data structure - matching C++ SketchElement
@@ -73,7 +138,7 @@ class SketchElement:
             self.child_ids = []
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Vector3d:
     """3D vector structure matching the C++ version"""
     x: float = 0.0
@@ -90,7 +155,17 @@ class Vector3d:
         return Vector3d(self.x * scalar, self.y * scalar, self.z * scalar)
     
     def magnitude(self) -> float:
-        return (self.x**2 + self.y**2 + self.z**2)**0.5
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+    
+    @classmethod
+    def from_array(cls, a: np.ndarray) -> 'Vector3d':
+        """Create from a length-3 array"""
+        x, y, z = a.tolist()
+        return cls(x, y, z)
+    
+    def to_array(self) -> np.ndarray:
+        """Convert to a float64 array for batch arithmetic"""
+        return np.array((self.x, self.y, self.z), dtype=np.float64)
     
     def to_gp_pnt(self) -> gp_Pnt:
         """Convert to OpenCascade point"""
@@ -101,19 +176,113 @@ class Vector3d:
         return gp_Vec(self.x, self.y, self.z)
 
 
-@dataclass
+# Shared origin for default arguments; Vector3d is frozen, so sharing is safe
+_ZERO_VEC3 = Vector3d(0.0, 0.0, 0.0)
+
+
+@dataclass(slots=True)
 class MeshData:
-    """Mesh data structure matching the C++ version"""
-    vertices: List[float]
-    faces: List[int]
-    normals: List[float]
-    vertex_count: int = 0
-    face_count: int = 0
+    """
+    Mesh data structure matching the C++ version
+    
+    Stored as typed arrays: vertices and normals are float32 (N, 3),
+    faces are uint32 (F, 3) vertex indices. Lists are accepted and converted.
+    """
+    vertices: np.ndarray
+    faces: np.ndarray
+    normals: np.ndarray
     tessellation_quality: float = 0.1
     
     def __post_init__(self):
-        self.vertex_count = len(self.vertices) // 3
-        self.face_count = len(self.faces) // 3
+        self.vertices = np.asarray(self.vertices, dtype=np.float32).reshape(-1, 3)
+        self.faces = np.asarray(self.faces, dtype=np.uint32).reshape(-1, 3)
+        self.normals = np.asarray(self.normals, dtype=np.float32).reshape(-1, 3)
+    
+    @property
+    def vertex_count(self) -> int:
+        return self.vertices.shape[0]
+    
+    @property
+    def face_count(self) -> int:
+        return self.faces.shape[0]
+    
+    def to_dict(self, include_geometry: bool = True) -> Dict[str, Any]:
+        """
+        Flat-list form used in API responses
+        
+        Args:
+            include_geometry: When False only the metadata counts are returned,
+                skipping list conversion of the vertex/face/normal arrays
+        """
+        metadata = {
+            "vertex_count": self.vertex_count,
+            "face_count": self.face_count,
+            "tessellation_quality": self.tessellation_quality
+        }
+        if not include_geometry:
+            return {"metadata": metadata}
+        # Metadata first so streaming readers can stop before the arrays
+        return {
+            "metadata": metadata,
+            "vertices": self.vertices.ravel().tolist(),
+            "faces": self.faces.ravel().tolist(),
+            "normals": self.normals.ravel().tolist()
+        }
+    
+    def to_compact(self, dtype: str = 'float32') -> Dict[str, Any]:
+        """
+        Compact typed-array form for bandwidth-bound transport
+        
+        Args:
+            dtype: Vertex encoding - 'float32', 'float16', or 'int16'. 'int16'
+                quantizes positions onto the mesh bounding box as uint16
+                (v = bounds_min + q / 65535 * (bounds_max - bounds_min)) and
+                oct-encodes normals into two int8 values each.
+        
+        Returns:
+            Dictionary of NumPy arrays plus the metadata needed to decode them.
+            Faces are uint16 when every index fits, uint32 otherwise.
+        """
+        if dtype not in ('float32', 'float16', 'int16'):
+            raise ValueError(f"Unsupported compact dtype: {dtype}")
+        
+        face_dtype = np.uint16 if self.vertex_count <= 0xFFFF else np.uint32
+        compact = {
+            "encoding": dtype,
+            "faces": self.faces.astype(face_dtype),
+            "metadata": {
+                "vertex_count": self.vertex_count,
+                "face_count": self.face_count,
+                "tessellation_quality": self.tessellation_quality
+            }
+        }
+        
+        if dtype != 'int16':
+            compact["vertices"] = self.vertices.astype(dtype)
+            compact["normals"] = self.normals.astype(dtype)
+            return compact
+        
+        # Quantize positions onto the bounding box; flat axes map to 0
+        bounds_min = self.vertices.min(axis=0) if self.vertex_count else np.zeros(3, dtype=np.float32)
+        bounds_max = self.vertices.max(axis=0) if self.vertex_count else np.zeros(3, dtype=np.float32)
+        extent = np.where(bounds_max > bounds_min, bounds_max - bounds_min, 1.0)
+        compact["vertices"] = np.rint((self.vertices - bounds_min) / extent * 65535.0).astype(np.uint16)
+        compact["bounds_min"] = bounds_min.tolist()
+        compact["bounds_max"] = bounds_max.tolist()
+        
+        # Octahedral normal encoding: project onto |x|+|y|+|z| = 1, fold the lower hemisphere
+        normals = self.normals.astype(np.float64)
+        l1 = np.abs(normals).sum(axis=1, keepdims=True)
+        normals = normals / np.where(l1 > 0.0, l1, 1.0)
+        x, y, z = normals[:, 0], normals[:, 1], normals[:, 2]
+        sign_x = np.where(x >= 0.0, 1.0, -1.0)
+        sign_y = np.where(y >= 0.0, 1.0, -1.0)
+        octa = np.stack([
+            np.where(z < 0.0, (1.0 - np.abs(y)) * sign_x, x),
+            np.where(z < 0.0, (1.0 - np.abs(x)) * sign_y, y)
+        ], axis=1)
+        compact["normals"] = np.rint(np.clip(octa, -1.0, 1.0) * 127.0).astype(np.int8)
+        return compact
 
 
 class Sketch:
@@ -121,15 +290,31 @@ class Sketch:
     Sketch class for sketch-based modeling
     """
     
+    __slots__ = ('sketch_id', 'plane_id', 'sketch_plane', 'elements', 'constraints', 'is_closed',
+                 '_elements_by_id', '_id_counter', '_viz_cache')
+    
     def __init__(self, sketch_id: str, plane_id: str, sketch_plane: 'SketchPlane'):
         self.sketch_id = sketch_id
         self.plane_id = plane_id
         self.sketch_plane = sketch_plane
         self.elements: List[SketchElement] = []  # List of sketch elements
+        self._elements_by_id: Dict[str, SketchElement] = {}  # Index over elements by ID
+        self._id_counter = count(1)  # Per-sketch suffix for generated element IDs
         self.constraints: List[Dict[str, Any]] = []  # List of constraints
         self.is_closed = False
+        
+        # The plane is fixed for the sketch's lifetime, so its frame is snapshotted once
+        plane_viz = sketch_plane.get_visualization_data()
+        self._viz_cache = {
+            "sketch_id": sketch_id,
+            "plane_id": plane_id,
+            "origin": plane_viz["origin"],          # Array format
+            "u_axis": plane_viz["u_axis"],          # Local X axis
+            "v_axis": plane_viz["v_axis"],          # Local Y axis
+            "normal": plane_viz["normal"]           # Array format
+        }
 
-        print(f"✅ Created sketch: {sketch_id} on plane: {plane_id}")
+        logger.debug("Created sketch: %s on plane: %s", sketch_id, plane_id)
     
     def get_sketch_id(self) -> str:
         """Get sketch ID"""
@@ -147,17 +332,17 @@ class Sketch:
         """Add element to sketch"""
         try:
             self.elements.append(element)
-            print(f"✅ Added element to sketch {self.sketch_id}: {len(self.elements)} elements")
+            self._elements_by_id[element.id] = element
             return True
         except Exception as e:
-            print(f"❌ Error adding element to sketch: {e}")
+            logger.warning("Error adding element to sketch: %s", e)
             return False
     
     def add_line(self, start_point: gp_Pnt2d, end_point: gp_Pnt2d) -> str:
         """Add line to sketch - matching C++ version"""
         try:
             # Generate unique element ID
-            element_id = f"line_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            element_id = f"line_{next(self._id_counter)}"
             
             # Create line element
             line_element = SketchElement(
@@ -169,21 +354,22 @@ class Sketch:
             
             # Add to sketch
             if self.add_element(line_element):
-                print(f"✅ Added line {element_id}: ({start_point.X():.2f},{start_point.Y():.2f}) to ({end_point.X():.2f},{end_point.Y():.2f})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added line %s: (%.2f,%.2f) to (%.2f,%.2f)", element_id, start_point.X(), start_point.Y(), end_point.X(), end_point.Y())
                 return element_id
             else:
-                print(f"❌ Failed to add line element to sketch")
+                logger.warning("Failed to add line element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding line to sketch: {e}")
+            logger.warning("Error adding line to sketch: %s", e)
             return ""
     
     def add_circle(self, center_point: gp_Pnt2d, radius: float) -> str:
         """Add circle to sketch - matching C++ version"""
         try:
             # Generate unique element ID
-            element_id = f"circle_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            element_id = f"circle_{next(self._id_counter)}"
             
             # Create circle element
             circle_element = SketchElement(
@@ -195,21 +381,22 @@ class Sketch:
             
             # Add to sketch
             if self.add_element(circle_element):
-                print(f"✅ Added circle {element_id}: center({center_point.X():.2f},{center_point.Y():.2f}) radius={radius:.2f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added circle %s: center(%.2f,%.2f) radius=%.2f", element_id, center_point.X(), center_point.Y(), radius)
                 return element_id
             else:
-                print(f"❌ Failed to add circle element to sketch")
+                logger.warning("Failed to add circle element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding circle to sketch: {e}")
+            logger.warning("Error adding circle to sketch: %s", e)
             return ""
     
     def add_rectangle(self, corner_point: gp_Pnt2d, width: float, height: float) -> str:
         """Add rectangle to sketch - automatically decomposed into individual line elements"""
         try:
             # Generate unique element ID for the parent rectangle
-            element_id = f"rectangle_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            element_id = f"rectangle_{next(self._id_counter)}"
             
             # Calculate the four corner points
             p1 = corner_point  # Bottom-left
@@ -238,9 +425,8 @@ class Sketch:
                 
                 if self.add_element(line_element):
                     line_ids.append(line_id)
-                    print(f"✅ Added rectangle edge {line_id}: ({start_pt.X():.2f},{start_pt.Y():.2f}) to ({end_pt.X():.2f},{end_pt.Y():.2f})")
                 else:
-                    print(f"❌ Failed to add rectangle edge {line_id}")
+                    logger.warning("Failed to add rectangle edge %s", line_id)
             
             # Create parent rectangle element that references the individual lines
             rectangle_element = SketchElement(
@@ -255,27 +441,28 @@ class Sketch:
             
             # Add parent rectangle to sketch
             if self.add_element(rectangle_element):
-                print(f"✅ Added rectangle {element_id}: corner({corner_point.X():.2f},{corner_point.Y():.2f}) size={width:.2f}x{height:.2f} with {len(line_ids)} child lines")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added rectangle %s: corner(%.2f,%.2f) size=%.2fx%.2f with %s child lines", element_id, corner_point.X(), corner_point.Y(), width, height, len(line_ids))
                 return element_id
             else:
-                print(f"❌ Failed to add rectangle element to sketch")
+                logger.warning("Failed to add rectangle element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding rectangle to sketch: {e}")
+            logger.warning("Error adding rectangle to sketch: %s", e)
             return ""
     
     def add_arc_three_points(self, start_point: gp_Pnt2d, mid_point: gp_Pnt2d, end_point: gp_Pnt2d) -> str:
         """Add arc to sketch using three points (start, middle, end) - matching C++ version"""
         try:
             # Generate unique element ID
-            element_id = f"arc_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            element_id = f"arc_{next(self._id_counter)}"
             
             # Calculate center and radius from three points
             center, radius = self._calculate_arc_center_radius(start_point, mid_point, end_point)
             
             if center is None or radius <= 0:
-                print(f"❌ Invalid arc points - cannot calculate center and radius")
+                logger.warning("Invalid arc points - cannot calculate center and radius")
                 return ""
             
             # Calculate start and end angles
@@ -294,27 +481,101 @@ class Sketch:
             
             # Add to sketch
             if self.add_element(arc_element):
-                print(f"✅ Added arc {element_id}: center({center.X():.2f},{center.Y():.2f}) radius={radius:.2f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added arc %s: center(%.2f,%.2f) radius=%.2f", element_id, center.X(), center.Y(), radius)
                 return element_id
             else:
-                print(f"❌ Failed to add arc element to sketch")
+                logger.warning("Failed to add arc element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding arc to sketch: {e}")
+            logger.warning("Error adding arc to sketch: %s", e)
             return ""
     
+    def add_arcs_three_points_batch(self, points: np.ndarray) -> List[str]:
+        """
+        Add many three-point arcs at once
+        
+        Args:
+            points: (N, 3, 2) array of (start, mid, end) points per arc
+            
+        Returns:
+            List of new element IDs in input order; empty string for arcs whose
+            points are collinear or that could not be added
+        """
+        try:
+            points = np.asarray(points, dtype=np.float64).reshape(-1, 3, 2)
+            center_x, center_y, radii, valid = self._calc_arc_centers_batch(points[:, 0], points[:, 1], points[:, 2])
+            
+            # Start/end angles for every arc in one arctan2 call each
+            start_angles = np.arctan2(points[:, 0, 1] - center_y, points[:, 0, 0] - center_x)
+            end_angles = np.arctan2(points[:, 2, 1] - center_y, points[:, 2, 0] - center_x)
+            
+            element_ids = []
+            rows = zip(points.tolist(), center_x.tolist(), center_y.tolist(), radii.tolist(),
+                       start_angles.tolist(), end_angles.tolist(), valid.tolist())
+            for (start, _, end), ux, uy, radius, start_angle, end_angle, is_valid in rows:
+                if not is_valid:
+                    logger.warning("Invalid arc points - cannot calculate center and radius")
+                    element_ids.append("")
+                    continue
+                
+                element_id = f"arc_{next(self._id_counter)}"
+                arc_element = SketchElement(
+                    id=element_id,
+                    element_type=SketchElementType.ARC,
+                    start_point=gp_Pnt2d(*start),
+                    end_point=gp_Pnt2d(*end),
+                    center_point=gp_Pnt2d(ux, uy),
+                    parameters=[radius, start_angle, end_angle]  # Store radius and angles
+                )
+                element_ids.append(element_id if self.add_element(arc_element) else "")
+            
+            logger.debug("Added %s of %s arcs to sketch %s", sum(1 for element_id in element_ids if element_id), len(element_ids), self.sketch_id)
+            return element_ids
+            
+        except Exception as e:
+            logger.warning("Error adding arcs to sketch: %s", e)
+            return []
+    
+    @staticmethod
+    def _calc_arc_centers_batch(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized circumcenters for (N, 2) point arrays
+        
+        Returns:
+            (center_x, center_y, radius, valid); rows that are collinear have valid=False
+        """
+        x1, y1 = p1[:, 0], p1[:, 1]
+        x2, y2 = p2[:, 0], p2[:, 1]
+        x3, y3 = p3[:, 0], p3[:, 1]
+        
+        # Same collinearity and division guards as _calculate_arc_center_radius
+        area = 0.5 * np.abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
+        d = 2 * (x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
+        valid = (area >= 1e-10) & (np.abs(d) >= 1e-10)
+        safe_d = np.where(valid, d, 1.0)
+        
+        s1 = x1 * x1 + y1 * y1
+        s2 = x2 * x2 + y2 * y2
+        s3 = x3 * x3 + y3 * y3
+        ux = (s1 * (y2 - y3) + s2 * (y3 - y1) + s3 * (y1 - y2)) / safe_d
+        uy = (s1 * (x3 - x2) + s2 * (x1 - x3) + s3 * (x2 - x1)) / safe_d
+        radius = np.hypot(ux - x1, uy - y1)
+        
+        return ux, uy, radius, valid
+    
     def add_arc_endpoints_radius(self, start_point: gp_Pnt2d, end_point: gp_Pnt2d, radius: float, large_arc: bool = False) -> str:
         """Add arc to sketch using two endpoints and radius"""
         try:
             # Generate unique element ID
-            element_id = f"arc_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            element_id = f"arc_{next(self._id_counter)}"
             
             # Calculate center from endpoints and radius
             center = self._calculate_arc_center_from_endpoints(start_point, end_point, radius, large_arc)
             
             if center is None:
-                print(f"❌ Invalid arc parameters - cannot calculate center")
+                logger.warning("Invalid arc parameters - cannot calculate center")
                 return ""
             
             # Calculate start and end angles
@@ -333,34 +594,29 @@ class Sketch:
             
             # Add to sketch
             if self.add_element(arc_element):
-                print(f"✅ Added arc {element_id}: center({center.X():.2f},{center.Y():.2f}) radius={radius:.2f}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added arc %s: center(%.2f,%.2f) radius=%.2f", element_id, center.X(), center.Y(), radius)
                 return element_id
             else:
-                print(f"❌ Failed to add arc element to sketch")
+                logger.warning("Failed to add arc element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding arc to sketch: {e}")
+            logger.warning("Error adding arc to sketch: %s", e)
             return ""
     
     def add_polygon(self, center_point: gp_Pnt2d, sides: int, radius: float) -> str:
         """Add regular polygon to sketch - automatically decomposed into individual line elements"""
         try:
             if sides < 3:
-                print(f"❌ Polygon must have at least 3 sides, got {sides}")
+                logger.warning("Polygon must have at least 3 sides, got %s", sides)
                 return ""
             
             # Generate unique element ID for the parent polygon
-            element_id = f"polygon_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            element_id = f"polygon_{next(self._id_counter)}"
             
             # Calculate polygon vertices
-            vertices = []
-            angle_step = 2 * math.pi / sides
-            for i in range(sides):
-                angle = i * angle_step
-                x = center_point.X() + radius * math.cos(angle)
-                y = center_point.Y() + radius * math.sin(angle)
-                vertices.append(gp_Pnt2d(x, y))
+            vertices = [gp_Pnt2d(x, y) for x, y in _polygon_vertices(center_point.X(), center_point.Y(), radius, sides)]
             
             # Create individual line elements for each edge
             line_ids = []
@@ -379,9 +635,8 @@ class Sketch:
                 
                 if self.add_element(line_element):
                     line_ids.append(line_id)
-                    print(f"✅ Added polygon edge {line_id}: ({start_pt.X():.2f},{start_pt.Y():.2f}) to ({end_pt.X():.2f},{end_pt.Y():.2f})")
                 else:
-                    print(f"❌ Failed to add polygon edge {line_id}")
+                    logger.warning("Failed to add polygon edge %s", line_id)
             
             # Create parent polygon element that references the individual lines
             polygon_element = SketchElement(
@@ -396,14 +651,15 @@ class Sketch:
             
             # Add parent polygon to sketch
             if self.add_element(polygon_element):
-                print(f"✅ Added polygon {element_id}: center({center_point.X():.2f},{center_point.Y():.2f}) {sides} sides, radius={radius:.2f} with {len(line_ids)} child lines")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added polygon %s: center(%.2f,%.2f) %s sides, radius=%.2f with %s child lines", element_id, center_point.X(), center_point.Y(), sides, radius, len(line_ids))
                 return element_id
             else:
-                print(f"❌ Failed to add polygon element to sketch")
+                logger.warning("Failed to add polygon element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding polygon to sketch: {e}")
+            logger.warning("Error adding polygon to sketch: %s", e)
             return ""
     
     def _calculate_arc_center_radius(self, p1: gp_Pnt2d, p2: gp_Pnt2d, p3: gp_Pnt2d) -> Tuple[Optional[gp_Pnt2d], float]:
@@ -414,26 +670,29 @@ class Sketch:
             x2, y2 = p2.X(), p2.Y()
             x3, y3 = p3.X(), p3.Y()
             
-            # Check if points are collinear
-            area = 0.5 * abs((x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1))
-            if area < 1e-10:  # Points are collinear
-                return None, 0.0
+            dy23 = y2 - y3
+            dy31 = y3 - y1
+            dy12 = y1 - y2
             
-            # Calculate center using circumcenter formula
-            d = 2 * (x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2))
-            if abs(d) < 1e-10:  # Avoid division by zero
+            # d is four times the triangle area, so this also rejects collinear points
+            d = 2 * (x1 * dy23 + x2 * dy31 + x3 * dy12)
+            if abs(d) < 4e-10:
                 return None, 0.0
             
-            ux = ((x1*x1 + y1*y1) * (y2 - y3) + (x2*x2 + y2*y2) * (y3 - y1) + (x3*x3 + y3*y3) * (y1 - y2)) / d
-            uy = ((x1*x1 + y1*y1) * (x3 - x2) + (x2*x2 + y2*y2) * (x1 - x3) + (x3*x3 + y3*y3) * (x2 - x1)) / d
+            # Calculate center using circumcenter formula
+            s1 = x1*x1 + y1*y1
+            s2 = x2*x2 + y2*y2
+            s3 = x3*x3 + y3*y3
+            ux = (s1 * dy23 + s2 * dy31 + s3 * dy12) / d
+            uy = (s1 * (x3 - x2) + s2 * (x1 - x3) + s3 * (x2 - x1)) / d
             
             center = gp_Pnt2d(ux, uy)
-            radius = math.sqrt((ux - x1)**2 + (uy - y1)**2)
+            radius = math.hypot(ux - x1, uy - y1)
             
             return center, radius
             
         except Exception as e:
-            print(f"❌ Error calculating arc center: {e}")
+            logger.warning("Error calculating arc center: %s", e)
             return None, 0.0
     
     def _calculate_arc_center_from_endpoints(self, start: gp_Pnt2d, end: gp_Pnt2d, radius: float, large_arc: bool) -> Optional[gp_Pnt2d]:
@@ -442,12 +701,15 @@ class Sketch:
             x1, y1 = start.X(), start.Y()
             x2, y2 = end.X(), end.Y()
             
+            dx = x2 - x1
+            dy = y2 - y1
+            
             # Distance between endpoints
-            d = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+            d = math.hypot(dx, dy)
             
             # Check if radius is large enough
             if d > 2 * radius:
-                print(f"❌ Radius {radius} too small for distance {d}")
+                logger.warning("Radius %s too small for distance %s", radius, d)
                 return None
             
             # Midpoint between endpoints
@@ -458,8 +720,8 @@ class Sketch:
             h = math.sqrt(radius**2 - (d/2)**2)
             
             # Unit vector perpendicular to the line between endpoints
-            ux = -(y2 - y1) / d
-            uy = (x2 - x1) / d
+            ux = -dy / d
+            uy = dx / d
             
             # Two possible centers
             if large_arc:
@@ -472,18 +734,19 @@ class Sketch:
             return gp_Pnt2d(cx, cy)
             
         except Exception as e:
-            print(f"❌ Error calculating arc center from endpoints: {e}")
+            logger.warning("Error calculating arc center from endpoints: %s", e)
             return None
     
     def get_element_by_id(self, element_id: str) -> Optional[SketchElement]:
         """Get sketch element by ID"""
-        for element in self.elements:
-            if element.id == element_id:
-                return element
-        return None
+        return self._elements_by_id.get(element_id)
+    
+    def get_elements(self) -> Sequence[SketchElement]:
+        """Get all sketch elements as a read-only view; use copy_elements() for a list to modify"""
+        return self.elements
     
-    def get_elements(self) -> List[SketchElement]:
-        """Get all sketch elements"""
+    def copy_elements(self) -> List[SketchElement]:
+        """Get a shallow copy of the sketch elements"""
         return self.elements.copy()
 
     def remove_element(self, element_id: str) -> bool:
@@ -497,28 +760,30 @@ class Sketch:
         """
         element = self.get_element_by_id(element_id)
         if not element:
-            print(f"❌ Element {element_id} not found in sketch {self.sketch_id}")
+            logger.warning("Element %s not found in sketch %s", element_id, self.sketch_id)
             return False
 
-        elements_to_remove = [element_id]
+        elements_to_remove = {element_id}
 
         # If this is a composite parent, collect all child IDs
         if element.is_composite_parent and element.child_ids:
-            elements_to_remove.extend(element.child_ids)
-            print(f"🗑️ Removing composite element {element_id} with {len(element.child_ids)} children")
+            elements_to_remove.update(element.child_ids)
+            logger.debug("Removing composite element %s with %s children", element_id, len(element.child_ids))
 
         # Remove all collected elements
         original_count = len(self.elements)
         self.elements = [e for e in self.elements if e.id not in elements_to_remove]
+        for removed_id in elements_to_remove:
+            self._elements_by_id.pop(removed_id, None)
         removed_count = original_count - len(self.elements)
 
-        print(f"✅ Removed {removed_count} element(s) from sketch {self.sketch_id}")
+        logger.debug("Removed %s element(s) from sketch %s", removed_count, self.sketch_id)
         return removed_count > 0
 
     def add_constraint(self, constraint: Dict[str, Any]) -> bool:
         """Add constraint to sketch."""
         self.constraints.append(constraint)
-        print(f"✅ Added constraint to sketch {self.sketch_id}: {constraint['type']}")
+        logger.debug("Added constraint to sketch %s: %s", self.sketch_id, constraint['type'])
         return True
 
     def remove_constraint(self, constraint_id: str) -> bool:
@@ -526,7 +791,7 @@ class Sketch:
         for i, c in enumerate(self.constraints):
             if c.get('id') == constraint_id:
                 self.constraints.pop(i)
-                print(f"✅ Removed constraint {constraint_id} from sketch {self.sketch_id}")
+                logger.debug("Removed constraint %s from sketch %s", constraint_id, self.sketch_id)
                 return True
         return False
 
@@ -556,70 +821,37 @@ class Sketch:
 
     def get_visualization_data(self) -> Dict[str, Any]:
         """Get visualization data for the sketch - matches SketchVisualizationData interface"""
-        # Get coordinate system from the associated plane
-        origin = self.sketch_plane.get_origin()
-        normal = self.sketch_plane.get_normal()
-        
-        # Get local axes from plane's coordinate system
-        if self.sketch_plane.coordinate_system:
-            x_direction = self.sketch_plane.coordinate_system.XDirection()
-            y_direction = self.sketch_plane.coordinate_system.YDirection()
-            u_axis = [x_direction.X(), x_direction.Y(), x_direction.Z()]
-            v_axis = [y_direction.X(), y_direction.Y(), y_direction.Z()]
-        else:
-            # Fallback axes based on plane type
-            plane_type = self.sketch_plane.get_plane_type()
-            if plane_type == "XY":
-                u_axis = [1.0, 0.0, 0.0]  # X axis
-                v_axis = [0.0, 1.0, 0.0]  # Y axis
-            elif plane_type == "XZ":
-                u_axis = [1.0, 0.0, 0.0]  # X axis
-                v_axis = [0.0, 0.0, 1.0]  # Z axis
-            elif plane_type == "YZ":
-                u_axis = [0.0, 1.0, 0.0]  # Y axis
-                v_axis = [0.0, 0.0, 1.0]  # Z axis
-            else:
-                u_axis = [1.0, 0.0, 0.0]
-                v_axis = [0.0, 1.0, 0.0]
-        
-        return {
-            "sketch_id": self.sketch_id,
-            "plane_id": self.plane_id,
-            "origin": [origin.x, origin.y, origin.z],          # Array format
-            "u_axis": u_axis,                                   # Local X axis
-            "v_axis": v_axis,                                   # Local Y axis
-            "normal": [normal.x, normal.y, normal.z]           # Array format
-        }
+        return dict(self._viz_cache)
 
     def add_fillet(self, line1_id: str, line2_id: str, radius: float) -> str:
         """Add fillet between two lines - modifies existing lines and creates arc"""
         try:
-            print(f"🔵 Adding fillet between lines {line1_id} and {line2_id} with radius {radius}")
+            logger.debug("Adding fillet between lines %s and %s with radius %s", line1_id, line2_id, radius)
             
             # Find the two line elements
             line1 = self.get_element_by_id(line1_id)
             line2 = self.get_element_by_id(line2_id)
             
             if not line1 or line1.element_type != SketchElementType.LINE:
-                print(f"❌ Line {line1_id} not found or not a line")
+                logger.warning("Line %s not found or not a line", line1_id)
                 return ""
             
             if not line2 or line2.element_type != SketchElementType.LINE:
-                print(f"❌ Line {line2_id} not found or not a line")
+                logger.warning("Line %s not found or not a line", line2_id)
                 return ""
             
             # Calculate fillet geometry
             fillet_result = self._calculate_fillet_geometry(line1, line2, radius)
             
             if not fillet_result:
-                print(f"❌ Failed to calculate fillet geometry")
+                logger.warning("Failed to calculate fillet geometry")
                 return ""
             
             # Unpack fillet calculation results
             new_line1_end, new_line2_start, arc_start, arc_end, arc_center = fillet_result
             
             # Generate unique fillet ID
-            fillet_id = f"fillet_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            fillet_id = f"fillet_{next(self._id_counter)}"
             
             # Create fillet arc element
             start_angle = math.atan2(arc_start.Y() - arc_center.Y(), arc_start.X() - arc_center.X())
@@ -660,11 +892,11 @@ class Sketch:
                 if dist1_to_start < dist1_to_end:
                     # Start point is closer to intersection, so trim the start
                     line1.start_point = new_line1_end  # new_line1_end is actually the tangent point
-                    print(f"🔧 Trimmed line1 start point to tangent point")
+                    logger.debug("Trimmed line1 start point to tangent point")
                 else:
                     # End point is closer to intersection, so trim the end
                     line1.end_point = new_line1_end
-                    print(f"🔧 Trimmed line1 end point to tangent point")
+                    logger.debug("Trimmed line1 end point to tangent point")
                 
                 # Line 2: determine which endpoint is closer to intersection and trim it
                 dist2_to_start = math.sqrt((int_x - l2_start.X())**2 + (int_y - l2_start.Y())**2)
@@ -673,53 +905,53 @@ class Sketch:
                 if dist2_to_start < dist2_to_end:
                     # Start point is closer to intersection, so trim the start
                     line2.start_point = new_line2_start
-                    print(f"🔧 Trimmed line2 start point to tangent point")
+                    logger.debug("Trimmed line2 start point to tangent point")
                 else:
                     # End point is closer to intersection, so trim the end  
                     line2.end_point = new_line2_start  # new_line2_start is actually the tangent point
-                    print(f"🔧 Trimmed line2 end point to tangent point")
+                    logger.debug("Trimmed line2 end point to tangent point")
             
             # Add fillet to sketch
             if self.add_element(fillet_element):
-                print(f"✅ Added fillet {fillet_id} between lines {line1_id} and {line2_id}")
+                logger.debug("Added fillet %s between lines %s and %s", fillet_id, line1_id, line2_id)
                 return fillet_id
             else:
-                print(f"❌ Failed to add fillet element to sketch")
+                logger.warning("Failed to add fillet element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding fillet to sketch: {e}")
+            logger.warning("Error adding fillet to sketch: %s", e)
             return ""
     
     def add_chamfer(self, line1_id: str, line2_id: str, distance: float) -> str:
         """Add chamfer between two lines - modifies existing lines and creates connecting line"""
         try:
-            print(f"🔸 Adding chamfer between lines {line1_id} and {line2_id} with distance {distance}")
+            logger.debug("Adding chamfer between lines %s and %s with distance %s", line1_id, line2_id, distance)
             
             # Find the two line elements
             line1 = self.get_element_by_id(line1_id)
             line2 = self.get_element_by_id(line2_id)
             
             if not line1 or line1.element_type != SketchElementType.LINE:
-                print(f"❌ Line {line1_id} not found or not a line")
+                logger.warning("Line %s not found or not a line", line1_id)
                 return ""
             
             if not line2 or line2.element_type != SketchElementType.LINE:
-                print(f"❌ Line {line2_id} not found or not a line")
+                logger.warning("Line %s not found or not a line", line2_id)
                 return ""
             
             # Calculate chamfer geometry
             chamfer_result = self._calculate_chamfer_geometry(line1, line2, distance)
             
             if not chamfer_result:
-                print(f"❌ Failed to calculate chamfer geometry")
+                logger.warning("Failed to calculate chamfer geometry")
                 return ""
             
             # Unpack chamfer calculation results
             new_line1_end, new_line2_start, chamfer_start, chamfer_end = chamfer_result
             
             # Generate unique chamfer ID
-            chamfer_id = f"chamfer_{len(self.elements) + 1}_{int(time.time() * 1000) % 10000}"
+            chamfer_id = f"chamfer_{next(self._id_counter)}"
             
             # Create chamfer line element
             chamfer_element = SketchElement(
@@ -736,14 +968,14 @@ class Sketch:
             
             # Add chamfer to sketch
             if self.add_element(chamfer_element):
-                print(f"✅ Added chamfer {chamfer_id} between lines {line1_id} and {line2_id}")
+                logger.debug("Added chamfer %s between lines %s and %s", chamfer_id, line1_id, line2_id)
                 return chamfer_id
             else:
-                print(f"❌ Failed to add chamfer element to sketch")
+                logger.warning("Failed to add chamfer element to sketch")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error adding chamfer to sketch: {e}")
+            logger.warning("Error adding chamfer to sketch: %s", e)
             return ""
     
     def _calculate_fillet_geometry(self, line1: SketchElement, line2: SketchElement, radius: float) -> Optional[Tuple[gp_Pnt2d, gp_Pnt2d, gp_Pnt2d, gp_Pnt2d, gp_Pnt2d]]:
@@ -771,7 +1003,7 @@ class Sketch:
             )
 
             if not intersection:
-                print("❌ Lines are parallel - cannot create fillet")
+                logger.warning("Lines are parallel - cannot create fillet")
                 return None
 
             int_x, int_y = intersection
@@ -862,12 +1094,12 @@ class Sketch:
             arc_end = gp_Pnt2d(t2_x, t2_y)
             arc_center = gp_Pnt2d(center_x, center_y)
 
-            print(f"✅ Fillet geometry: tangent1=({t1_x:.2f},{t1_y:.2f}), tangent2=({t2_x:.2f},{t2_y:.2f}), center=({center_x:.2f},{center_y:.2f})")
+            logger.debug("Fillet geometry: tangent1=(%.2f,%.2f), tangent2=(%.2f,%.2f), center=(%.2f,%.2f)", t1_x, t1_y, t2_x, t2_y, center_x, center_y)
 
             return (new_line1_end, new_line2_start, arc_start, arc_end, arc_center)
 
         except Exception as e:
-            print(f"❌ Error calculating fillet geometry: {e}")
+            logger.warning("Error calculating fillet geometry: %s", e)
             return None
     
     def _find_line_intersection(self, x1: float, y1: float, x2: float, y2: float, 
@@ -891,7 +1123,7 @@ class Sketch:
             return (int_x, int_y)
             
         except Exception as e:
-            print(f"❌ Error finding line intersection: {e}")
+            logger.warning("Error finding line intersection: %s", e)
             return None
     
     def _calculate_chamfer_geometry(self, line1: SketchElement, line2: SketchElement, distance: float) -> Optional[Tuple[gp_Pnt2d, gp_Pnt2d, gp_Pnt2d, gp_Pnt2d]]:
@@ -919,7 +1151,7 @@ class Sketch:
             )
 
             if not intersection:
-                print("❌ Lines are parallel - cannot create chamfer")
+                logger.warning("Lines are parallel - cannot create chamfer")
                 return None
 
             int_x, int_y = intersection
@@ -975,69 +1207,69 @@ class Sketch:
             chamfer_start = gp_Pnt2d(c1_x, c1_y)
             chamfer_end = gp_Pnt2d(c2_x, c2_y)
 
-            print(f"✅ Chamfer geometry: point1=({c1_x:.2f},{c1_y:.2f}), point2=({c2_x:.2f},{c2_y:.2f})")
+            logger.debug("Chamfer geometry: point1=(%.2f,%.2f), point2=(%.2f,%.2f)", c1_x, c1_y, c2_x, c2_y)
 
             return (new_line1_end, new_line2_start, chamfer_start, chamfer_end)
 
         except Exception as e:
-            print(f"❌ Error calculating chamfer geometry: {e}")
+            logger.warning("Error calculating chamfer geometry: %s", e)
             return None
     
     def trim_line_to_line(self, line_to_trim_id: str, cutting_line_id: str, keep_start: bool = True) -> bool:
         """Trim a line at its intersection with another line - simple implementation"""
         try:
-            print(f"✂️ Trimming line {line_to_trim_id} at intersection with line {cutting_line_id}")
+            logger.debug("Trimming line %s at intersection with line %s", line_to_trim_id, cutting_line_id)
             
             # Find the two line elements
             line_to_trim = self.get_element_by_id(line_to_trim_id)
             cutting_line = self.get_element_by_id(cutting_line_id)
             
             if not line_to_trim or line_to_trim.element_type != SketchElementType.LINE:
-                print(f"❌ Line to trim {line_to_trim_id} not found or not a line")
+                logger.warning("Line to trim %s not found or not a line", line_to_trim_id)
                 return False
             
             if not cutting_line or cutting_line.element_type != SketchElementType.LINE:
-                print(f"❌ Cutting line {cutting_line_id} not found or not a line")
+                logger.warning("Cutting line %s not found or not a line", cutting_line_id)
                 return False
             
             # Calculate intersection point
             intersection = self._calculate_line_line_intersection(line_to_trim, cutting_line)
             
             if not intersection:
-                print(f"❌ Lines do not intersect - cannot trim")
+                logger.warning("Lines do not intersect - cannot trim")
                 return False
             
             # Apply trim based on keep_start flag
             if keep_start:
                 # Keep start portion, trim end at intersection
                 line_to_trim.end_point = intersection
-                print(f"✅ Trimmed line {line_to_trim_id} - kept start portion")
+                logger.debug("Trimmed line %s - kept start portion", line_to_trim_id)
             else:
                 # Keep end portion, trim start at intersection
                 line_to_trim.start_point = intersection
-                print(f"✅ Trimmed line {line_to_trim_id} - kept end portion")
+                logger.debug("Trimmed line %s - kept end portion", line_to_trim_id)
             
             return True
             
         except Exception as e:
-            print(f"❌ Error trimming line: {e}")
+            logger.warning("Error trimming line: %s", e)
             return False
     
     def trim_line_to_geometry(self, line_to_trim_id: str, cutting_geometry_id: str, keep_start: bool = True) -> bool:
         """Trim a line at its intersection with complex geometry (rectangle, polygon, etc.)"""
         try:
-            print(f"✂️ Trimming line {line_to_trim_id} at intersection with geometry {cutting_geometry_id}")
+            logger.debug("Trimming line %s at intersection with geometry %s", line_to_trim_id, cutting_geometry_id)
             
             # Find the line to trim
             line_to_trim = self.get_element_by_id(line_to_trim_id)
             cutting_geometry = self.get_element_by_id(cutting_geometry_id)
             
             if not line_to_trim or line_to_trim.element_type != SketchElementType.LINE:
-                print(f"❌ Line to trim {line_to_trim_id} not found or not a line")
+                logger.warning("Line to trim %s not found or not a line", line_to_trim_id)
                 return False
             
             if not cutting_geometry:
-                print(f"❌ Cutting geometry {cutting_geometry_id} not found")
+                logger.warning("Cutting geometry %s not found", cutting_geometry_id)
                 return False
             
             # Find intersection points based on geometry type
@@ -1050,32 +1282,32 @@ class Sketch:
             elif cutting_geometry.element_type == SketchElementType.CIRCLE:
                 intersection_points = self._find_line_circle_intersections(line_to_trim, cutting_geometry)
             else:
-                print(f"❌ Unsupported cutting geometry type: {cutting_geometry.element_type}")
+                logger.warning("Unsupported cutting geometry type: %s", cutting_geometry.element_type)
                 return False
             
             if not intersection_points:
-                print(f"❌ No intersections found - cannot trim")
+                logger.warning("No intersections found - cannot trim")
                 return False
             
             # Determine which intersection point to use for trimming
             trim_point = self._select_trim_point(line_to_trim, intersection_points, keep_start)
             
             if not trim_point:
-                print(f"❌ Could not determine trim point")
+                logger.warning("Could not determine trim point")
                 return False
             
             # Apply trim
             if keep_start:
                 line_to_trim.end_point = trim_point
-                print(f"✅ Trimmed line {line_to_trim_id} - kept start portion")
+                logger.debug("Trimmed line %s - kept start portion", line_to_trim_id)
             else:
                 line_to_trim.start_point = trim_point
-                print(f"✅ Trimmed line {line_to_trim_id} - kept end portion")
+                logger.debug("Trimmed line %s - kept end portion", line_to_trim_id)
             
             return True
             
         except Exception as e:
-            print(f"❌ Error trimming line to geometry: {e}")
+            logger.warning("Error trimming line to geometry: %s", e)
             return False
     
     def _calculate_line_line_intersection(self, line1: SketchElement, line2: SketchElement) -> Optional[gp_Pnt2d]:
@@ -1099,7 +1331,7 @@ class Sketch:
             return None
             
         except Exception as e:
-            print(f"❌ Error calculating line-line intersection: {e}")
+            logger.warning("Error calculating line-line intersection: %s", e)
             return None
     
     def _find_line_rectangle_intersections(self, line: SketchElement, rectangle: SketchElement) -> List[gp_Pnt2d]:
@@ -1143,7 +1375,7 @@ class Sketch:
             return intersections
             
         except Exception as e:
-            print(f"❌ Error finding line-rectangle intersections: {e}")
+            logger.warning("Error finding line-rectangle intersections: %s", e)
             return []
     
     def _find_line_polygon_intersections(self, line: SketchElement, polygon: SketchElement) -> List[gp_Pnt2d]:
@@ -1160,12 +1392,7 @@ class Sketch:
             sides = int(polygon.parameters[1])
             
             # Generate polygon vertices
-            vertices = []
-            for i in range(sides):
-                angle = 2.0 * math.pi * i / sides
-                vertex_x = center.X() + radius * math.cos(angle)
-                vertex_y = center.Y() + radius * math.sin(angle)
-                vertices.append((vertex_x, vertex_y))
+            vertices = _polygon_vertices(center.X(), center.Y(), radius, sides)
             
             # Check intersection with each polygon edge
             for i in range(sides):
@@ -1188,7 +1415,7 @@ class Sketch:
             return intersections
             
         except Exception as e:
-            print(f"❌ Error finding line-polygon intersections: {e}")
+            logger.warning("Error finding line-polygon intersections: %s", e)
             return []
     
     def _find_line_circle_intersections(self, line: SketchElement, circle: SketchElement) -> List[gp_Pnt2d]:
@@ -1247,7 +1474,7 @@ class Sketch:
             return intersections
             
         except Exception as e:
-            print(f"❌ Error finding line-circle intersections: {e}")
+            logger.warning("Error finding line-circle intersections: %s", e)
             return []
     
     def _point_on_line_segment(self, point: Tuple[float, float], line_segment: Tuple[float, float, float, float]) -> bool:
@@ -1264,7 +1491,7 @@ class Sketch:
                     min_y - 1e-10 <= py <= max_y + 1e-10)
             
         except Exception as e:
-            print(f"❌ Error checking point on line segment: {e}")
+            logger.warning("Error checking point on line segment: %s", e)
             return False
     
     def _select_trim_point(self, line: SketchElement, intersection_points: List[gp_Pnt2d], keep_start: bool) -> Optional[gp_Pnt2d]:
@@ -1305,69 +1532,69 @@ class Sketch:
                 return closest_point
             
         except Exception as e:
-            print(f"❌ Error selecting trim point: {e}")
+            logger.warning("Error selecting trim point: %s", e)
             return None
     
     def extend_line_to_line(self, line_to_extend_id: str, target_line_id: str, extend_start: bool = False) -> bool:
         """Extend a line to reach intersection with another line"""
         try:
-            print(f"📏 Extending line {line_to_extend_id} to reach line {target_line_id}")
+            logger.debug("Extending line %s to reach line %s", line_to_extend_id, target_line_id)
             
             # Find the two line elements
             line_to_extend = self.get_element_by_id(line_to_extend_id)
             target_line = self.get_element_by_id(target_line_id)
             
             if not line_to_extend or line_to_extend.element_type != SketchElementType.LINE:
-                print(f"❌ Line to extend {line_to_extend_id} not found or not a line")
+                logger.warning("Line to extend %s not found or not a line", line_to_extend_id)
                 return False
             
             if not target_line or target_line.element_type != SketchElementType.LINE:
-                print(f"❌ Target line {target_line_id} not found or not a line")
+                logger.warning("Target line %s not found or not a line", target_line_id)
                 return False
             
             # Calculate intersection point (lines extended infinitely)
             intersection = self._calculate_line_line_intersection(line_to_extend, target_line)
             
             if not intersection:
-                print(f"❌ Lines are parallel - cannot extend")
+                logger.warning("Lines are parallel - cannot extend")
                 return False
             
             # Check if we need to extend (intersection should be beyond current line)
             if not self._point_beyond_line(intersection, line_to_extend, extend_start):
-                print(f"❌ Intersection point is not beyond the line - no extension needed")
+                logger.warning("Intersection point is not beyond the line - no extension needed")
                 return False
             
             # Apply extension
             if extend_start:
                 # Extend start of line to reach intersection
                 line_to_extend.start_point = intersection
-                print(f"✅ Extended start of line {line_to_extend_id}")
+                logger.debug("Extended start of line %s", line_to_extend_id)
             else:
                 # Extend end of line to reach intersection
                 line_to_extend.end_point = intersection
-                print(f"✅ Extended end of line {line_to_extend_id}")
+                logger.debug("Extended end of line %s", line_to_extend_id)
             
             return True
             
         except Exception as e:
-            print(f"❌ Error extending line: {e}")
+            logger.warning("Error extending line: %s", e)
             return False
     
     def extend_line_to_geometry(self, line_to_extend_id: str, target_geometry_id: str, extend_start: bool = False) -> bool:
         """Extend a line to reach intersection with complex geometry"""
         try:
-            print(f"📏 Extending line {line_to_extend_id} to reach geometry {target_geometry_id}")
+            logger.debug("Extending line %s to reach geometry %s", line_to_extend_id, target_geometry_id)
             
             # Find the line and target geometry
             line_to_extend = self.get_element_by_id(line_to_extend_id)
             target_geometry = self.get_element_by_id(target_geometry_id)
             
             if not line_to_extend or line_to_extend.element_type != SketchElementType.LINE:
-                print(f"❌ Line to extend {line_to_extend_id} not found or not a line")
+                logger.warning("Line to extend %s not found or not a line", line_to_extend_id)
                 return False
             
             if not target_geometry:
-                print(f"❌ Target geometry {target_geometry_id} not found")
+                logger.warning("Target geometry %s not found", target_geometry_id)
                 return False
             
             # Find intersection points with infinite line extension
@@ -1380,32 +1607,32 @@ class Sketch:
             elif target_geometry.element_type == SketchElementType.CIRCLE:
                 intersection_points = self._find_infinite_line_circle_intersections(line_to_extend, target_geometry)
             else:
-                print(f"❌ Unsupported target geometry type: {target_geometry.element_type}")
+                logger.warning("Unsupported target geometry type: %s", target_geometry.element_type)
                 return False
             
             if not intersection_points:
-                print(f"❌ No intersections found - cannot extend")
+                logger.warning("No intersections found - cannot extend")
                 return False
             
             # Select appropriate intersection point for extension
             extend_point = self._select_extend_point(line_to_extend, intersection_points, extend_start)
             
             if not extend_point:
-                print(f"❌ Could not determine extend point")
+                logger.warning("Could not determine extend point")
                 return False
             
             # Apply extension
             if extend_start:
                 line_to_extend.start_point = extend_point
-                print(f"✅ Extended start of line {line_to_extend_id}")
+                logger.debug("Extended start of line %s", line_to_extend_id)
             else:
                 line_to_extend.end_point = extend_point
-                print(f"✅ Extended end of line {line_to_extend_id}")
+                logger.debug("Extended end of line %s", line_to_extend_id)
             
             return True
             
         except Exception as e:
-            print(f"❌ Error extending line to geometry: {e}")
+            logger.warning("Error extending line to geometry: %s", e)
             return False
     
     def _point_beyond_line(self, point: gp_Pnt2d, line: SketchElement, check_start: bool) -> bool:
@@ -1438,7 +1665,7 @@ class Sketch:
                 return dot_product > 0
             
         except Exception as e:
-            print(f"❌ Error checking if point is beyond line: {e}")
+            logger.warning("Error checking if point is beyond line: %s", e)
             return False
     
     def _select_extend_point(self, line: SketchElement, intersection_points: List[gp_Pnt2d], extend_start: bool) -> Optional[gp_Pnt2d]:
@@ -1477,7 +1704,7 @@ class Sketch:
             return closest_point
             
         except Exception as e:
-            print(f"❌ Error selecting extend point: {e}")
+            logger.warning("Error selecting extend point: %s", e)
             return None
     
     def _find_infinite_line_rectangle_intersections(self, line: SketchElement, rectangle: SketchElement) -> List[gp_Pnt2d]:
@@ -1521,7 +1748,7 @@ class Sketch:
             return intersections
             
         except Exception as e:
-            print(f"❌ Error finding infinite line-rectangle intersections: {e}")
+            logger.warning("Error finding infinite line-rectangle intersections: %s", e)
             return []
     
     def _find_infinite_line_polygon_intersections(self, line: SketchElement, polygon: SketchElement) -> List[gp_Pnt2d]:
@@ -1531,7 +1758,7 @@ class Sketch:
             return self._find_line_polygon_intersections(line, polygon)
             
         except Exception as e:
-            print(f"❌ Error finding infinite line-polygon intersections: {e}")
+            logger.warning("Error finding infinite line-polygon intersections: %s", e)
             return []
     
     def _find_infinite_line_circle_intersections(self, line: SketchElement, circle: SketchElement) -> List[gp_Pnt2d]:
@@ -1589,7 +1816,7 @@ class Sketch:
             return intersections
             
         except Exception as e:
-            print(f"❌ Error finding infinite line-circle intersections: {e}")
+            logger.warning("Error finding infinite line-circle intersections: %s", e)
             return []
     
     def mirror_elements(self, element_ids: List[str], mirror_line_id: str, keep_original: bool = True) -> List[str]:
@@ -1605,57 +1832,31 @@ class Sketch:
             List of new mirrored element IDs
         """
         try:
-            print(f"🪞 Mirroring {len(element_ids)} elements across line {mirror_line_id}")
+            logger.debug("Mirroring %s elements across line %s", len(element_ids), mirror_line_id)
             
             # Find the mirror line
             mirror_line = self.get_element_by_id(mirror_line_id)
             if not mirror_line or mirror_line.element_type != SketchElementType.LINE:
-                print(f"❌ Mirror line {mirror_line_id} not found or not a line")
+                logger.warning("Mirror line %s not found or not a line", mirror_line_id)
                 return []
             
             if not mirror_line.start_point or not mirror_line.end_point:
-                print(f"❌ Mirror line {mirror_line_id} missing start or end point")
+                logger.warning("Mirror line %s missing start or end point", mirror_line_id)
                 return []
             
-            # Calculate mirror line equation: ax + by + c = 0
-            mirror_eq = self._calculate_line_equation(mirror_line)
-            if not mirror_eq:
-                print(f"❌ Could not calculate mirror line equation")
+            # Calculate the reflection across the mirror line
+            reflection = self._calculate_reflection_from_coordinates(
+                mirror_line.start_point.X(), mirror_line.start_point.Y(),
+                mirror_line.end_point.X(), mirror_line.end_point.Y()
+            )
+            if not reflection:
+                logger.warning("Could not calculate mirror line equation")
                 return []
             
-            mirrored_element_ids = []
-            
-            # Process each element to be mirrored
-            for element_id in element_ids:
-                element = self.get_element_by_id(element_id)
-                if not element:
-                    print(f"⚠️ Element {element_id} not found, skipping")
-                    continue
-                
-                # Create mirrored version of the element
-                mirrored_element = self._create_mirrored_element(element, mirror_eq)
-                
-                if mirrored_element:
-                    # Add mirrored element to sketch
-                    if self.add_element(mirrored_element):
-                        mirrored_element_ids.append(mirrored_element.id)
-                        print(f"✅ Mirrored {element.element_type.value} {element_id} -> {mirrored_element.id}")
-                    else:
-                        print(f"❌ Failed to add mirrored element for {element_id}")
-                else:
-                    print(f"❌ Failed to create mirrored element for {element_id}")
-            
-            # Remove original elements if requested
-            if not keep_original:
-                for element_id in element_ids:
-                    self.elements = [e for e in self.elements if e.id != element_id]
-                print(f"🗑️ Removed {len(element_ids)} original elements")
-            
-            print(f"✅ Mirror operation completed: {len(mirrored_element_ids)} elements created")
-            return mirrored_element_ids
+            return self.mirror_elements_by_reflection(element_ids, reflection, keep_original)
             
         except Exception as e:
-            print(f"❌ Error mirroring elements: {e}")
+            logger.warning("Error mirroring elements: %s", e)
             return []
     
     def mirror_elements_by_two_points(self, element_ids: List[str], point1: gp_Pnt2d, point2: gp_Pnt2d, keep_original: bool = True) -> List[str]:
@@ -1672,119 +1873,112 @@ class Sketch:
             List of new mirrored element IDs
         """
         try:
-            print(f"🪞 Mirroring {len(element_ids)} elements across line defined by two points")
+            logger.debug("Mirroring %s elements across line defined by two points", len(element_ids))
             
-            # Create temporary line equation from two points
-            mirror_eq = self._calculate_line_equation_from_points(point1, point2)
-            if not mirror_eq:
-                print(f"❌ Could not calculate mirror line equation from points")
+            reflection = self._calculate_reflection_from_coordinates(point1.X(), point1.Y(), point2.X(), point2.Y())
+            if not reflection:
+                logger.warning("Could not calculate mirror line equation from points")
                 return []
             
+            return self.mirror_elements_by_reflection(element_ids, reflection, keep_original)
+            
+        except Exception as e:
+            logger.warning("Error mirroring elements by two points: %s", e)
+            return []
+    
+    def mirror_elements_by_reflection(self, element_ids: List[str], reflection: Tuple[float, float, float, float], keep_original: bool = True) -> List[str]:
+        """
+        Mirror geometry elements using precomputed reflection coefficients
+        
+        Args:
+            element_ids: List of element IDs to mirror
+            reflection: (a, b, x0, y0) as returned by _calculate_reflection_from_coordinates
+            keep_original: If True, keep original elements; if False, replace with mirrored versions
+            
+        Returns:
+            List of new mirrored element IDs
+        """
+        try:
             mirrored_element_ids = []
             
             # Process each element to be mirrored
             for element_id in element_ids:
                 element = self.get_element_by_id(element_id)
                 if not element:
-                    print(f"⚠️ Element {element_id} not found, skipping")
+                    logger.warning("Element %s not found, skipping", element_id)
                     continue
                 
                 # Create mirrored version of the element
-                mirrored_element = self._create_mirrored_element(element, mirror_eq)
+                mirrored_element = self._create_mirrored_element(element, reflection)
                 
                 if mirrored_element:
                     # Add mirrored element to sketch
                     if self.add_element(mirrored_element):
                         mirrored_element_ids.append(mirrored_element.id)
-                        print(f"✅ Mirrored {element.element_type.value} {element_id} -> {mirrored_element.id}")
+                        logger.debug("Mirrored %s %s -> %s", element.element_type.value, element_id, mirrored_element.id)
                     else:
-                        print(f"❌ Failed to add mirrored element for {element_id}")
+                        logger.warning("Failed to add mirrored element for %s", element_id)
                 else:
-                    print(f"❌ Failed to create mirrored element for {element_id}")
+                    logger.warning("Failed to create mirrored element for %s", element_id)
             
             # Remove original elements if requested
             if not keep_original:
-                for element_id in element_ids:
-                    self.elements = [e for e in self.elements if e.id != element_id]
-                print(f"🗑️ Removed {len(element_ids)} original elements")
+                removed_ids = set(element_ids)
+                self.elements = [e for e in self.elements if e.id not in removed_ids]
+                for element_id in removed_ids:
+                    self._elements_by_id.pop(element_id, None)
+                logger.debug("Removed %s original elements", len(element_ids))
             
-            print(f"✅ Mirror operation completed: {len(mirrored_element_ids)} elements created")
+            logger.debug("Mirror operation completed: %s elements created", len(mirrored_element_ids))
             return mirrored_element_ids
             
         except Exception as e:
-            print(f"❌ Error mirroring elements by two points: {e}")
+            logger.warning("Error mirroring elements: %s", e)
             return []
     
-    def _calculate_line_equation(self, line: SketchElement) -> Optional[Tuple[float, float, float]]:
-        """Calculate line equation coefficients ax + by + c = 0 from line element"""
-        try:
-            if not line.start_point or not line.end_point:
-                return None
-            
-            x1, y1 = line.start_point.X(), line.start_point.Y()
-            x2, y2 = line.end_point.X(), line.end_point.Y()
-            
-            return self._calculate_line_equation_from_coordinates(x1, y1, x2, y2)
-            
-        except Exception as e:
-            print(f"❌ Error calculating line equation: {e}")
-            return None
-    
-    def _calculate_line_equation_from_points(self, point1: gp_Pnt2d, point2: gp_Pnt2d) -> Optional[Tuple[float, float, float]]:
-        """Calculate line equation coefficients ax + by + c = 0 from two points"""
-        try:
-            x1, y1 = point1.X(), point1.Y()
-            x2, y2 = point2.X(), point2.Y()
-            
-            return self._calculate_line_equation_from_coordinates(x1, y1, x2, y2)
-            
-        except Exception as e:
-            print(f"❌ Error calculating line equation from points: {e}")
-            return None
-    
-    def _calculate_line_equation_from_coordinates(self, x1: float, y1: float, x2: float, y2: float) -> Optional[Tuple[float, float, float]]:
-        """Calculate line equation coefficients ax + by + c = 0 from coordinates"""
-        try:
-            # For line through points (x1,y1) and (x2,y2):
-            # Direction vector: (dx, dy) = (x2-x1, y2-y1)
-            # Normal vector: (a, b) = (dy, -dx) = (y2-y1, x1-x2)
-            # Equation: a(x-x1) + b(y-y1) = 0
-            # Expanded: ax - ax1 + by - by1 = 0
-            # Standard form: ax + by + c = 0 where c = -ax1 - by1
-            
-            dx = x2 - x1
-            dy = y2 - y1
-            
-            # Check for degenerate line (same points)
-            if abs(dx) < 1e-10 and abs(dy) < 1e-10:
-                return None
-            
-            a = dy  # y2 - y1
-            b = -dx  # -(x2 - x1) = x1 - x2
-            c = -a * x1 - b * y1  # -ax1 - by1
-            
-            return (a, b, c)
-            
-        except Exception as e:
-            print(f"❌ Error calculating line equation from coordinates: {e}")
+    def _calculate_reflection_from_coordinates(self, x1: float, y1: float, x2: float, y2: float) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Calculate reflection coefficients for the line through (x1,y1) and (x2,y2)
+        
+        The reflection of (x, y) is:
+            x' = a(x - x1) + b(y - y1) + x1
+            y' = b(x - x1) - a(y - y1) + y1
+        with a = (dx² - dy²)/L² and b = 2·dx·dy/L².
+        """
+        dx = x2 - x1
+        dy = y2 - y1
+        
+        # Check for degenerate line (same points)
+        if abs(dx) < 1e-10 and abs(dy) < 1e-10:
             return None
+        
+        # Horizontal and vertical mirror lines need no division
+        if abs(dy) < 1e-12:
+            return (1.0, 0.0, x1, y1)
+        if abs(dx) < 1e-12:
+            return (-1.0, 0.0, x1, y1)
+        
+        length_sq = dx * dx + dy * dy
+        a = (dx * dx - dy * dy) / length_sq
+        b = 2 * dx * dy / length_sq
+        
+        return (a, b, x1, y1)
     
-    def _create_mirrored_element(self, element: SketchElement, mirror_eq: Tuple[float, float, float]) -> Optional[SketchElement]:
+    def _create_mirrored_element(self, element: SketchElement, reflection: Tuple[float, float, float, float]) -> Optional[SketchElement]:
         """Create a mirrored copy of an element across the mirror line"""
         try:
-            a, b, c = mirror_eq
             element_type = element.element_type
             
             # Generate unique ID for mirrored element
-            mirrored_id = f"mirror_{element.id}_{int(time.time() * 1000) % 10000}"
+            mirrored_id = f"mirror_{element.id}_{next(self._id_counter)}"
             
             if element_type == SketchElementType.LINE:
                 # Mirror both endpoints
                 if not element.start_point or not element.end_point:
                     return None
                 
-                mirrored_start = self._mirror_point(element.start_point, mirror_eq)
-                mirrored_end = self._mirror_point(element.end_point, mirror_eq)
+                mirrored_start = self._reflect_point(element.start_point, reflection)
+                mirrored_end = self._reflect_point(element.end_point, reflection)
                 
                 return SketchElement(
                     id=mirrored_id,
@@ -1798,7 +1992,7 @@ class Sketch:
                 if not element.center_point or not element.parameters:
                     return None
                 
-                mirrored_center = self._mirror_point(element.center_point, mirror_eq)
+                mirrored_center = self._reflect_point(element.center_point, reflection)
                 radius = element.parameters[0]
                 
                 return SketchElement(
@@ -1813,7 +2007,7 @@ class Sketch:
                 if not element.start_point or not element.parameters or len(element.parameters) < 2:
                     return None
                 
-                mirrored_corner = self._mirror_point(element.start_point, mirror_eq)
+                mirrored_corner = self._reflect_point(element.start_point, reflection)
                 width = element.parameters[0]
                 height = element.parameters[1]
                 
@@ -1830,9 +2024,9 @@ class Sketch:
                     not element.center_point or not element.parameters):
                     return None
                 
-                mirrored_start = self._mirror_point(element.start_point, mirror_eq)
-                mirrored_end = self._mirror_point(element.end_point, mirror_eq)
-                mirrored_center = self._mirror_point(element.center_point, mirror_eq)
+                mirrored_start = self._reflect_point(element.start_point, reflection)
+                mirrored_end = self._reflect_point(element.end_point, reflection)
+                mirrored_center = self._reflect_point(element.center_point, reflection)
                 
                 # For arc, we need to recalculate angles after mirroring
                 radius = element.parameters[0]
@@ -1857,7 +2051,7 @@ class Sketch:
                 if not element.center_point or not element.parameters:
                     return None
                 
-                mirrored_center = self._mirror_point(element.center_point, mirror_eq)
+                mirrored_center = self._reflect_point(element.center_point, reflection)
                 radius = element.parameters[0]
                 sides = element.parameters[1]
                 
@@ -1869,39 +2063,27 @@ class Sketch:
                 )
             
             else:
-                print(f"❌ Unsupported element type for mirroring: {element_type}")
+                logger.warning("Unsupported element type for mirroring: %s", element_type)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error creating mirrored element: {e}")
+            logger.warning("Error creating mirrored element: %s", e)
             return None
     
-    def _mirror_point(self, point: gp_Pnt2d, mirror_eq: Tuple[float, float, float]) -> gp_Pnt2d:
-        """Mirror a point across a line defined by ax + by + c = 0"""
-        try:
-            a, b, c = mirror_eq
-            x0, y0 = point.X(), point.Y()
-            
-            # Formula for reflecting point (x0,y0) across line ax + by + c = 0:
-            # x' = x0 - 2a(ax0 + by0 + c)/(a² + b²)
-            # y' = y0 - 2b(ax0 + by0 + c)/(a² + b²)
-            
-            denominator = a * a + b * b
-            if denominator < 1e-10:
-                # Degenerate line, return original point
-                return point
-            
-            numerator = a * x0 + b * y0 + c
-            factor = 2 * numerator / denominator
-            
-            x_mirrored = x0 - a * factor
-            y_mirrored = y0 - b * factor
-            
-            return gp_Pnt2d(x_mirrored, y_mirrored)
-            
-        except Exception as e:
-            print(f"❌ Error mirroring point: {e}")
-            return point
+    def _reflect_point(self, point: gp_Pnt2d, reflection: Tuple[float, float, float, float]) -> gp_Pnt2d:
+        """Mirror a point using coefficients from _calculate_reflection_from_coordinates"""
+        a, b, x0, y0 = reflection
+        
+        # Axis-aligned mirror line: the reflection is a single sign flip
+        if b == 0.0:
+            if a > 0:
+                return gp_Pnt2d(point.X(), 2 * y0 - point.Y())
+            return gp_Pnt2d(2 * x0 - point.X(), point.Y())
+        
+        px = point.X() - x0
+        py = point.Y() - y0
+        
+        return gp_Pnt2d(a * px + b * py + x0, b * px - a * py + y0)
 
     def offset_element(self, element_id: str, offset_distance: float) -> str:
         """
@@ -1915,12 +2097,12 @@ class Sketch:
             New offset element ID if successful, empty string if failed
         """
         try:
-            print(f"📐 Offsetting element {element_id} by distance {offset_distance}")
+            logger.debug("Offsetting element %s by distance %s", element_id, offset_distance)
             
             # Find the element
             element = self.get_element_by_id(element_id)
             if not element:
-                print(f"❌ Element {element_id} not found")
+                logger.warning("Element %s not found", element_id)
                 return ""
             
             # Create offset element based on type
@@ -1937,23 +2119,23 @@ class Sketch:
             elif element.element_type == SketchElementType.POLYGON:
                 offset_element = self._offset_polygon(element, offset_distance)
             else:
-                print(f"❌ Offset not supported for element type: {element.element_type}")
+                logger.warning("Offset not supported for element type: %s", element.element_type)
                 return ""
             
             if offset_element:
                 # Add offset element to sketch
                 if self.add_element(offset_element):
-                    print(f"✅ Offset element created: {offset_element.id}")
+                    logger.debug("Offset element created: %s", offset_element.id)
                     return offset_element.id
                 else:
-                    print(f"❌ Failed to add offset element to sketch")
+                    logger.warning("Failed to add offset element to sketch")
                     return ""
             else:
-                print(f"❌ Failed to create offset element")
+                logger.warning("Failed to create offset element")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error offsetting element: {e}")
+            logger.warning("Error offsetting element: %s", e)
             return ""
     
     def offset_element_directional(self, element_id: str, offset_distance: float, direction: str) -> str:
@@ -1965,37 +2147,50 @@ class Sketch:
             offset_distance: Offset distance (always positive)
             direction: Direction to offset ("left" or "right" relative to line direction)
             
+        Returns:
+            New offset element ID if successful, empty string if failed
+        """
+        direction_code = OFFSET_DIRECTION_CODES.get(direction.lower())
+        if direction_code is None:
+            logger.warning("Invalid direction: %s. Use 'left' or 'right'", direction)
+            return ""
+        
+        return self.offset_element_directional_code(element_id, offset_distance, direction_code)
+    
+    def offset_element_directional_code(self, element_id: str, offset_distance: float, direction_code: int) -> str:
+        """
+        Offset a line element using a pre-parsed direction code
+        
+        Args:
+            element_id: ID of line element to offset
+            offset_distance: Offset distance (always positive)
+            direction_code: OFFSET_LEFT or OFFSET_RIGHT
+            
         Returns:
             New offset element ID if successful, empty string if failed
         """
         try:
-            print(f"📐 Offsetting element {element_id} by distance {offset_distance} to the {direction}")
+            logger.debug("Offsetting element %s by distance %s (direction code %s)", element_id, offset_distance, direction_code)
             
             # Find the element
             element = self.get_element_by_id(element_id)
             if not element:
-                print(f"❌ Element {element_id} not found")
+                logger.warning("Element %s not found", element_id)
                 return ""
             
             # Only lines and arcs support directional offset
             if element.element_type not in [SketchElementType.LINE, SketchElementType.ARC]:
-                print(f"❌ Directional offset only supported for lines and arcs")
+                logger.warning("Directional offset only supported for lines and arcs")
                 return ""
             
-            # Determine actual offset distance based on direction
-            if direction.lower() == "left":
-                actual_offset = offset_distance
-            elif direction.lower() == "right":
-                actual_offset = -offset_distance
-            else:
-                print(f"❌ Invalid direction: {direction}. Use 'left' or 'right'")
-                return ""
+            # Left offsets along the perpendicular, right offsets against it
+            actual_offset = offset_distance if direction_code == OFFSET_LEFT else -offset_distance
             
             # Use regular offset with adjusted distance
             return self.offset_element(element_id, actual_offset)
             
         except Exception as e:
-            print(f"❌ Error offsetting element directionally: {e}")
+            logger.warning("Error offsetting element directionally: %s", e)
             return ""
     
     def _offset_line(self, line: SketchElement, offset_distance: float) -> Optional[SketchElement]:
@@ -2027,7 +2222,7 @@ class Sketch:
             offset_end_y = end_y + perp_y * offset_distance
             
             # Generate unique ID for offset element
-            offset_id = f"offset_{line.id}_{int(time.time() * 1000) % 10000}"
+            offset_id = f"offset_{line.id}_{next(self._id_counter)}"
             
             return SketchElement(
                 id=offset_id,
@@ -2037,7 +2232,7 @@ class Sketch:
             )
             
         except Exception as e:
-            print(f"❌ Error offsetting line: {e}")
+            logger.warning("Error offsetting line: %s", e)
             return None
     
     def _offset_circle(self, circle: SketchElement, offset_distance: float) -> Optional[SketchElement]:
@@ -2051,11 +2246,11 @@ class Sketch:
             
             # Check for invalid radius
             if new_radius <= 0:
-                print(f"❌ Offset would create invalid radius: {new_radius}")
+                logger.warning("Offset would create invalid radius: %s", new_radius)
                 return None
             
             # Generate unique ID for offset element
-            offset_id = f"offset_{circle.id}_{int(time.time() * 1000) % 10000}"
+            offset_id = f"offset_{circle.id}_{next(self._id_counter)}"
             
             return SketchElement(
                 id=offset_id,
@@ -2065,7 +2260,7 @@ class Sketch:
             )
             
         except Exception as e:
-            print(f"❌ Error offsetting circle: {e}")
+            logger.warning("Error offsetting circle: %s", e)
             return None
     
     def _offset_rectangle(self, rectangle: SketchElement, offset_distance: float) -> Optional[SketchElement]:
@@ -2083,7 +2278,7 @@ class Sketch:
             
             # Check for invalid dimensions
             if new_width <= 0 or new_height <= 0:
-                print(f"❌ Offset would create invalid dimensions: {new_width}x{new_height}")
+                logger.warning("Offset would create invalid dimensions: %sx%s", new_width, new_height)
                 return None
             
             # Calculate new corner position (move corner inward/outward)
@@ -2091,7 +2286,7 @@ class Sketch:
             corner_y = rectangle.start_point.Y() - offset_distance
             
             # Generate unique ID for offset element
-            offset_id = f"offset_{rectangle.id}_{int(time.time() * 1000) % 10000}"
+            offset_id = f"offset_{rectangle.id}_{next(self._id_counter)}"
             
             return SketchElement(
                 id=offset_id,
@@ -2101,7 +2296,7 @@ class Sketch:
             )
             
         except Exception as e:
-            print(f"❌ Error offsetting rectangle: {e}")
+            logger.warning("Error offsetting rectangle: %s", e)
             return None
     
     def _offset_arc(self, arc: SketchElement, offset_distance: float) -> Optional[SketchElement]:
@@ -2119,7 +2314,7 @@ class Sketch:
             
             # Check for invalid radius
             if new_radius <= 0:
-                print(f"❌ Offset would create invalid arc radius: {new_radius}")
+                logger.warning("Offset would create invalid arc radius: %s", new_radius)
                 return None
             
             # Calculate new start and end points based on new radius
@@ -2131,7 +2326,7 @@ class Sketch:
             new_end_y = center_y + new_radius * math.sin(end_angle)
             
             # Generate unique ID for offset element
-            offset_id = f"offset_{arc.id}_{int(time.time() * 1000) % 10000}"
+            offset_id = f"offset_{arc.id}_{next(self._id_counter)}"
             
             return SketchElement(
                 id=offset_id,
@@ -2143,7 +2338,7 @@ class Sketch:
             )
             
         except Exception as e:
-            print(f"❌ Error offsetting arc: {e}")
+            logger.warning("Error offsetting arc: %s", e)
             return None
     
     def _offset_polygon(self, polygon: SketchElement, offset_distance: float) -> Optional[SketchElement]:
@@ -2159,11 +2354,11 @@ class Sketch:
             
             # Check for invalid radius
             if new_radius <= 0:
-                print(f"❌ Offset would create invalid polygon radius: {new_radius}")
+                logger.warning("Offset would create invalid polygon radius: %s", new_radius)
                 return None
             
             # Generate unique ID for offset element
-            offset_id = f"offset_{polygon.id}_{int(time.time() * 1000) % 10000}"
+            offset_id = f"offset_{polygon.id}_{next(self._id_counter)}"
             
             return SketchElement(
                 id=offset_id,
@@ -2173,7 +2368,7 @@ class Sketch:
             )
             
         except Exception as e:
-            print(f"❌ Error offsetting polygon: {e}")
+            logger.warning("Error offsetting polygon: %s", e)
             return None
 
     def copy_element(self, element_id: str, num_copies: int, direction_x: float, direction_y: float, distance: float) -> List[str]:
@@ -2191,35 +2386,49 @@ class Sketch:
             List of new copied element IDs
         """
         try:
-            print(f"📄 Copying element {element_id} {num_copies} times with direction ({direction_x}, {direction_y}) and distance {distance}")
-            
-            # Find the element
-            element = self.get_element_by_id(element_id)
-            if not element:
-                print(f"❌ Element {element_id} not found")
-                return []
+            logger.debug("Copying element %s %s times with direction (%s, %s) and distance %s", element_id, num_copies, direction_x, direction_y, distance)
             
             if num_copies <= 0:
-                print(f"❌ Number of copies must be positive, got {num_copies}")
+                logger.warning("Number of copies must be positive, got %s", num_copies)
                 return []
             
             # Normalize direction vector
             direction_length = math.sqrt(direction_x**2 + direction_y**2)
             if direction_length < 1e-10:
-                print(f"❌ Direction vector too small: ({direction_x}, {direction_y})")
+                logger.warning("Direction vector too small: (%s, %s)", direction_x, direction_y)
                 return []
             
-            dir_x = direction_x / direction_length
-            dir_y = direction_y / direction_length
+            # Offsets for every copy in one step: row i is (i+1) * distance * direction
+            direction = np.array([direction_x, direction_y]) * (distance / direction_length)
+            offsets = np.arange(1, num_copies + 1, dtype=np.float64)[:, None] * direction
+            
+            return self.copy_element_batch(element_id, offsets)
+            
+        except Exception as e:
+            logger.warning("Error copying element: %s", e)
+            return []
+    
+    def copy_element_batch(self, element_id: str, offsets: np.ndarray) -> List[str]:
+        """
+        Copy a geometry element once per row of an (N, 2) offset array
+        
+        Args:
+            element_id: ID of element to copy
+            offsets: Array of (offset_x, offset_y) rows, one per copy
+            
+        Returns:
+            List of new copied element IDs
+        """
+        try:
+            element = self.get_element_by_id(element_id)
+            if not element:
+                logger.warning("Element %s not found", element_id)
+                return []
             
             copied_element_ids = []
             
-            # Create copies
-            for copy_index in range(1, num_copies + 1):
-                # Calculate offset for this copy
-                offset_x = dir_x * distance * copy_index
-                offset_y = dir_y * distance * copy_index
-                
+            # tolist() hands back plain floats so gp_Pnt2d gets native arguments
+            for copy_index, (offset_x, offset_y) in enumerate(np.asarray(offsets, dtype=np.float64).tolist(), start=1):
                 # Create copied element
                 copied_element = self._create_copied_element(element, offset_x, offset_y, copy_index)
                 
@@ -2227,17 +2436,17 @@ class Sketch:
                     # Add copied element to sketch
                     if self.add_element(copied_element):
                         copied_element_ids.append(copied_element.id)
-                        print(f"✅ Created copy {copy_index}: {copied_element.id}")
+                        logger.debug("Created copy %s: %s", copy_index, copied_element.id)
                     else:
-                        print(f"❌ Failed to add copied element {copy_index}")
+                        logger.warning("Failed to add copied element %s", copy_index)
                 else:
-                    print(f"❌ Failed to create copied element {copy_index}")
+                    logger.warning("Failed to create copied element %s", copy_index)
             
-            print(f"✅ Copy operation completed: {len(copied_element_ids)} copies created")
+            logger.debug("Copy operation completed: %s copies created", len(copied_element_ids))
             return copied_element_ids
             
         except Exception as e:
-            print(f"❌ Error copying element: {e}")
+            logger.warning("Error copying element: %s", e)
             return []
     
     def _create_copied_element(self, element: SketchElement, offset_x: float, offset_y: float, copy_index: int) -> Optional[SketchElement]:
@@ -2246,7 +2455,7 @@ class Sketch:
             element_type = element.element_type
             
             # Generate unique ID for copied element
-            copied_id = f"copy_{copy_index}_{element.id}_{int(time.time() * 1000) % 10000}"
+            copied_id = f"copy_{copy_index}_{element.id}_{next(self._id_counter)}"
             
             if element_type == SketchElementType.LINE:
                 # Copy line with offset applied to both endpoints
@@ -2359,11 +2568,11 @@ class Sketch:
                 )
             
             else:
-                print(f"❌ Unsupported element type for copying: {element_type}")
+                logger.warning("Unsupported element type for copying: %s", element_type)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error creating copied element: {e}")
+            logger.warning("Error creating copied element: %s", e)
             return None
 
     def move_element(self, element_id: str, direction_x: float, direction_y: float, distance: float) -> bool:
@@ -2380,18 +2589,18 @@ class Sketch:
             True if successful, False if failed
         """
         try:
-            print(f"➡️ Moving element {element_id} with direction ({direction_x}, {direction_y}) and distance {distance}")
+            logger.debug("Moving element %s with direction (%s, %s) and distance %s", element_id, direction_x, direction_y, distance)
             
             # Find the element
             element = self.get_element_by_id(element_id)
             if not element:
-                print(f"❌ Element {element_id} not found")
+                logger.warning("Element %s not found", element_id)
                 return False
             
             # Normalize direction vector
             direction_length = math.sqrt(direction_x**2 + direction_y**2)
             if direction_length < 1e-10:
-                print(f"❌ Direction vector too small: ({direction_x}, {direction_y})")
+                logger.warning("Direction vector too small: (%s, %s)", direction_x, direction_y)
                 return False
             
             dir_x = direction_x / direction_length
@@ -2405,14 +2614,14 @@ class Sketch:
             success = self._apply_move_to_element(element, offset_x, offset_y)
             
             if success:
-                print(f"✅ Successfully moved element {element_id}")
+                logger.debug("Successfully moved element %s", element_id)
             else:
-                print(f"❌ Failed to move element {element_id}")
+                logger.warning("Failed to move element %s", element_id)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error moving element: {e}")
+            logger.warning("Error moving element: %s", e)
             return False
     
     def _apply_move_to_element(self, element: SketchElement, offset_x: float, offset_y: float) -> bool:
@@ -2501,62 +2710,89 @@ class Sketch:
                 return True
             
             else:
-                print(f"❌ Unsupported element type for moving: {element_type}")
+                logger.warning("Unsupported element type for moving: %s", element_type)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error applying move to element: {e}")
+            logger.warning("Error applying move to element: %s", e)
             return False
 
 
+# (normal, x_axis) per plane type; gp_Ax3/gce_MakePln copy them, so sharing is safe
+_PLANE_FRAMES = {
+    "XY": (gp_Dir(0, 0, 1), gp_Dir(1, 0, 0)),  # normal along Z axis
+    "XZ": (gp_Dir(0, 1, 0), gp_Dir(1, 0, 0)),  # normal along Y axis
+    "YZ": (gp_Dir(1, 0, 0), gp_Dir(0, 1, 0)),  # normal along X axis
+}
+
+# (u_axis, v_axis) per plane type, used when a plane has no coordinate system
+_PLANE_AXES_FALLBACK = {
+    "XY": ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)),  # X, Y axes
+    "XZ": ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0)),  # X, Z axes
+    "YZ": ((0.0, 1.0, 0.0), (0.0, 0.0, 1.0)),  # Y, Z axes
+}
+
+
 class SketchPlane:
     """
     Sketch plane class for sketch-based modeling
     """
     
-    def __init__(self, plane_id: str, plane_type: str, origin: Vector3d = Vector3d()):
+    __slots__ = ('plane_id', 'plane_type', 'origin', 'plane_geometry', 'coordinate_system',
+                 '_normal', '_u_axis', '_v_axis', '_basis', '_viz_cache')
+    
+    def __init__(self, plane_id: str, plane_type: str, origin: Optional[Vector3d] = None):
         self.plane_id = plane_id
         self.plane_type = plane_type
-        self.origin = origin
+        self.origin = origin if origin is not None else _ZERO_VEC3
         self.plane_geometry = None
         self.coordinate_system = None
         
+        # Frame read out of OCCT once by _create_plane_geometry
+        self._normal: Optional[Vector3d] = None
+        self._u_axis: Optional[Tuple[float, float, float]] = None
+        self._v_axis: Optional[Tuple[float, float, float]] = None
+        
         # Create the geometric plane
         self._create_plane_geometry()
+        
+        # Planes are immutable after construction, so the 2D->3D basis and
+        # visualization data are built once
+        u_axis, v_axis = self.get_axes()
+        self._basis = (self.origin.x, self.origin.y, self.origin.z, *u_axis, *v_axis)
+        self._viz_cache = self._build_visualization_data()
     
     def _create_plane_geometry(self):
         """Create the actual OpenCascade plane geometry"""
         try:
             origin_pnt = self.origin.to_gp_pnt()
             
-            if self.plane_type == "XY":
-                # XY plane - normal along Z axis
-                normal = gp_Dir(0, 0, 1)
-                x_axis = gp_Dir(1, 0, 0)
-            elif self.plane_type == "XZ":
-                # XZ plane - normal along Y axis  
-                normal = gp_Dir(0, 1, 0)
-                x_axis = gp_Dir(1, 0, 0)
-            elif self.plane_type == "YZ":
-                # YZ plane - normal along X axis
-                normal = gp_Dir(1, 0, 0)
-                x_axis = gp_Dir(0, 1, 0)
-            else:
-                raise Exception(f"Unknown plane type: {self.plane_type}")
+            frame = _PLANE_FRAMES.get(self.plane_type)
+            if frame is None:
+                raise ValueError(f"Unknown plane type: {self.plane_type}")
+            normal, x_axis = frame
             
             # Create coordinate system for reference
             self.coordinate_system = gp_Ax3(origin_pnt, normal, x_axis)
             
+            # The frame never changes after construction; cache it as plain floats
+            x_direction = self.coordinate_system.XDirection()
+            y_direction = self.coordinate_system.YDirection()
+            direction = self.coordinate_system.Direction()
+            self._u_axis = (x_direction.X(), x_direction.Y(), x_direction.Z())
+            self._v_axis = (y_direction.X(), y_direction.Y(), y_direction.Z())
+            self._normal = Vector3d(direction.X(), direction.Y(), direction.Z())
+            
             # Create plane using point and normal direction (simpler constructor)
             plane_maker = gce_MakePln(origin_pnt, normal)
             if plane_maker.IsDone():
                 gp_plane = plane_maker.Value()
                 self.plane_geometry = Geom_Plane(gp_plane)
             else:
-                raise Exception("Failed to create plane geometry")
+                raise RuntimeError("Failed to create plane geometry")
                 
         except Exception as e:
-            print(f"❌ Error creating plane geometry: {e}")
+            logger.warning("Error creating plane geometry: %s", e)
             raise
     
     def get_plane_id(self) -> str:
@@ -2573,43 +2809,39 @@ class SketchPlane:
     
     def get_normal(self) -> Vector3d:
         """Get plane normal vector"""
-        if self.coordinate_system:
-            direction = self.coordinate_system.Direction()
-            return Vector3d(direction.X(), direction.Y(), direction.Z())
+        if self._normal is not None:
+            return self._normal
         return Vector3d(0, 0, 1)
     
+    def get_axes(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+        """Get local (u_axis, v_axis) directions of the plane"""
+        if self._u_axis is not None:
+            return self._u_axis, self._v_axis
+        
+        # Fallback axes based on plane type
+        return _PLANE_AXES_FALLBACK.get(self.plane_type, _PLANE_AXES_FALLBACK["XY"])
+    
+    def get_basis(self) -> Tuple[float, ...]:
+        """Get (ox, oy, oz, ux, uy, uz, vx, vy, vz): origin followed by the u and v axes"""
+        return self._basis
+    
     def get_visualization_data(self) -> Dict[str, Any]:
         """Get visualization data for the plane - matches PlaneVisualizationData interface"""
+        return dict(self._viz_cache)
+    
+    def _build_visualization_data(self) -> Dict[str, Any]:
+        """Build the PlaneVisualizationData dict from the plane's coordinate system"""
         normal = self.get_normal()
         
-        # Calculate local coordinate axes (u_axis and v_axis)
-        if self.coordinate_system:
-            x_direction = self.coordinate_system.XDirection()
-            y_direction = self.coordinate_system.YDirection()
-            u_axis = [x_direction.X(), x_direction.Y(), x_direction.Z()]
-            v_axis = [y_direction.X(), y_direction.Y(), y_direction.Z()]
-        else:
-            # Fallback axes based on plane type
-            if self.plane_type == "XY":
-                u_axis = [1.0, 0.0, 0.0]  # X axis
-                v_axis = [0.0, 1.0, 0.0]  # Y axis
-            elif self.plane_type == "XZ":
-                u_axis = [1.0, 0.0, 0.0]  # X axis
-                v_axis = [0.0, 0.0, 1.0]  # Z axis
-            elif self.plane_type == "YZ":
-                u_axis = [0.0, 1.0, 0.0]  # Y axis
-                v_axis = [0.0, 0.0, 1.0]  # Z axis
-            else:
-                u_axis = [1.0, 0.0, 0.0]
-                v_axis = [0.0, 1.0, 0.0]
+        u_axis, v_axis = self.get_axes()
         
         return {
             "plane_id": self.plane_id,
             "plane_type": self.plane_type,
             "origin": [self.origin.x, self.origin.y, self.origin.z],          # Array format
             "normal": [normal.x, normal.y, normal.z],                         # Array format
-            "u_axis": u_axis,                                                  # Local X axis
-            "v_axis": v_axis,                                                  # Local Y axis
+            "u_axis": list(u_axis),                                            # Local X axis
+            "v_axis": list(v_axis),                                            # Local Y axis
             "size": 100.0                                                     # Grid size for visualization
         }
 
@@ -2620,17 +2852,55 @@ class OCCTEngine:
     Provides the same interface as the original C++ implementation
     """
     
-    def __init__(self):
-        """Initialize the geometry engine"""
+    def __init__(self, max_threads: Optional[int] = None, strict_validation: bool = False):
+        """
+        Initialize the geometry engine
+        
+        Args:
+            max_threads: Size of OCCT's shared thread pool used by parallel
+                booleans and meshing; None keeps OCCT's default (all cores).
+                The pool is process-wide, so this affects every engine.
+            strict_validation: Run the full BRepCheck_Analyzer on primitives too,
+                not just on boolean results
+        """
+        # Parallel mode for every BOPAlgo-based algorithm (process-wide setting)
+        BOPAlgo_Options.SetParallelMode(True)
+        if max_threads is not None:
+            OSD_ThreadPool.DefaultPool().Init(max_threads)
+        
         self.shapes: Dict[str, TopoDS_Shape] = {}
         self.parameters: Dict[str, float] = {}
+        self.strict_validation = strict_validation
         
         # Sketch-based modeling support
         self.sketch_planes: Dict[str, SketchPlane] = {}
         self.sketches: Dict[str, Sketch] = {}
         self.extrude_features: Dict[str, ExtrudeFeature] = {}
         
-        print("OCCT Engine initialized (Python)")
+        # Next sequential number for shape_N / plane_N / sketch_N ids
+        self._next_shape_id = 1
+        self._next_plane_id = 1
+        self._next_sketch_id = 1
+        
+        # LRU of validation results keyed by shape (hash is derived from the TShape)
+        self._validity_cache: OrderedDict = OrderedDict()
+        
+        # LRU of bounding boxes keyed by shape, same keying as the validity cache
+        self._bbox_cache: OrderedDict = OrderedDict()
+        
+        # LRU of element visualizations keyed by (sketch_id, element_id)
+        # -> (element, points, parameter values, viz dict)
+        self._element_viz_cache: OrderedDict = OrderedDict()
+        
+        # LRU of tessellations keyed by (shape_id, deflection) -> (shape, MeshData)
+        self._mesh_cache: OrderedDict = OrderedDict()
+        
+        # Reflection coefficients per (sketch_id, mirror_line_id), stored with the
+        # endpoint objects they were derived from. Sketch edits replace points
+        # rather than mutating them, so an identity mismatch means the line moved.
+        self._mirror_line_cache: Dict[Tuple[str, str], Tuple[gp_Pnt2d, gp_Pnt2d, Tuple[float, float, float, float]]] = {}
+        
+        logger.debug("OCCT Engine initialized (Python)")
     
     def __del__(self):
         """Cleanup - equivalent to C++ destructor"""
@@ -2638,7 +2908,54 @@ class OCCTEngine:
     
     # ==================== BOOLEAN OPERATIONS ====================
     
-    def union_shapes(self, shape1_id: str, shape2_id: str, result_id: str) -> bool:
+    def _run_boolean(self, maker, arguments: List[TopoDS_Shape], tools: List[TopoDS_Shape]) -> Optional[TopoDS_Shape]:
+        """Run a BRepAlgoAPI boolean in parallel, non-destructive mode; None if it fails"""
+        argument_list = TopTools_ListOfShape()
+        for shape in arguments:
+            argument_list.Append(shape)
+        tool_list = TopTools_ListOfShape()
+        for shape in tools:
+            tool_list.Append(shape)
+        
+        maker.SetArguments(argument_list)
+        maker.SetTools(tool_list)
+        maker.SetRunParallel(True)
+        maker.SetNonDestructive(True)
+        maker.Build()
+        
+        if not maker.IsDone():
+            return None
+        return maker.Shape()
+    
+    def _bounding_box(self, shape: TopoDS_Shape) -> Bnd_Box:
+        """Bounding box of a shape, cached; callers must not modify the returned box"""
+        cached = self._bbox_cache.get(shape)
+        if cached is not None:
+            self._bbox_cache.move_to_end(shape)
+            return cached
+        
+        bbox = Bnd_Box()
+        brepbndlib_Add(shape, bbox)
+        
+        self._bbox_cache[shape] = bbox
+        if len(self._bbox_cache) > BBOX_CACHE_SIZE:
+            self._bbox_cache.popitem(last=False)
+        return bbox
+    
+    def _bounding_boxes_disjoint(self, shape1: TopoDS_Shape, shape2: TopoDS_Shape) -> bool:
+        """True if the shapes' bounding boxes don't overlap, so they can't interact"""
+        return self._bounding_box(shape1).IsOut(self._bounding_box(shape2))
+    
+    def _make_compound(self, shapes: List[TopoDS_Shape]) -> TopoDS_Compound:
+        """Group shapes into a compound without any boolean processing"""
+        builder = BRep_Builder()
+        compound = TopoDS_Compound()
+        builder.MakeCompound(compound)
+        for shape in shapes:
+            builder.Add(compound, shape)
+        return compound
+    
+    def union_shapes(self, shape1_id: str, shape2_id: str, result_id: str, validate: bool = True) -> bool:
         """
         Boolean union operation - equivalent to C++ unionShapes
         """
@@ -2649,23 +2966,60 @@ class OCCTEngine:
             shape1 = self.shapes[shape1_id]
             shape2 = self.shapes[shape2_id]
             
-            fuse_maker = BRepAlgoAPI_Fuse(shape1, shape2)
-            result = fuse_maker.Shape()
+            # Disjoint shapes fuse to a compound of the two, no intersection needed
+            if self._bounding_boxes_disjoint(shape1, shape2):
+                self.shapes[result_id] = self._make_compound([shape1, shape2])
+                return True
+            
+            result = self._run_boolean(BRepAlgoAPI_Fuse(), [shape1], [shape2])
+            if result is None:
+                return False
             
-            if not self._validate_shape(result):
+            valid = self._validate_shape(result) if validate else self._quick_validate(result)
+            if not valid:
                 return False
             
             self.shapes[result_id] = result
             return True
             
         except Standard_Failure as e:
-            print(f"OCCT Error in union operation: {e}")
+            logger.warning("OCCT Error in union operation: %s", e)
             return False
         except Exception as e:
-            print(f"Python error in union operation: {e}")
+            logger.warning("Python error in union operation: %s", e)
             return False
     
-    def cut_shapes(self, shape1_id: str, shape2_id: str, result_id: str) -> bool:
+    def union_many(self, shape_ids: List[str], result_id: str, validate: bool = True) -> bool:
+        """
+        Boolean union of any number of shapes in a single fuse operation
+        
+        All inputs are intersected together in one pass rather than folding
+        pairwise unions, which would re-intersect the growing result each step.
+        """
+        if len(shape_ids) < 2 or not all(self.shape_exists(shape_id) for shape_id in shape_ids):
+            return False
+        
+        try:
+            shapes = [self.shapes[shape_id] for shape_id in shape_ids]
+            result = self._run_boolean(BRepAlgoAPI_Fuse(), shapes[:1], shapes[1:])
+            if result is None:
+                return False
+            
+            valid = self._validate_shape(result) if validate else self._quick_validate(result)
+            if not valid:
+                return False
+            
+            self.shapes[result_id] = result
+            return True
+            
+        except Standard_Failure as e:
+            logger.warning("OCCT Error in union operation: %s", e)
+            return False
+        except Exception as e:
+            logger.warning("Python error in union operation: %s", e)
+            return False
+    
+    def cut_shapes(self, shape1_id: str, shape2_id: str, result_id: str, validate: bool = True) -> bool:
         """
         Boolean cut operation - equivalent to C++ cutShapes
         """
@@ -2676,23 +3030,30 @@ class OCCTEngine:
             shape1 = self.shapes[shape1_id]
             shape2 = self.shapes[shape2_id]
             
-            cut_maker = BRepAlgoAPI_Cut(shape1, shape2)
-            result = cut_maker.Shape()
+            # A tool that can't reach shape1 leaves it unchanged
+            if self._bounding_boxes_disjoint(shape1, shape2):
+                self.shapes[result_id] = shape1
+                return True
             
-            if not self._validate_shape(result):
+            result = self._run_boolean(BRepAlgoAPI_Cut(), [shape1], [shape2])
+            if result is None:
+                return False
+            
+            valid = self._validate_shape(result) if validate else self._quick_validate(result)
+            if not valid:
                 return False
             
             self.shapes[result_id] = result
             return True
             
         except Standard_Failure as e:
-            print(f"OCCT Error in cut operation: {e}")
+            logger.warning("OCCT Error in cut operation: %s", e)
             return False
         except Exception as e:
-            print(f"Python error in cut operation: {e}")
+            logger.warning("Python error in cut operation: %s", e)
             return False
     
-    def intersect_shapes(self, shape1_id: str, shape2_id: str, result_id: str) -> bool:
+    def intersect_shapes(self, shape1_id: str, shape2_id: str, result_id: str, validate: bool = True) -> bool:
         """
         Boolean intersection operation - equivalent to C++ intersectShapes
         """
@@ -2703,115 +3064,254 @@ class OCCTEngine:
             shape1 = self.shapes[shape1_id]
             shape2 = self.shapes[shape2_id]
             
-            common_maker = BRepAlgoAPI_Common(shape1, shape2)
-            result = common_maker.Shape()
+            # Disjoint shapes have an empty common part
+            if self._bounding_boxes_disjoint(shape1, shape2):
+                self.shapes[result_id] = self._make_compound([])
+                return True
+            
+            result = self._run_boolean(BRepAlgoAPI_Common(), [shape1], [shape2])
+            if result is None:
+                return False
             
-            if not self._validate_shape(result):
+            valid = self._validate_shape(result) if validate else self._quick_validate(result)
+            if not valid:
                 return False
             
             self.shapes[result_id] = result
             return True
             
         except Standard_Failure as e:
-            print(f"OCCT Error in intersect operation: {e}")
+            logger.warning("OCCT Error in intersect operation: %s", e)
             return False
         except Exception as e:
-            print(f"Python error in intersect operation: {e}")
+            logger.warning("Python error in intersect operation: %s", e)
             return False
     
     # ==================== TESSELLATION ====================
     
-    def tessellate(self, shape_or_id: Union[str, TopoDS_Shape], deflection: float = 0.1) -> Optional[MeshData]:
+    def _mesh_shape(self, shape: TopoDS_Shape, deflection: float, angular_deflection: float, is_relative: bool) -> None:
+        """
+        Run BRepMesh over a shape, meshing its faces in parallel
+        
+        The constructor runs the mesher; BRepMesh itself keeps any existing face
+        triangulation that already meets both the linear and angular tolerance.
+        """
+        BRepMesh_IncrementalMesh(shape, deflection, is_relative, angular_deflection, True)
+    
+    def tessellate(self, shape_or_id: Union[str, TopoDS_Shape], deflection: float = 0.1,
+                   angular_deflection: float = MESH_ANGULAR_DEFLECTION, is_relative: bool = False) -> Optional[MeshData]:
         """
         Tessellate shape to mesh - equivalent to C++ tessellate method
         Can accept either a shape ID or a TopoDS_Shape object.
+        
+        Args:
+            deflection: Linear deflection, absolute or as a fraction of edge size when is_relative
+            angular_deflection: Angular deflection in radians
+            is_relative: Interpret deflection relative to each edge's size
         """
         mesh_data = MeshData(vertices=[], faces=[], normals=[])
         shape = None
+        cache_key = None
 
         if isinstance(shape_or_id, str):
             if not self.shape_exists(shape_or_id):
-                print(f"❌ Shape {shape_or_id} does not exist!")
+                logger.warning("Shape %s does not exist!", shape_or_id)
                 return None
             shape = self.shapes[shape_or_id]
+            
+            cache_key = self._mesh_cache_key(shape_or_id, deflection, angular_deflection, is_relative)
+            cached = self._get_cached_mesh(cache_key, shape)
+            if cached is not None:
+                return cached
         elif isinstance(shape_or_id, TopoDS_Shape):
             shape = shape_or_id
         else:
-            print(f"❌ Invalid input for tessellation. Must be shape ID or TopoDS_Shape.")
+            logger.warning("Invalid input for tessellation. Must be shape ID or TopoDS_Shape.")
             return None
 
         if shape is None or shape.IsNull():
-            print(f"❌ Invalid shape provided for tessellation.")
+            logger.warning("Invalid shape provided for tessellation.")
             return None
         
         try:
-            # Perform tessellation
-            mesh = BRepMesh_IncrementalMesh(shape, deflection)
-            mesh.Perform()
-            
-            # Extract triangulation data
-            explorer = TopExp_Explorer(shape, TopAbs_FACE)
-            
-            while explorer.More():
-                face = topods.Face(explorer.Current())
-                location = TopLoc_Location()
-                triangulation = BRep_Tool.Triangulation(face, location)
-                
-                if triangulation is not None:
-                    # Get transformation from location
-                    transformation = location.Transformation()
-                    
-                    # Base vertex index for this face
-                    base_vertex_index = len(mesh_data.vertices) // 3
-                    
-                    # Add vertices
-                    for i in range(1, triangulation.NbNodes() + 1):
-                        vertex = triangulation.Node(i)
-                        # Apply transformation
-                        vertex.Transform(transformation)
-                        
-                        mesh_data.vertices.extend([vertex.X(), vertex.Y(), vertex.Z()])
-                    
-                    # Add normals if available
-                    if triangulation.HasNormals():
-                        for i in range(1, triangulation.NbNodes() + 1):
-                            normal = triangulation.Normal(i)
-                            mesh_data.normals.extend([normal.X(), normal.Y(), normal.Z()])
-                    
-                    # Add faces
-                    for i in range(1, triangulation.NbTriangles() + 1):
-                        triangle = triangulation.Triangle(i)
-                        n1, n2, n3 = triangle.Get()
-                        
-                        # Check face orientation
-                        if face.Orientation() == TopAbs_REVERSED:
-                            mesh_data.faces.extend([
-                                base_vertex_index + n1 - 1,
-                                base_vertex_index + n3 - 1,
-                                base_vertex_index + n2 - 1
-                            ])
-                        else:
-                            mesh_data.faces.extend([
-                                base_vertex_index + n1 - 1,
-                                base_vertex_index + n2 - 1,
-                                base_vertex_index + n3 - 1
-                            ])
-                
-                explorer.Next()
-            
-            # Update metadata
-            mesh_data.vertex_count = len(mesh_data.vertices) // 3
-            mesh_data.face_count = len(mesh_data.faces) // 3
-            mesh_data.tessellation_quality = deflection
-            
-            print(f"✅ Tessellation complete: {mesh_data.vertex_count} vertices, {mesh_data.face_count} faces")
+            self._mesh_shape(shape, deflection, angular_deflection, is_relative)
+            mesh_data = self._extract_mesh(shape, deflection)
+            logger.debug("Tessellation complete: %s vertices, %s faces", mesh_data.vertex_count, mesh_data.face_count)
             
         except Standard_Failure as e:
-            print(f"OCCT Error in tessellation: {e}")
+            logger.warning("OCCT Error in tessellation: %s", e)
         except Exception as e:
-            print(f"Python error in tessellation: {e}")
+            logger.warning("Python error in tessellation: %s", e)
+        
+        if mesh_data.vertex_count == 0:
+            return None
+        
+        if cache_key is not None:
+            self._store_cached_mesh(cache_key, shape, mesh_data)
+        return mesh_data
+    
+    def _mesh_cache_key(self, shape_id: str, deflection: float, angular_deflection: float,
+                        is_relative: bool) -> Tuple[str, float, float, bool]:
+        """Key for _mesh_cache entries"""
+        return (shape_id, round(deflection, 6), round(angular_deflection, 6), is_relative)
+    
+    def _get_cached_mesh(self, cache_key: Tuple[str, float, float, bool], shape: TopoDS_Shape) -> Optional[MeshData]:
+        """
+        Cached mesh for a key, if it was built from this exact shape object
+        
+        Entries remember the shape object they were meshed from, so an id
+        that has since been overwritten (e.g. by a boolean result) misses
+        """
+        cached = self._mesh_cache.get(cache_key)
+        if cached is not None and cached[0] is shape:
+            self._mesh_cache.move_to_end(cache_key)
+            return cached[1]
+        return None
+    
+    def _store_cached_mesh(self, cache_key: Tuple[str, float, float, bool], shape: TopoDS_Shape,
+                           mesh_data: MeshData) -> None:
+        """Add a mesh to the LRU mesh cache"""
+        self._mesh_cache[cache_key] = (shape, mesh_data)
+        if len(self._mesh_cache) > MESH_CACHE_SIZE:
+            self._mesh_cache.popitem(last=False)
+    
+    def _extract_mesh(self, shape: TopoDS_Shape, deflection: float) -> MeshData:
+        """
+        Collect the existing face triangulations of an already-meshed shape
+        
+        Does not run the mesher; faces without a triangulation are skipped.
+        """
+        # First pass: collect triangulated faces and size the output
+        explorer = TopExp_Explorer(shape, TopAbs_FACE)
+        face_triangulations = []
+        total_nodes = 0
+        total_triangles = 0
+        total_normals = 0
+        
+        while explorer.More():
+            face = topods.Face(explorer.Current())
+            location = TopLoc_Location()
+            triangulation = BRep_Tool.Triangulation(face, location)
+            
+            if triangulation is not None:
+                face_triangulations.append((face, location, triangulation))
+                total_nodes += triangulation.NbNodes()
+                total_triangles += triangulation.NbTriangles()
+                if triangulation.HasNormals():
+                    total_normals += triangulation.NbNodes()
+            
+            explorer.Next()
+        
+        # Second pass: fill preallocated arrays one face-sized slice at a time
+        vertices = np.empty((total_nodes, 3), dtype=np.float32)
+        normals = np.empty((total_normals, 3), dtype=np.float32)
+        faces = np.empty((total_triangles, 3), dtype=np.uint32)
+        base_vertex_index = 0
+        normal_offset = 0
+        triangle_offset = 0
+        
+        for face, location, triangulation in face_triangulations:
+            nb_nodes = triangulation.NbNodes()
+            nb_triangles = triangulation.NbTriangles()
+            
+            # Add vertices, untransformed, streamed straight into a float64 buffer
+            nodes = np.fromiter(
+                chain.from_iterable(triangulation.Node(i).Coord() for i in range(1, nb_nodes + 1)),
+                dtype=np.float64, count=3 * nb_nodes
+            ).reshape(nb_nodes, 3)
+            
+            # Apply the face location as one 3x4 affine on the whole block
+            if not location.IsIdentity():
+                transformation = location.Transformation()
+                matrix = np.array(
+                    [[transformation.Value(row, col) for col in range(1, 5)] for row in range(1, 4)],
+                    dtype=np.float64
+                )
+                nodes = nodes @ matrix[:, :3].T + matrix[:, 3]
+            vertices[base_vertex_index:base_vertex_index + nb_nodes] = nodes
+            
+            # Add normals if available
+            if triangulation.HasNormals():
+                normals[normal_offset:normal_offset + nb_nodes] = np.fromiter(
+                    chain.from_iterable(triangulation.Normal(i).Coord() for i in range(1, nb_nodes + 1)),
+                    dtype=np.float64, count=3 * nb_nodes
+                ).reshape(nb_nodes, 3)
+                normal_offset += nb_nodes
+            
+            # Add faces, shifting OCCT's 1-based node indices to this face's block
+            triangles = np.fromiter(
+                chain.from_iterable(triangulation.Triangle(i).Get() for i in range(1, nb_triangles + 1)),
+                dtype=np.int64, count=3 * nb_triangles
+            ).reshape(nb_triangles, 3)
+            triangles += base_vertex_index - 1
+            
+            # Reversed faces flip winding by swapping the last two columns
+            if face.Orientation() == TopAbs_REVERSED:
+                triangles = triangles[:, (0, 2, 1)]
+            faces[triangle_offset:triangle_offset + nb_triangles] = triangles
+            
+            base_vertex_index += nb_nodes
+            triangle_offset += nb_triangles
+        
+        return MeshData(
+            vertices=vertices,
+            faces=faces,
+            normals=normals,
+            tessellation_quality=deflection
+        )
+    
+    def tessellate_many(self, shape_ids: List[str], deflection: float = 0.1,
+                        angular_deflection: float = MESH_ANGULAR_DEFLECTION, is_relative: bool = False) -> Dict[str, MeshData]:
+        """
+        Tessellate several shapes, meshing all of their faces in one parallel pass
+        
+        Shapes without a cached mesh are gathered into a compound and meshed by a
+        single parallel BRepMesh run, so faces of different shapes are spread
+        across OCCT's thread pool. Faces shared between shapes (e.g. a boolean
+        result and its inputs) are meshed once rather than raced on by separate
+        threads. Each shape's triangulation is then read back without meshing
+        again, and cached as tessellate would.
+        
+        Returns:
+            Mapping of shape ID to MeshData for every shape that produced a mesh
+        """
+        meshes = {}
+        pending = []
+        for shape_id in shape_ids:
+            if not self.shape_exists(shape_id) or shape_id in meshes:
+                continue
+            shape = self.shapes[shape_id]
+            cache_key = self._mesh_cache_key(shape_id, deflection, angular_deflection, is_relative)
+            cached = self._get_cached_mesh(cache_key, shape)
+            if cached is not None:
+                meshes[shape_id] = cached
+            else:
+                pending.append((shape_id, shape, cache_key))
+        
+        if pending:
+            try:
+                compound = self._make_compound([shape for _, shape, _ in pending])
+                self._mesh_shape(compound, deflection, angular_deflection, is_relative)
+            except Standard_Failure as e:
+                logger.warning("OCCT Error in batch tessellation: %s", e)
+                pending = []
+        
+        for shape_id, shape, cache_key in pending:
+            try:
+                mesh_data = self._extract_mesh(shape, deflection)
+            except Standard_Failure as e:
+                logger.warning("OCCT Error in tessellation of %s: %s", shape_id, e)
+                continue
+            except Exception as e:
+                logger.warning("Python error in tessellation of %s: %s", shape_id, e)
+                continue
+            
+            if mesh_data.vertex_count:
+                self._store_cached_mesh(cache_key, shape, mesh_data)
+                meshes[shape_id] = mesh_data
         
-        return mesh_data if mesh_data.vertex_count > 0 else None
+        # Keep the caller's order rather than cached-first
+        return {shape_id: meshes[shape_id] for shape_id in shape_ids if shape_id in meshes}
     
     # ==================== PRIMITIVE CREATION ====================
     
@@ -2824,20 +3324,22 @@ class OCCTEngine:
             box_maker = BRepPrimAPI_MakeBox(width, height, depth)
             shape = box_maker.Shape()
             
-            if self._validate_shape(shape):
+            if self._validate_primitive(shape):
                 self.shapes[shape_id] = shape
-                print(f"✅ Created box {shape_id}: {width}x{height}x{depth}")
+                logger.debug("Created box %s: %sx%sx%s", shape_id, width, height, depth)
                 return shape_id
             else:
-                print(f"❌ Failed to create valid box")
+                logger.warning("Failed to create valid box")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error creating box: {e}")
+            logger.warning("Error creating box: %s", e)
             return ""
     
-    def create_sphere(self, radius: float, center: Vector3d = Vector3d(), shape_id: Optional[str] = None) -> str:
+    def create_sphere(self, radius: float, center: Optional[Vector3d] = None, shape_id: Optional[str] = None) -> str:
         """Create a sphere primitive"""
+        if center is None:
+            center = _ZERO_VEC3
         if shape_id is None:
             shape_id = self._generate_shape_id()
         
@@ -2846,21 +3348,97 @@ class OCCTEngine:
             sphere_maker = BRepPrimAPI_MakeSphere(center_pnt, radius)
             shape = sphere_maker.Shape()
             
-            if self._validate_shape(shape):
+            if self._validate_primitive(shape):
                 self.shapes[shape_id] = shape
-                print(f"✅ Created sphere {shape_id}: radius={radius} at ({center.x},{center.y},{center.z})")
+                logger.debug("Created sphere %s: radius=%s at (%s,%s,%s)", shape_id, radius, center.x, center.y, center.z)
                 return shape_id
             else:
-                print(f"❌ Failed to create valid sphere")
+                logger.warning("Failed to create valid sphere")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Error creating sphere: {e}")
+            logger.warning("Error creating sphere: %s", e)
             return ""
     
+    def create_boxes(self, dims: np.ndarray, origins: Optional[np.ndarray] = None,
+                     compound_id: Optional[str] = None) -> List[str]:
+        """
+        Create many box primitives in one call
+        
+        Args:
+            dims: (N, 3) array of width, height, depth per box
+            origins: Optional (N, 3) array of box corner positions (default origin)
+            compound_id: If given, also store all boxes as one compound under this ID
+                so booleans can address the whole set as a single operand
+            
+        Returns:
+            List of new shape IDs, in input order; empty on any failure
+        """
+        dims = np.asarray(dims, dtype=np.float64).reshape(-1, 3)
+        origins = np.zeros_like(dims) if origins is None else np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        if origins.shape != dims.shape:
+            logger.warning("Box dims and origins must have the same shape")
+            return []
+        
+        try:
+            shapes = [
+                BRepPrimAPI_MakeBox(gp_Pnt(x, y, z), dx, dy, dz).Shape()
+                for (dx, dy, dz), (x, y, z) in zip(dims.tolist(), origins.tolist())
+            ]
+            return self._store_primitives(shapes, compound_id)
+            
+        except Exception as e:
+            logger.warning("Error creating boxes: %s", e)
+            return []
+    
+    def create_spheres(self, radii: np.ndarray, centers: Optional[np.ndarray] = None,
+                       compound_id: Optional[str] = None) -> List[str]:
+        """
+        Create many sphere primitives in one call
+        
+        Args:
+            radii: (N,) array of sphere radii
+            centers: Optional (N, 3) array of sphere centers (default origin)
+            compound_id: If given, also store all spheres as one compound under this ID
+            
+        Returns:
+            List of new shape IDs, in input order; empty on any failure
+        """
+        radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+        centers = np.zeros((radii.shape[0], 3)) if centers is None else np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        if centers.shape[0] != radii.shape[0]:
+            logger.warning("Sphere radii and centers must have the same length")
+            return []
+        
+        try:
+            shapes = [
+                BRepPrimAPI_MakeSphere(gp_Pnt(x, y, z), radius).Shape()
+                for radius, (x, y, z) in zip(radii.tolist(), centers.tolist())
+            ]
+            return self._store_primitives(shapes, compound_id)
+            
+        except Exception as e:
+            logger.warning("Error creating spheres: %s", e)
+            return []
+    
+    def _store_primitives(self, shapes: List[TopoDS_Shape], compound_id: Optional[str]) -> List[str]:
+        """Register freshly built primitives, optionally grouped into a compound"""
+        if not all(self._validate_primitive(shape) for shape in shapes):
+            logger.warning("Failed to create valid primitives")
+            return []
+        
+        shape_ids = [self._generate_shape_id() for _ in shapes]
+        self.shapes.update(zip(shape_ids, shapes))
+        
+        if compound_id is not None:
+            self.shapes[compound_id] = self._make_compound(shapes)
+        
+        logger.debug("Created %s primitives", len(shape_ids))
+        return shape_ids
+    
     # ==================== SKETCH-BASED MODELING ====================
     
-    def create_sketch_plane(self, plane_type: str, origin: Vector3d = Vector3d()) -> str:
+    def create_sketch_plane(self, plane_type: str, origin: Optional[Vector3d] = None) -> str:
         """
         Create sketch plane - equivalent to C++ createSketchPlane
         
@@ -2871,7 +3449,10 @@ class OCCTEngine:
         Returns:
             Plane ID if successful, empty string if failed
         """
-        print(f"🎯 Creating sketch plane: {plane_type} at ({origin.x},{origin.y},{origin.z})")
+        if origin is None:
+            origin = _ZERO_VEC3
+        
+        logger.debug("Creating sketch plane: %s at (%s,%s,%s)", plane_type, origin.x, origin.y, origin.z)
         
         try:
             # Generate unique plane ID using sequential numbering
@@ -2883,11 +3464,11 @@ class OCCTEngine:
             # Store the plane
             self.sketch_planes[plane_id] = sketch_plane
             
-            print(f"✅ Created sketch plane: {plane_id}")
+            logger.debug("Created sketch plane: %s", plane_id)
             return plane_id
             
-        except Exception as e:
-            print(f"❌ Error creating sketch plane: {e}")
+        except (Standard_Failure, ValueError, RuntimeError) as e:
+            logger.warning("Error creating sketch plane: %s", e)
             return ""
     
     def plane_exists(self, plane_id: str) -> bool:
@@ -2905,16 +3486,10 @@ class OCCTEngine:
             Visualization data dictionary or None if plane doesn't exist
         """
         if not self.plane_exists(plane_id):
-            print(f"❌ Sketch plane not found: {plane_id}")
+            logger.warning("Sketch plane not found: %s", plane_id)
             return None
         
-        try:
-            plane = self.sketch_planes[plane_id]
-            return plane.get_visualization_data()
-            
-        except Exception as e:
-            print(f"❌ Error getting plane visualization data: {e}")
-            return None
+        return self.sketch_planes[plane_id].get_visualization_data()
     
     def get_available_plane_ids(self) -> List[str]:
         """Get list of available plane IDs - equivalent to C++ getAvailablePlaneIds"""
@@ -2930,12 +3505,12 @@ class OCCTEngine:
         Returns:
             Sketch ID if successful, empty string if failed
         """
-        print(f"📐 Creating sketch on plane: {plane_id}")
+        logger.debug("Creating sketch on plane: %s", plane_id)
         
         try:
             # Check if plane exists
             if not self.plane_exists(plane_id):
-                print(f"❌ Sketch plane not found: {plane_id}")
+                logger.warning("Sketch plane not found: %s", plane_id)
                 return ""
             
             # Generate unique sketch ID using sequential numbering
@@ -2950,11 +3525,11 @@ class OCCTEngine:
             # Store the sketch
             self.sketches[sketch_id] = sketch
             
-            print(f"✅ Created sketch: {sketch_id} on plane: {plane_id}")
+            logger.debug("Created sketch: %s on plane: %s", sketch_id, plane_id)
             return sketch_id
             
-        except Exception as e:
-            print(f"❌ Error creating sketch: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error creating sketch: %s", e)
             return ""
     
     def sketch_exists(self, sketch_id: str) -> bool:
@@ -2981,17 +3556,12 @@ class OCCTEngine:
         Returns:
             Visualization data dictionary or None if sketch doesn't exist
         """
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return None
         
-        try:
-            sketch = self.sketches[sketch_id]
-            return sketch.get_visualization_data()
-            
-        except Exception as e:
-            print(f"❌ Error getting sketch visualization data: {e}")
-            return None
+        return sketch.get_visualization_data()
     
     def get_available_sketch_ids(self) -> List[str]:
         """Get list of available sketch IDs - equivalent to C++ getAvailableSketchIds"""
@@ -2999,12 +3569,11 @@ class OCCTEngine:
     
     def get_sketch_info(self, sketch_id: str) -> Optional[Dict[str, Any]]:
         """Get sketch information - equivalent to C++ getSketchInfo"""
-        if not self.sketch_exists(sketch_id):
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
             return None
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             return {
                 "sketch_id": sketch.get_sketch_id(),
                 "plane_id": sketch.get_plane_id(),
@@ -3013,19 +3582,12 @@ class OCCTEngine:
             }
             
         except Exception as e:
-            print(f"❌ Error getting sketch info: {e}")
+            logger.warning("Error getting sketch info: %s", e)
             return None
 
     def get_sketch_by_id(self, sketch_id: str) -> Optional['Sketch']:
         """Get sketch by ID - equivalent to C++ getSketchById"""
-        if not self.sketch_exists(sketch_id):
-            return None
-        
-        try:
-            return self.sketches[sketch_id]
-        except Exception as e:
-            print(f"❌ Error getting sketch by ID: {e}")
-            return None
+        return self.sketches.get(sketch_id)
     
     # ==================== SKETCH ELEMENT CREATION METHODS ====================
     
@@ -3041,15 +3603,14 @@ class OCCTEngine:
         Returns:
             Line element ID if successful, empty string if failed
         """
-        print(f"📏 Adding line to sketch {sketch_id}: ({x1},{y1}) to ({x2},{y2})")
+        logger.debug("Adding line to sketch %s: (%s,%s) to (%s,%s)", sketch_id, x1, y1, x2, y2)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Create 2D points
             start_point = gp_Pnt2d(x1, y1)
             end_point = gp_Pnt2d(x2, y2)
@@ -3058,14 +3619,14 @@ class OCCTEngine:
             line_id = sketch.add_line(start_point, end_point)
             
             if line_id:
-                print(f"✅ Added line {line_id} to sketch {sketch_id}")
+                logger.debug("Added line %s to sketch %s", line_id, sketch_id)
             else:
-                print(f"❌ Failed to add line to sketch {sketch_id}")
+                logger.warning("Failed to add line to sketch %s", sketch_id)
             
             return line_id
 
-        except Exception as e:
-            print(f"❌ Error adding line to sketch: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding line to sketch: %s", e)
             return ""
 
     def update_line_in_sketch(self, sketch_id: str, element_id: str, x1: float, y1: float, x2: float, y2: float) -> bool:
@@ -3081,33 +3642,33 @@ class OCCTEngine:
         Returns:
             True if successful, False if failed
         """
-        print(f"📏 Updating line {element_id} in sketch {sketch_id}: ({x1},{y1}) to ({x2},{y2})")
+        logger.debug("Updating line %s in sketch %s: (%s,%s) to (%s,%s)", element_id, sketch_id, x1, y1, x2, y2)
 
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
 
         try:
-            sketch = self.sketches[sketch_id]
             element = sketch.get_element_by_id(element_id)
 
             if not element:
-                print(f"❌ Element not found: {element_id}")
+                logger.warning("Element not found: %s", element_id)
                 return False
 
             if element.element_type != SketchElementType.LINE:
-                print(f"❌ Element {element_id} is not a line")
+                logger.warning("Element %s is not a line", element_id)
                 return False
 
             # Update the line endpoints
             element.start_point = gp_Pnt2d(x1, y1)
             element.end_point = gp_Pnt2d(x2, y2)
 
-            print(f"✅ Updated line {element_id} in sketch {sketch_id}")
+            logger.debug("Updated line %s in sketch %s", element_id, sketch_id)
             return True
 
         except Exception as e:
-            print(f"❌ Error updating line in sketch: {e}")
+            logger.warning("Error updating line in sketch: %s", e)
             return False
 
     def add_circle_to_sketch(self, sketch_id: str, center_x: float, center_y: float, radius: float) -> str:
@@ -3122,15 +3683,14 @@ class OCCTEngine:
         Returns:
             Circle element ID if successful, empty string if failed
         """
-        print(f"⭕ Adding circle to sketch {sketch_id}: center({center_x},{center_y}) radius={radius}")
+        logger.debug("Adding circle to sketch %s: center(%s,%s) radius=%s", sketch_id, center_x, center_y, radius)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Create 2D center point
             center_point = gp_Pnt2d(center_x, center_y)
             
@@ -3138,14 +3698,14 @@ class OCCTEngine:
             circle_id = sketch.add_circle(center_point, radius)
             
             if circle_id:
-                print(f"✅ Added circle {circle_id} to sketch {sketch_id}")
+                logger.debug("Added circle %s to sketch %s", circle_id, sketch_id)
             else:
-                print(f"❌ Failed to add circle to sketch {sketch_id}")
+                logger.warning("Failed to add circle to sketch %s", sketch_id)
             
             return circle_id
             
-        except Exception as e:
-            print(f"❌ Error adding circle to sketch: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding circle to sketch: %s", e)
             return ""
     
     def add_rectangle_to_sketch(self, sketch_id: str, x: float, y: float, width: float, height: float) -> str:
@@ -3160,15 +3720,14 @@ class OCCTEngine:
         Returns:
             Rectangle element ID if successful, empty string if failed
         """
-        print(f"▭ Adding rectangle to sketch {sketch_id}: ({x},{y}) size {width}x{height}")
+        logger.debug("Adding rectangle to sketch %s: (%s,%s) size %sx%s", sketch_id, x, y, width, height)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Create 2D corner point
             corner_point = gp_Pnt2d(x, y)
             
@@ -3176,14 +3735,14 @@ class OCCTEngine:
             rectangle_id = sketch.add_rectangle(corner_point, width, height)
             
             if rectangle_id:
-                print(f"✅ Added rectangle {rectangle_id} to sketch {sketch_id}")
+                logger.debug("Added rectangle %s to sketch %s", rectangle_id, sketch_id)
             else:
-                print(f"❌ Failed to add rectangle to sketch {sketch_id}")
+                logger.warning("Failed to add rectangle to sketch %s", sketch_id)
             
             return rectangle_id
             
-        except Exception as e:
-            print(f"❌ Error adding rectangle to sketch: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding rectangle to sketch: %s", e)
             return ""
     
     def add_arc_to_sketch(self, sketch_id: str, arc_type: str, **kwargs) -> str:
@@ -3200,15 +3759,14 @@ class OCCTEngine:
         Returns:
             Arc element ID if successful, empty string if failed
         """
-        print(f"🌙 Adding arc to sketch {sketch_id}: type={arc_type}")
+        logger.debug("Adding arc to sketch %s: type=%s", sketch_id, arc_type)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             if arc_type == "three_points":
                 # Arc from three points (start, middle, end)
                 x1 = kwargs.get("x1")
@@ -3219,7 +3777,7 @@ class OCCTEngine:
                 y2 = kwargs.get("y2")
                 
                 if None in [x1, y1, x_mid, y_mid, x2, y2]:
-                    print(f"❌ Missing parameters for three-point arc")
+                    logger.warning("Missing parameters for three-point arc")
                     return ""
                 
                 start_point = gp_Pnt2d(x1, y1)
@@ -3238,7 +3796,7 @@ class OCCTEngine:
                 large_arc = kwargs.get("large_arc", False)
                 
                 if None in [x1, y1, x2, y2, radius]:
-                    print(f"❌ Missing parameters for endpoints-radius arc")
+                    logger.warning("Missing parameters for endpoints-radius arc")
                     return ""
                 
                 start_point = gp_Pnt2d(x1, y1)
@@ -3247,18 +3805,18 @@ class OCCTEngine:
                 arc_id = sketch.add_arc_endpoints_radius(start_point, end_point, radius, large_arc)
                 
             else:
-                print(f"❌ Unknown arc type: {arc_type}")
+                logger.warning("Unknown arc type: %s", arc_type)
                 return ""
             
             if arc_id:
-                print(f"✅ Added arc {arc_id} to sketch {sketch_id}")
+                logger.debug("Added arc %s to sketch %s", arc_id, sketch_id)
             else:
-                print(f"❌ Failed to add arc to sketch {sketch_id}")
+                logger.warning("Failed to add arc to sketch %s", sketch_id)
             
             return arc_id
             
-        except Exception as e:
-            print(f"❌ Error adding arc to sketch: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding arc to sketch: %s", e)
             return ""
     
     def add_polygon_to_sketch(self, sketch_id: str, center_x: float, center_y: float, sides: int, radius: float) -> str:
@@ -3274,19 +3832,18 @@ class OCCTEngine:
         Returns:
             Polygon element ID if successful, empty string if failed
         """
-        print(f"⬢ Adding {sides}-sided polygon to sketch {sketch_id}: center({center_x},{center_y}) radius={radius}")
+        logger.debug("Adding %s-sided polygon to sketch %s: center(%s,%s) radius=%s", sides, sketch_id, center_x, center_y, radius)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         if sides < 3:
-            print(f"❌ Polygon must have at least 3 sides, got {sides}")
+            logger.warning("Polygon must have at least 3 sides, got %s", sides)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Create 2D center point
             center_point = gp_Pnt2d(center_x, center_y)
             
@@ -3294,16 +3851,131 @@ class OCCTEngine:
             polygon_id = sketch.add_polygon(center_point, sides, radius)
             
             if polygon_id:
-                print(f"✅ Added polygon {polygon_id} to sketch {sketch_id}")
+                logger.debug("Added polygon %s to sketch %s", polygon_id, sketch_id)
             else:
-                print(f"❌ Failed to add polygon to sketch {sketch_id}")
+                logger.warning("Failed to add polygon to sketch %s", sketch_id)
             
             return polygon_id
             
-        except Exception as e:
-            print(f"❌ Error adding polygon to sketch: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding polygon to sketch: %s", e)
             return ""
     
+    def _sketch_batch_rows(self, sketch_id: str, values: np.ndarray, columns: int) -> Tuple[Optional['Sketch'], List[List[float]]]:
+        """Look up a sketch and unpack an (N, columns) batch into rows of floats"""
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
+            return None, []
+        return sketch, np.asarray(values, dtype=np.float64).reshape(-1, columns).tolist()
+    
+    def add_lines_to_sketch(self, sketch_id: str, coords: np.ndarray) -> List[str]:
+        """
+        Add many lines to a sketch in one call
+        
+        Args:
+            sketch_id: Sketch identifier
+            coords: (N, 4) array of x1, y1, x2, y2 per line
+            
+        Returns:
+            List of new element IDs in input order; empty string for lines that
+            could not be added, empty list if the sketch or input is invalid
+        """
+        try:
+            sketch, rows = self._sketch_batch_rows(sketch_id, coords, 4)
+            if sketch is None:
+                return []
+            
+            add_line = sketch.add_line
+            line_ids = [add_line(gp_Pnt2d(x1, y1), gp_Pnt2d(x2, y2)) for x1, y1, x2, y2 in rows]
+            logger.debug("Added %s lines to sketch %s", len(line_ids), sketch_id)
+            return line_ids
+            
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding lines to sketch: %s", e)
+            return []
+    
+    def add_circles_to_sketch(self, sketch_id: str, circles: np.ndarray) -> List[str]:
+        """
+        Add many circles to a sketch in one call
+        
+        Args:
+            sketch_id: Sketch identifier
+            circles: (N, 3) array of center_x, center_y, radius per circle
+            
+        Returns:
+            List of new element IDs in input order; empty string for circles that
+            could not be added, empty list if the sketch or input is invalid
+        """
+        try:
+            sketch, rows = self._sketch_batch_rows(sketch_id, circles, 3)
+            if sketch is None:
+                return []
+            
+            add_circle = sketch.add_circle
+            circle_ids = [add_circle(gp_Pnt2d(center_x, center_y), radius) for center_x, center_y, radius in rows]
+            logger.debug("Added %s circles to sketch %s", len(circle_ids), sketch_id)
+            return circle_ids
+            
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding circles to sketch: %s", e)
+            return []
+    
+    def add_rectangles_to_sketch(self, sketch_id: str, rectangles: np.ndarray) -> List[str]:
+        """
+        Add many rectangles to a sketch in one call
+        
+        Args:
+            sketch_id: Sketch identifier
+            rectangles: (N, 4) array of x, y, width, height per rectangle, with
+                (x, y) the bottom-left corner
+            
+        Returns:
+            List of new element IDs in input order; empty string for rectangles that
+            could not be added, empty list if the sketch or input is invalid
+        """
+        try:
+            sketch, rows = self._sketch_batch_rows(sketch_id, rectangles, 4)
+            if sketch is None:
+                return []
+            
+            add_rectangle = sketch.add_rectangle
+            rectangle_ids = [add_rectangle(gp_Pnt2d(x, y), width, height) for x, y, width, height in rows]
+            logger.debug("Added %s rectangles to sketch %s", len(rectangle_ids), sketch_id)
+            return rectangle_ids
+            
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding rectangles to sketch: %s", e)
+            return []
+    
+    def add_polygons_to_sketch(self, sketch_id: str, polygons: np.ndarray) -> List[str]:
+        """
+        Add many regular polygons to a sketch in one call
+        
+        Args:
+            sketch_id: Sketch identifier
+            polygons: (N, 4) array of center_x, center_y, sides, radius per polygon
+            
+        Returns:
+            List of new element IDs in input order; empty string for polygons that
+            could not be added (e.g. fewer than 3 sides), empty list if the sketch
+            or input is invalid
+        """
+        try:
+            sketch, rows = self._sketch_batch_rows(sketch_id, polygons, 4)
+            if sketch is None:
+                return []
+            
+            add_polygon = sketch.add_polygon
+            polygon_ids = [add_polygon(gp_Pnt2d(center_x, center_y), int(sides), radius)
+                           for center_x, center_y, sides, radius in rows]
+            logger.debug("Added %s polygons to sketch %s", len(polygon_ids), sketch_id)
+            return polygon_ids
+            
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error adding polygons to sketch: %s", e)
+            return []
+    
     def add_fillet_to_sketch(self, sketch_id: str, line1_id: str, line2_id: str, radius: float) -> str:
         """
         Add fillet between two lines in sketch - equivalent to C++ addFilletToSketch
@@ -3317,31 +3989,30 @@ class OCCTEngine:
         Returns:
             Fillet element ID if successful, empty string if failed
         """
-        print(f"🔵 Adding fillet to sketch {sketch_id}: lines {line1_id} & {line2_id} radius={radius}")
+        logger.debug("Adding fillet to sketch %s: lines %s & %s radius=%s", sketch_id, line1_id, line2_id, radius)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         if radius <= 0:
-            print(f"❌ Fillet radius must be positive, got {radius}")
+            logger.warning("Fillet radius must be positive, got %s", radius)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Add fillet to sketch
             fillet_id = sketch.add_fillet(line1_id, line2_id, radius)
             
             if fillet_id:
-                print(f"✅ Added fillet {fillet_id} to sketch {sketch_id}")
+                logger.debug("Added fillet %s to sketch %s", fillet_id, sketch_id)
             else:
-                print(f"❌ Failed to add fillet to sketch {sketch_id}")
+                logger.warning("Failed to add fillet to sketch %s", sketch_id)
             
             return fillet_id
             
         except Exception as e:
-            print(f"❌ Error adding fillet to sketch: {e}")
+            logger.warning("Error adding fillet to sketch: %s", e)
             return ""
     
     def add_chamfer_to_sketch(self, sketch_id: str, line1_id: str, line2_id: str, distance: float) -> str:
@@ -3357,31 +4028,30 @@ class OCCTEngine:
         Returns:
             Chamfer element ID if successful, empty string if failed
         """
-        print(f"🔸 Adding chamfer to sketch {sketch_id}: lines {line1_id} & {line2_id} distance={distance}")
+        logger.debug("Adding chamfer to sketch %s: lines %s & %s distance=%s", sketch_id, line1_id, line2_id, distance)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         if distance <= 0:
-            print(f"❌ Chamfer distance must be positive, got {distance}")
+            logger.warning("Chamfer distance must be positive, got %s", distance)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Add chamfer to sketch
             chamfer_id = sketch.add_chamfer(line1_id, line2_id, distance)
             
             if chamfer_id:
-                print(f"✅ Added chamfer {chamfer_id} to sketch {sketch_id}")
+                logger.debug("Added chamfer %s to sketch %s", chamfer_id, sketch_id)
             else:
-                print(f"❌ Failed to add chamfer to sketch {sketch_id}")
+                logger.warning("Failed to add chamfer to sketch %s", sketch_id)
             
             return chamfer_id
 
         except Exception as e:
-            print(f"❌ Error adding chamfer to sketch: {e}")
+            logger.warning("Error adding chamfer to sketch: %s", e)
             return ""
 
     def delete_element_from_sketch(self, sketch_id: str, element_id: str) -> bool:
@@ -3395,25 +4065,25 @@ class OCCTEngine:
         Returns:
             True if element was deleted, False otherwise
         """
-        print(f"🗑️ Deleting element {element_id} from sketch {sketch_id}")
+        logger.debug("Deleting element %s from sketch %s", element_id, sketch_id)
 
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
 
         try:
-            sketch = self.sketches[sketch_id]
             success = sketch.remove_element(element_id)
 
             if success:
-                print(f"✅ Successfully deleted element {element_id} from sketch {sketch_id}")
+                logger.debug("Successfully deleted element %s from sketch %s", element_id, sketch_id)
             else:
-                print(f"❌ Failed to delete element {element_id} from sketch {sketch_id}")
+                logger.warning("Failed to delete element %s from sketch %s", element_id, sketch_id)
 
             return success
 
         except Exception as e:
-            print(f"❌ Error deleting element from sketch: {e}")
+            logger.warning("Error deleting element from sketch: %s", e)
             return False
 
     def trim_line_to_line_in_sketch(self, sketch_id: str, line_to_trim_id: str, cutting_line_id: str, keep_start: bool = True) -> bool:
@@ -3429,27 +4099,26 @@ class OCCTEngine:
         Returns:
             True if successful, False if failed
         """
-        print(f"✂️ Trimming line {line_to_trim_id} to line {cutting_line_id} in sketch {sketch_id}")
+        logger.debug("Trimming line %s to line %s in sketch %s", line_to_trim_id, cutting_line_id, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform trim operation
             success = sketch.trim_line_to_line(line_to_trim_id, cutting_line_id, keep_start)
             
             if success:
-                print(f"✅ Successfully trimmed line {line_to_trim_id} in sketch {sketch_id}")
+                logger.debug("Successfully trimmed line %s in sketch %s", line_to_trim_id, sketch_id)
             else:
-                print(f"❌ Failed to trim line {line_to_trim_id} in sketch {sketch_id}")
+                logger.warning("Failed to trim line %s in sketch %s", line_to_trim_id, sketch_id)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error trimming line in sketch: {e}")
+            logger.warning("Error trimming line in sketch: %s", e)
             return False
     
     def trim_line_to_geometry_in_sketch(self, sketch_id: str, line_to_trim_id: str, cutting_geometry_id: str, keep_start: bool = True) -> bool:
@@ -3465,27 +4134,26 @@ class OCCTEngine:
         Returns:
             True if successful, False if failed
         """
-        print(f"✂️ Trimming line {line_to_trim_id} to geometry {cutting_geometry_id} in sketch {sketch_id}")
+        logger.debug("Trimming line %s to geometry %s in sketch %s", line_to_trim_id, cutting_geometry_id, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform trim operation
             success = sketch.trim_line_to_geometry(line_to_trim_id, cutting_geometry_id, keep_start)
             
             if success:
-                print(f"✅ Successfully trimmed line {line_to_trim_id} to geometry in sketch {sketch_id}")
+                logger.debug("Successfully trimmed line %s to geometry in sketch %s", line_to_trim_id, sketch_id)
             else:
-                print(f"❌ Failed to trim line {line_to_trim_id} to geometry in sketch {sketch_id}")
+                logger.warning("Failed to trim line %s to geometry in sketch %s", line_to_trim_id, sketch_id)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error trimming line to geometry in sketch: {e}")
+            logger.warning("Error trimming line to geometry in sketch: %s", e)
             return False
     
     def extend_line_to_line_in_sketch(self, sketch_id: str, line_to_extend_id: str, target_line_id: str, extend_start: bool = False) -> bool:
@@ -3501,27 +4169,26 @@ class OCCTEngine:
         Returns:
             True if successful, False if failed
         """
-        print(f"📏 Extending line {line_to_extend_id} to line {target_line_id} in sketch {sketch_id}")
+        logger.debug("Extending line %s to line %s in sketch %s", line_to_extend_id, target_line_id, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform extend operation
             success = sketch.extend_line_to_line(line_to_extend_id, target_line_id, extend_start)
             
             if success:
-                print(f"✅ Successfully extended line {line_to_extend_id} in sketch {sketch_id}")
+                logger.debug("Successfully extended line %s in sketch %s", line_to_extend_id, sketch_id)
             else:
-                print(f"❌ Failed to extend line {line_to_extend_id} in sketch {sketch_id}")
+                logger.warning("Failed to extend line %s in sketch %s", line_to_extend_id, sketch_id)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error extending line in sketch: {e}")
+            logger.warning("Error extending line in sketch: %s", e)
             return False
     
     def extend_line_to_geometry_in_sketch(self, sketch_id: str, line_to_extend_id: str, target_geometry_id: str, extend_start: bool = False) -> bool:
@@ -3537,27 +4204,26 @@ class OCCTEngine:
         Returns:
             True if successful, False if failed
         """
-        print(f"📏 Extending line {line_to_extend_id} to geometry {target_geometry_id} in sketch {sketch_id}")
+        logger.debug("Extending line %s to geometry %s in sketch %s", line_to_extend_id, target_geometry_id, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform extend operation
             success = sketch.extend_line_to_geometry(line_to_extend_id, target_geometry_id, extend_start)
             
             if success:
-                print(f"✅ Successfully extended line {line_to_extend_id} to geometry in sketch {sketch_id}")
+                logger.debug("Successfully extended line %s to geometry in sketch %s", line_to_extend_id, sketch_id)
             else:
-                print(f"❌ Failed to extend line {line_to_extend_id} to geometry in sketch {sketch_id}")
+                logger.warning("Failed to extend line %s to geometry in sketch %s", line_to_extend_id, sketch_id)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error extending line to geometry in sketch: {e}")
+            logger.warning("Error extending line to geometry in sketch: %s", e)
             return False
     
     def get_sketch_element_visualization_data(self, sketch_id: str, element_id: str) -> Optional[Dict[str, Any]]:
@@ -3569,24 +4235,49 @@ class OCCTEngine:
             element_id: Element identifier
             
         Returns:
-            Visualization data dictionary or None if not found
+            Visualization data dictionary or None if not found. Results are cached
+            per element; the cache keeps a private copy and every call returns fresh
+            lists and dicts, so callers may modify what they get back.
         """
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found for element visualization: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found for element visualization: %s", sketch_id)
+            return None
+        
+        element = sketch.get_element_by_id(element_id)
+        if not element:
+            logger.warning("Element not found: %s", element_id)
             return None
         
+        # Edits assign new point objects rather than mutating them, so point
+        # identity plus the parameter values tells whether an entry is stale
+        points = (element.start_point, element.end_point, element.center_point)
+        values = (tuple(element.parameters or ()), element.is_container_only, tuple(element.child_ids or ()))
+        cache_key = (sketch_id, element_id)
+        cached = self._element_viz_cache.get(cache_key)
+        if (cached is not None and cached[0] is element and cached[2] == values
+                and all(old is new for old, new in zip(cached[1], points))):
+            self._element_viz_cache.move_to_end(cache_key)
+            return _copy_visualization_data(cached[3])
+        
+        viz_data = self._build_element_visualization_data(sketch, element)
+        if viz_data is None:
+            return None
+        
+        self._element_viz_cache[cache_key] = (element, points, values, _copy_visualization_data(viz_data))
+        if len(self._element_viz_cache) > ELEMENT_VIZ_CACHE_SIZE:
+            self._element_viz_cache.popitem(last=False)
+        return viz_data
+    
+    def _build_element_visualization_data(self, sketch: 'Sketch', element: SketchElement) -> Optional[Dict[str, Any]]:
+        """Build the visualization data dict for one sketch element"""
+        sketch_id = sketch.sketch_id
+        element_id = element.id
         try:
-            sketch = self.sketches[sketch_id]
-            element = sketch.get_element_by_id(element_id)
-            
-            if not element:
-                print(f"❌ Element not found: {element_id}")
-                return None
-            
             # Handle container-only elements (composite parents)
             # They exist in the scene tree for organization but are not rendered
             if element.is_container_only:
-                print(f"📦 Generating metadata for container-only element: {element_id}")
+                logger.debug("Generating metadata for container-only element: %s", element_id)
                 
                 # Return basic element metadata for scene tree (without 3D visualization data)
                 container_data = {
@@ -3627,22 +4318,20 @@ class OCCTEngine:
             }
             
             # Convert 2D points to 3D world coordinates
-            points_3d: List[float] = []
+            points_3d: List[float]
             parameters_2d: Dict[str, float] = {}
             
             if element.element_type == SketchElementType.LINE:
                 # Validate that we have start and end points for line
                 if element.start_point is None or element.end_point is None:
-                    print(f"❌ Line element {element_id} missing start or end point")
+                    logger.warning("Line element %s missing start or end point", element_id)
                     return None
                 
                 # Convert start and end points to 3D using plane coordinate system
-                start_3d = self._convert_2d_to_3d(element.start_point, plane)
-                end_3d = self._convert_2d_to_3d(element.end_point, plane)
-                
-                # Add 3D points (start and end for line)
-                points_3d.extend([start_3d.x, start_3d.y, start_3d.z])
-                points_3d.extend([end_3d.x, end_3d.y, end_3d.z])
+                points_3d = self._plane_coords_to_3d([
+                    (element.start_point.X(), element.start_point.Y()),
+                    (element.end_point.X(), element.end_point.Y())
+                ], plane)
                 
                 # Store 2D parameters
                 parameters_2d = {
@@ -3655,22 +4344,19 @@ class OCCTEngine:
             elif element.element_type == SketchElementType.CIRCLE:
                 # Validate that we have center point and radius for circle
                 if element.center_point is None or not element.parameters or len(element.parameters) < 1:
-                    print(f"❌ Circle element {element_id} missing center point or radius")
+                    logger.warning("Circle element %s missing center point or radius", element_id)
                     return None
                 
                 # Generate circle points (16 segments for smooth visualization)
-                center_3d = self._convert_2d_to_3d(element.center_point, plane)
                 radius = element.parameters[0]
                 
                 segments = 16
-                for i in range(segments + 1):  # +1 to close the circle
-                    angle = 2.0 * math.pi * i / segments
-                    circle_pt_2d = gp_Pnt2d(
-                        element.center_point.X() + radius * math.cos(angle),
-                        element.center_point.Y() + radius * math.sin(angle)
-                    )
-                    circle_3d = self._convert_2d_to_3d(circle_pt_2d, plane)
-                    points_3d.extend([circle_3d.x, circle_3d.y, circle_3d.z])
+                cos_t, sin_t = _unit_circle_samples(segments)  # segments + 1 samples close the circle
+                points_3d = self._plane_points_to_3d(
+                    element.center_point.X() + radius * cos_t,
+                    element.center_point.Y() + radius * sin_t,
+                    plane
+                )
                 
                 # Store 2D parameters
                 parameters_2d = {
@@ -3682,7 +4368,7 @@ class OCCTEngine:
             elif element.element_type == SketchElementType.RECTANGLE:
                 # Validate that we have corner point and dimensions for rectangle
                 if element.start_point is None or not element.parameters or len(element.parameters) < 2:
-                    print(f"❌ Rectangle element {element_id} missing corner point or dimensions")
+                    logger.warning("Rectangle element %s missing corner point or dimensions", element_id)
                     return None
                 
                 # Generate rectangle corner points
@@ -3691,15 +4377,11 @@ class OCCTEngine:
                 height = element.parameters[1]
                 
                 # Calculate 4 corners in 2D
-                p1_2d = corner  # bottom-left
-                p2_2d = gp_Pnt2d(corner.X() + width, corner.Y())  # bottom-right
-                p3_2d = gp_Pnt2d(corner.X() + width, corner.Y() + height)  # top-right
-                p4_2d = gp_Pnt2d(corner.X(), corner.Y() + height)  # top-left
+                x0, y0 = corner.X(), corner.Y()
+                x1, y1 = x0 + width, y0 + height
                 
-                # Convert to 3D and add points for rectangle outline (closed loop)
-                for pt_2d in [p1_2d, p2_2d, p3_2d, p4_2d, p1_2d]:  # Close the loop
-                    pt_3d = self._convert_2d_to_3d(pt_2d, plane)
-                    points_3d.extend([pt_3d.x, pt_3d.y, pt_3d.z])
+                # Convert to 3D as a closed outline: bottom-left, bottom-right, top-right, top-left
+                points_3d = self._plane_coords_to_3d([(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)], plane)
                 
                 # Store 2D parameters
                 parameters_2d = {
@@ -3713,7 +4395,7 @@ class OCCTEngine:
                 # Validate that we have all arc parameters
                 if (element.start_point is None or element.end_point is None or 
                     element.center_point is None or not element.parameters or len(element.parameters) < 3):
-                    print(f"❌ Arc element {element_id} missing required parameters")
+                    logger.warning("Arc element %s missing required parameters", element_id)
                     return None
                 
                 # Generate arc points
@@ -3727,12 +4409,10 @@ class OCCTEngine:
 
                 # Calculate both possible angle spans (counterclockwise and clockwise)
                 # and choose the shorter path
-                ccw_span = end_angle - start_angle
-                if ccw_span < 0:
-                    ccw_span += 2 * math.pi
-                cw_span = start_angle - end_angle
-                if cw_span < 0:
-                    cw_span += 2 * math.pi
+                # Float modulo keeps both spans in [0, 2*pi) for angles of any magnitude
+                two_pi = 2 * math.pi
+                ccw_span = (end_angle - start_angle) % two_pi
+                cw_span = (start_angle - end_angle) % two_pi
 
                 # Use the shorter path (< 180° for any corner)
                 # Positive angle_span = counterclockwise, negative = clockwise
@@ -3742,16 +4422,12 @@ class OCCTEngine:
                     angle_span = -cw_span
 
                 # Generate arc points
-                for i in range(segments + 1):
-                    t = i / segments
-                    angle = start_angle + t * angle_span
-                    
-                    arc_pt_2d = gp_Pnt2d(
-                        center.X() + radius * math.cos(angle),
-                        center.Y() + radius * math.sin(angle)
-                    )
-                    arc_3d = self._convert_2d_to_3d(arc_pt_2d, plane)
-                    points_3d.extend([arc_3d.x, arc_3d.y, arc_3d.z])
+                angles = start_angle + np.linspace(0.0, 1.0, segments + 1) * angle_span
+                points_3d = self._plane_points_to_3d(
+                    center.X() + radius * np.cos(angles),
+                    center.Y() + radius * np.sin(angles),
+                    plane
+                )
                 
                 # Store 2D parameters
                 parameters_2d = {
@@ -3769,7 +4445,7 @@ class OCCTEngine:
             elif element.element_type == SketchElementType.POLYGON:
                 # Validate that we have center point and polygon parameters
                 if element.center_point is None or not element.parameters or len(element.parameters) < 2:
-                    print(f"❌ Polygon element {element_id} missing center point or parameters")
+                    logger.warning("Polygon element %s missing center point or parameters", element_id)
                     return None
                 
                 # Generate polygon corner points
@@ -3777,15 +4453,14 @@ class OCCTEngine:
                 radius = element.parameters[0]
                 sides = int(element.parameters[1])
                 
-                # Generate polygon vertices
-                for i in range(sides + 1):  # +1 to close the polygon
-                    angle = 2.0 * math.pi * i / sides
-                    vertex_2d = gp_Pnt2d(
-                        center.X() + radius * math.cos(angle),
-                        center.Y() + radius * math.sin(angle)
-                    )
-                    vertex_3d = self._convert_2d_to_3d(vertex_2d, plane)
-                    points_3d.extend([vertex_3d.x, vertex_3d.y, vertex_3d.z])
+                # Generate polygon vertices, repeating the first to close the polygon
+                unit = _unit_polygon_vertices(sides)
+                closed = np.vstack((unit, unit[:1]))
+                points_3d = self._plane_points_to_3d(
+                    center.X() + radius * closed[:, 0],
+                    center.Y() + radius * closed[:, 1],
+                    plane
+                )
                 
                 # Store 2D parameters
                 parameters_2d = {
@@ -3796,57 +4471,45 @@ class OCCTEngine:
                 }
             
             else:
-                print(f"❌ Unsupported element type for visualization: {element.element_type}")
+                logger.warning("Unsupported element type for visualization: %s", element.element_type)
                 return None
             
             viz_data["points_3d"] = points_3d
             viz_data["parameters_2d"] = parameters_2d
             
-            print(f"✅ Generated element visualization data for: {element_id}")
+            logger.debug("Generated element visualization data for: %s", element_id)
             return viz_data
             
-        except Exception as e:
-            print(f"❌ Error generating element visualization data: {e}")
+        except (Standard_Failure, ValueError) as e:
+            logger.warning("Error generating element visualization data: %s", e)
             return None
     
+    def _plane_coords_to_3d(self, coords: List[Tuple[float, float]], plane: 'SketchPlane') -> List[float]:
+        """Map a few (u, v) sketch coordinates onto the plane as a flat [x, y, z, ...] list"""
+        ox, oy, oz, ux, uy, uz, vx, vy, vz = plane.get_basis()
+        points = [0.0] * (3 * len(coords))
+        for i, (u, v) in enumerate(coords):
+            points[3 * i] = ox + u * ux + v * vx
+            points[3 * i + 1] = oy + u * uy + v * vy
+            points[3 * i + 2] = oz + u * uz + v * vz
+        return points
+    
+    def _plane_points_to_3d(self, xs: np.ndarray, ys: np.ndarray, plane: 'SketchPlane') -> List[float]:
+        """Map arrays of 2D sketch coordinates onto the plane as a flat [x, y, z, ...] list"""
+        ox, oy, oz, ux, uy, uz, vx, vy, vz = plane.get_basis()
+        points = np.empty((xs.shape[0], 3))
+        points[:, 0] = ox + xs * ux + ys * vx
+        points[:, 1] = oy + xs * uy + ys * vy
+        points[:, 2] = oz + xs * uz + ys * vz
+        return points.ravel().tolist()
+    
     def _convert_2d_to_3d(self, point_2d: gp_Pnt2d, plane: 'SketchPlane') -> Vector3d:
         """Convert 2D sketch point to 3D world coordinates"""
-        try:
-            # Get plane coordinate system
-            if plane.coordinate_system:
-                # Use the coordinate system to transform from 2D to 3D
-                origin = plane.get_origin()
-                
-                # Get local axes
-                x_dir = plane.coordinate_system.XDirection()
-                y_dir = plane.coordinate_system.YDirection()
-                
-                # Calculate 3D position: origin + u*x_axis + v*y_axis
-                u = point_2d.X()
-                v = point_2d.Y()
-                
-                world_x = origin.x + u * x_dir.X() + v * y_dir.X()
-                world_y = origin.y + u * x_dir.Y() + v * y_dir.Y()
-                world_z = origin.z + u * x_dir.Z() + v * y_dir.Z()
-                
-                return Vector3d(world_x, world_y, world_z)
-            else:
-                # Fallback: assume simple plane mapping
-                origin = plane.get_origin()
-                plane_type = plane.get_plane_type()
-                
-                if plane_type == "XY":
-                    return Vector3d(origin.x + point_2d.X(), origin.y + point_2d.Y(), origin.z)
-                elif plane_type == "XZ":
-                    return Vector3d(origin.x + point_2d.X(), origin.y, origin.z + point_2d.Y())
-                elif plane_type == "YZ":
-                    return Vector3d(origin.x, origin.y + point_2d.X(), origin.z + point_2d.Y())
-                else:
-                    return Vector3d(origin.x + point_2d.X(), origin.y + point_2d.Y(), origin.z)
-                    
-        except Exception as e:
-            print(f"❌ Error converting 2D to 3D point: {e}")
-            return Vector3d()
+        # origin + u*u_axis + v*v_axis, from the plane's cached float basis
+        ox, oy, oz, ux, uy, uz, vx, vy, vz = plane.get_basis()
+        u = point_2d.X()
+        v = point_2d.Y()
+        return Vector3d(ox + u * ux + v * vx, oy + u * uy + v * vy, oz + u * uz + v * vz)
     
     def _find_closed_boundary_for_composite(self, sketch: 'Sketch', composite_element: SketchElement) -> List[SketchElement]:
         """
@@ -3854,7 +4517,7 @@ class OCCTEngine:
         This includes child elements and any connected elements like fillets/arcs.
         """
         try:
-            print(f"🔍 Finding closed boundary for composite element {composite_element.id}")
+            logger.debug("Finding closed boundary for composite element %s", composite_element.id)
             
             # Get all child elements
             child_elements = []
@@ -3864,7 +4527,7 @@ class OCCTEngine:
                     child_elements.append(child)
             
             if not child_elements:
-                print(f"❌ No child elements found for composite {composite_element.id}")
+                logger.warning("No child elements found for composite %s", composite_element.id)
                 return []
             
             # Find all elements that are topologically connected to the child elements
@@ -3887,7 +4550,7 @@ class OCCTEngine:
                         # Check if this element connects to any child element endpoint
                         if self._elements_are_connected(child, element, tolerance):
                             connected_elements.add(element.id)
-                            print(f"🔗 Found connected element: {element.id} (type: {element.element_type.value})")
+                            logger.debug("Found connected element: %s (type: %s)", element.id, element.element_type.value)
             
             # Build ordered list of boundary elements
             boundary_elements = []
@@ -3898,11 +4561,11 @@ class OCCTEngine:
             if child_elements:
                 boundary_elements = self._order_boundary_elements(sketch, element_ids, tolerance)
             
-            print(f"✅ Found {len(boundary_elements)} boundary elements for composite {composite_element.id}")
+            logger.debug("Found %s boundary elements for composite %s", len(boundary_elements), composite_element.id)
             return boundary_elements
             
         except Exception as e:
-            print(f"❌ Error finding closed boundary for composite: {e}")
+            logger.warning("Error finding closed boundary for composite: %s", e)
             return []
     
     def _elements_are_connected(self, elem1: SketchElement, elem2: SketchElement, tolerance: float = 1e-6) -> bool:
@@ -3957,6 +4620,18 @@ class OCCTEngine:
         """Check if shape exists - equivalent to C++ shapeExists"""
         return shape_id in self.shapes
 
+    def validate_shape(self, shape_id: str) -> bool:
+        """
+        Run the full BRepCheck_Analyzer check on a stored shape on demand
+        
+        Returns:
+            True if the shape exists and is topologically valid, False otherwise
+        """
+        shape = self.shapes.get(shape_id)
+        if shape is None:
+            return False
+        return self._validate_shape(shape)
+
     def get_bounding_box(self, shape_id: str) -> Optional[Dict[str, List[float]]]:
         """
         Calculate the bounding box of a shape.
@@ -3971,9 +4646,7 @@ class OCCTEngine:
             return None
 
         try:
-            shape = self.shapes[shape_id]
-            bbox = Bnd_Box()
-            brepbndlib_Add(shape, bbox)
+            bbox = self._bounding_box(self.shapes[shape_id])
 
             xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
 
@@ -3982,7 +4655,7 @@ class OCCTEngine:
                 "max": [xmax, ymax, zmax]
             }
         except Exception as e:
-            print(f"❌ Error calculating bounding box for {shape_id}: {e}")
+            logger.warning("Error calculating bounding box for %s: %s", shape_id, e)
             return None
 
     def get_all_shapes_bounding_box(self) -> Dict[str, List[float]]:
@@ -3998,7 +4671,7 @@ class OCCTEngine:
         try:
             combined_bbox = Bnd_Box()
             for shape in self.shapes.values():
-                brepbndlib_Add(shape, combined_bbox)
+                combined_bbox.Add(self._bounding_box(shape))
 
             xmin, ymin, zmin, xmax, ymax, zmax = combined_bbox.Get()
 
@@ -4007,14 +4680,37 @@ class OCCTEngine:
                 "max": [xmax, ymax, zmax]
             }
         except Exception as e:
-            print(f"❌ Error calculating combined bounding box: {e}")
+            logger.warning("Error calculating combined bounding box: %s", e)
             return {"min": [0.0, 0.0, 0.0], "max": [0.0, 0.0, 0.0]}
 
     def remove_shape(self, shape_id: str) -> None:
         """Remove shape - equivalent to C++ removeShape"""
         if shape_id in self.shapes:
+            self._validity_cache.pop(self.shapes[shape_id], None)
+            self._bbox_cache.pop(self.shapes[shape_id], None)
+            for key in [key for key in self._mesh_cache if key[0] == shape_id]:
+                del self._mesh_cache[key]
             del self.shapes[shape_id]
     
+    def snapshot_shapes(self) -> Dict[str, TopoDS_Shape]:
+        """Shallow copy of the shape table, for restore_shapes"""
+        return dict(self.shapes)
+    
+    def restore_shapes(self, snapshot: Dict[str, TopoDS_Shape]) -> None:
+        """
+        Return the shape table to a snapshot from snapshot_shapes
+        
+        Shapes added since are removed; ids that were overwritten get their
+        earlier shape back. Caches are keyed by shape identity, so entries for
+        restored shapes stay valid.
+        """
+        for shape_id in [shape_id for shape_id in self.shapes if shape_id not in snapshot]:
+            self.remove_shape(shape_id)
+        for shape_id, shape in snapshot.items():
+            if self.shapes.get(shape_id) is not shape:
+                self.remove_shape(shape_id)
+                self.shapes[shape_id] = shape
+    
     def clear_all(self) -> None:
         """Clear all data - equivalent to C++ clearAll"""
         self.shapes.clear()
@@ -4022,6 +4718,14 @@ class OCCTEngine:
         self.sketch_planes.clear()
         self.sketches.clear()
         self.extrude_features.clear()
+        self._next_shape_id = 1
+        self._next_plane_id = 1
+        self._next_sketch_id = 1
+        self._validity_cache.clear()
+        self._bbox_cache.clear()
+        self._element_viz_cache.clear()
+        self._mesh_cache.clear()
+        self._mirror_line_cache.clear()
     
     def get_available_shape_ids(self) -> List[str]:
         """Get list of shape IDs - equivalent to C++ getAvailableShapeIds"""
@@ -4040,58 +4744,66 @@ class OCCTEngine:
     
     # ==================== PRIVATE METHODS ====================
     
+    def _quick_validate(self, shape: TopoDS_Shape) -> bool:
+        """Null check only - for OCCT primitives, which are valid by construction"""
+        return not shape.IsNull()
+    
+    def _validate_primitive(self, shape: TopoDS_Shape) -> bool:
+        """Validate a BRepPrimAPI result - full check only under strict_validation"""
+        if self.strict_validation:
+            return self._validate_shape(shape)
+        return self._quick_validate(shape)
+    
     def _validate_shape(self, shape: TopoDS_Shape) -> bool:
         """Validate shape - equivalent to C++ validateShape"""
         if shape.IsNull():
             return False
         
+        cached = self._validity_cache.get(shape)
+        if cached is not None:
+            self._validity_cache.move_to_end(shape)
+            return cached
+        
         try:
             analyzer = BRepCheck_Analyzer(shape)
-            return analyzer.IsValid()
-        except:
+            is_valid = analyzer.IsValid()
+        except (Standard_Failure, RuntimeError):
             return False
+        
+        self._validity_cache[shape] = is_valid
+        if len(self._validity_cache) > VALIDITY_CACHE_SIZE:
+            self._validity_cache.popitem(last=False)
+        return is_valid
     
     def _generate_shape_id(self) -> str:
         """Generate unique shape ID - equivalent to C++ generateShapeId"""
-        return f"shape_{''.join(random.choices(string.digits, k=4))}"
+        # Skip ids a caller already used (e.g. as a boolean result_id)
+        while f"shape_{self._next_shape_id}" in self.shapes:
+            self._next_shape_id += 1
+        
+        shape_id = f"shape_{self._next_shape_id}"
+        self._next_shape_id += 1
+        return shape_id
     
     def _generate_unique_plane_id(self) -> str:
         """Generate unique plane ID using sequential numbering"""
-        # Extract existing plane numbers
-        existing_numbers = set()
-        for plane_id in self.sketch_planes.keys():
-            if plane_id.startswith("plane_"):
-                try:
-                    number = int(plane_id.split("_")[1])
-                    existing_numbers.add(number)
-                except (IndexError, ValueError):
-                    continue
-        
-        # Find the first available number starting from 1
-        counter = 1
-        while counter in existing_numbers:
-            counter += 1
+        # Skip past any ids that were registered directly under the plane_N form
+        while f"plane_{self._next_plane_id}" in self.sketch_planes:
+            self._next_plane_id += 1
         
-        return f"plane_{counter}"
+        plane_id = f"plane_{self._next_plane_id}"
+        self._next_plane_id += 1
+        return plane_id
     
     def _generate_unique_sketch_id(self) -> str:
         """Generate unique sketch ID using sequential numbering"""
-        # Extract existing sketch numbers
-        existing_numbers = set()
-        for sketch_id in self.sketches.keys():
-            if sketch_id.startswith("sketch_"):
-                try:
-                    number = int(sketch_id.split("_")[1])
-                    existing_numbers.add(number)
-                except (IndexError, ValueError):
-                    continue
-        
-        # Find the first available number starting from 1
-        counter = 1
-        while counter in existing_numbers:
-            counter += 1
+        # Skip past any ids that were registered directly under the sketch_N form
+        while f"sketch_{self._next_sketch_id}" in self.sketches:
+            self._next_sketch_id += 1
         
-        return f"sketch_{counter}" 
+        sketch_id = f"sketch_{self._next_sketch_id}"
+        self._next_sketch_id += 1
+        return sketch_id
     
     def mirror_elements_in_sketch(self, sketch_id: str, element_ids: List[str], mirror_line_id: str, keep_original: bool = True) -> List[str]:
         """
@@ -4106,27 +4818,47 @@ class OCCTEngine:
         Returns:
             List of new mirrored element IDs
         """
-        print(f"🪞 Mirroring {len(element_ids)} elements across line {mirror_line_id} in sketch {sketch_id}")
+        logger.debug("Mirroring %s elements across line %s in sketch %s", len(element_ids), mirror_line_id, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return []
         
         try:
-            sketch = self.sketches[sketch_id]
+            mirror_line = sketch.get_element_by_id(mirror_line_id)
+            if not mirror_line or mirror_line.element_type != SketchElementType.LINE:
+                logger.warning("Mirror line %s not found or not a line", mirror_line_id)
+                return []
+            
+            start, end = mirror_line.start_point, mirror_line.end_point
+            if not start or not end:
+                logger.warning("Mirror line %s missing start or end point", mirror_line_id)
+                return []
+            
+            cache_key = (sketch_id, mirror_line_id)
+            cached = self._mirror_line_cache.get(cache_key)
+            if cached is not None and cached[0] is start and cached[1] is end:
+                reflection = cached[2]
+            else:
+                reflection = sketch._calculate_reflection_from_coordinates(start.X(), start.Y(), end.X(), end.Y())
+                if not reflection:
+                    logger.warning("Could not calculate mirror line equation")
+                    return []
+                self._mirror_line_cache[cache_key] = (start, end, reflection)
             
             # Perform mirror operation
-            mirrored_ids = sketch.mirror_elements(element_ids, mirror_line_id, keep_original)
+            mirrored_ids = sketch.mirror_elements_by_reflection(element_ids, reflection, keep_original)
             
             if mirrored_ids:
-                print(f"✅ Successfully mirrored {len(mirrored_ids)} elements in sketch {sketch_id}")
+                logger.debug("Successfully mirrored %s elements in sketch %s", len(mirrored_ids), sketch_id)
             else:
-                print(f"❌ Failed to mirror elements in sketch {sketch_id}")
+                logger.warning("Failed to mirror elements in sketch %s", sketch_id)
             
             return mirrored_ids
             
         except Exception as e:
-            print(f"❌ Error mirroring elements in sketch: {e}")
+            logger.warning("Error mirroring elements in sketch: %s", e)
             return []
     
     def mirror_elements_by_two_points_in_sketch(self, sketch_id: str, element_ids: List[str], 
@@ -4145,31 +4877,32 @@ class OCCTEngine:
         Returns:
             List of new mirrored element IDs
         """
-        print(f"🪞 Mirroring {len(element_ids)} elements across line defined by two points in sketch {sketch_id}")
+        logger.debug("Mirroring %s elements across line defined by two points in sketch %s", len(element_ids), sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return []
         
         try:
-            sketch = self.sketches[sketch_id]
-            
-            # Create 2D points
-            point1 = gp_Pnt2d(x1, y1)
-            point2 = gp_Pnt2d(x2, y2)
+            # Compute the reflection straight from the coordinates
+            reflection = sketch._calculate_reflection_from_coordinates(x1, y1, x2, y2)
+            if not reflection:
+                logger.warning("Could not calculate mirror line equation from points")
+                return []
             
             # Perform mirror operation
-            mirrored_ids = sketch.mirror_elements_by_two_points(element_ids, point1, point2, keep_original)
+            mirrored_ids = sketch.mirror_elements_by_reflection(element_ids, reflection, keep_original)
             
             if mirrored_ids:
-                print(f"✅ Successfully mirrored {len(mirrored_ids)} elements in sketch {sketch_id}")
+                logger.debug("Successfully mirrored %s elements in sketch %s", len(mirrored_ids), sketch_id)
             else:
-                print(f"❌ Failed to mirror elements in sketch {sketch_id}")
+                logger.warning("Failed to mirror elements in sketch %s", sketch_id)
             
             return mirrored_ids
             
         except Exception as e:
-            print(f"❌ Error mirroring elements by two points in sketch: {e}")
+            logger.warning("Error mirroring elements by two points in sketch: %s", e)
             return []
     
     def offset_element_in_sketch(self, sketch_id: str, element_id: str, offset_distance: float) -> str:
@@ -4184,27 +4917,26 @@ class OCCTEngine:
         Returns:
             New offset element ID if successful, empty string if failed
         """
-        print(f"📐 Offsetting element {element_id} by distance {offset_distance} in sketch {sketch_id}")
+        logger.debug("Offsetting element %s by distance %s in sketch %s", element_id, offset_distance, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform offset operation
             offset_element_id = sketch.offset_element(element_id, offset_distance)
             
             if offset_element_id:
-                print(f"✅ Successfully offset element {element_id} in sketch {sketch_id}")
+                logger.debug("Successfully offset element %s in sketch %s", element_id, sketch_id)
             else:
-                print(f"❌ Failed to offset element {element_id} in sketch {sketch_id}")
+                logger.warning("Failed to offset element %s in sketch %s", element_id, sketch_id)
             
             return offset_element_id
             
         except Exception as e:
-            print(f"❌ Error offsetting element in sketch: {e}")
+            logger.warning("Error offsetting element in sketch: %s", e)
             return ""
     
     def offset_element_directional_in_sketch(self, sketch_id: str, element_id: str, offset_distance: float, direction: str) -> str:
@@ -4220,27 +4952,31 @@ class OCCTEngine:
         Returns:
             New offset element ID if successful, empty string if failed
         """
-        print(f"📐 Offsetting element {element_id} directionally ({direction}) by distance {offset_distance} in sketch {sketch_id}")
+        logger.debug("Offsetting element %s directionally (%s) by distance %s in sketch %s", element_id, direction, offset_distance, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        direction_code = OFFSET_DIRECTION_CODES.get(direction.lower())
+        if direction_code is None:
+            logger.warning("Invalid direction: %s. Use 'left' or 'right'", direction)
+            return ""
+        
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return ""
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform directional offset operation
-            offset_element_id = sketch.offset_element_directional(element_id, offset_distance, direction)
+            offset_element_id = sketch.offset_element_directional_code(element_id, offset_distance, direction_code)
             
             if offset_element_id:
-                print(f"✅ Successfully offset element {element_id} directionally in sketch {sketch_id}")
+                logger.debug("Successfully offset element %s directionally in sketch %s", element_id, sketch_id)
             else:
-                print(f"❌ Failed to offset element {element_id} directionally in sketch {sketch_id}")
+                logger.warning("Failed to offset element %s directionally in sketch %s", element_id, sketch_id)
             
             return offset_element_id
             
         except Exception as e:
-            print(f"❌ Error offsetting element directionally in sketch: {e}")
+            logger.warning("Error offsetting element directionally in sketch: %s", e)
             return ""
     
     def copy_element_in_sketch(self, sketch_id: str, element_id: str, num_copies: int, direction_x: float, direction_y: float, distance: float) -> List[str]:
@@ -4258,27 +4994,26 @@ class OCCTEngine:
         Returns:
             List of new copied element IDs
         """
-        print(f"📄 Copying element {element_id} {num_copies} times in sketch {sketch_id}")
+        logger.debug("Copying element %s %s times in sketch %s", element_id, num_copies, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return []
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform copy operation
             copied_element_ids = sketch.copy_element(element_id, num_copies, direction_x, direction_y, distance)
             
             if copied_element_ids:
-                print(f"✅ Successfully copied element {element_id} {len(copied_element_ids)} times in sketch {sketch_id}")
+                logger.debug("Successfully copied element %s %s times in sketch %s", element_id, len(copied_element_ids), sketch_id)
             else:
-                print(f"❌ Failed to copy element {element_id} in sketch {sketch_id}")
+                logger.warning("Failed to copy element %s in sketch %s", element_id, sketch_id)
             
             return copied_element_ids
             
         except Exception as e:
-            print(f"❌ Error copying element in sketch: {e}")
+            logger.warning("Error copying element in sketch: %s", e)
             return []
     
     def move_element_in_sketch(self, sketch_id: str, element_id: str, direction_x: float, direction_y: float, distance: float) -> bool:
@@ -4295,27 +5030,26 @@ class OCCTEngine:
         Returns:
             True if successful, False if failed
         """
-        print(f"➡️ Moving element {element_id} in sketch {sketch_id}")
+        logger.debug("Moving element %s in sketch %s", element_id, sketch_id)
         
-        if not self.sketch_exists(sketch_id):
-            print(f"❌ Sketch not found: {sketch_id}")
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
+            logger.warning("Sketch not found: %s", sketch_id)
             return False
         
         try:
-            sketch = self.sketches[sketch_id]
-            
             # Perform move operation
             success = sketch.move_element(element_id, direction_x, direction_y, distance)
             
             if success:
-                print(f"✅ Successfully moved element {element_id} in sketch {sketch_id}")
+                logger.debug("Successfully moved element %s in sketch %s", element_id, sketch_id)
             else:
-                print(f"❌ Failed to move element {element_id} in sketch {sketch_id}")
+                logger.warning("Failed to move element %s in sketch %s", element_id, sketch_id)
             
             return success
             
         except Exception as e:
-            print(f"❌ Error moving element in sketch: {e}")
+            logger.warning("Error moving element in sketch: %s", e)
             return False
 
     # ==================== ARRAY/PATTERN OPERATIONS ====================
@@ -4335,9 +5069,10 @@ class OCCTEngine:
         Returns:
             Dict with array_id and element_ids of all created copies
         """
-        print(f"📊 Creating linear array of {element_id} with {count} elements in sketch {sketch_id}")
+        logger.debug("Creating linear array of %s with %s elements in sketch %s", element_id, count, sketch_id)
 
-        if not self.sketch_exists(sketch_id):
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
             raise ValueError(f"Sketch not found: {sketch_id}")
 
         if count < 2:
@@ -4347,8 +5082,6 @@ class OCCTEngine:
             raise ValueError(f"Array spacing must be positive, got {spacing}")
 
         try:
-            sketch = self.sketches[sketch_id]
-
             # Normalize direction vector
             magnitude = math.sqrt(direction_x**2 + direction_y**2)
             if magnitude < 1e-10:
@@ -4372,7 +5105,7 @@ class OCCTEngine:
                 if viz_data:
                     visualization_data_list.append(viz_data)
 
-            print(f"✅ Linear array created: {array_id} with {len(copied_ids)} copies")
+            logger.debug("Linear array created: %s with %s copies", array_id, len(copied_ids))
 
             return {
                 "array_id": array_id,
@@ -4386,7 +5119,7 @@ class OCCTEngine:
             }
 
         except Exception as e:
-            print(f"❌ Error creating linear array in sketch: {e}")
+            logger.warning("Error creating linear array in sketch: %s", e)
             raise
 
     def create_mirror_array_in_sketch(self, sketch_id: str, element_ids: List[str], mirror_x1: float, mirror_y1: float, mirror_x2: float, mirror_y2: float, keep_original: bool = True) -> Dict[str, Any]:
@@ -4403,7 +5136,7 @@ class OCCTEngine:
         Returns:
             Dict with array_id and mirrored element IDs
         """
-        print(f"🪞 Creating mirror array of {len(element_ids)} elements in sketch {sketch_id}")
+        logger.debug("Creating mirror array of %s elements in sketch %s", len(element_ids), sketch_id)
 
         if not self.sketch_exists(sketch_id):
             raise ValueError(f"Sketch not found: {sketch_id}")
@@ -4433,7 +5166,7 @@ class OCCTEngine:
                 if viz_data:
                     visualization_data_list.append(viz_data)
 
-            print(f"✅ Mirror array created: {array_id} with {len(mirrored_ids)} mirrored elements")
+            logger.debug("Mirror array created: %s with %s mirrored elements", array_id, len(mirrored_ids))
 
             return {
                 "array_id": array_id,
@@ -4449,7 +5182,7 @@ class OCCTEngine:
             }
 
         except Exception as e:
-            print(f"❌ Error creating mirror array in sketch: {e}")
+            logger.warning("Error creating mirror array in sketch: %s", e)
             raise
 
     # ==================== 3D FEATURE CREATION ====================
@@ -4458,12 +5191,11 @@ class OCCTEngine:
         """
         Extrude a sketch element to create a 3D feature.
         """
-        print(f"🚀 Extruding sketch: {sketch_id} distance: {distance}")
+        logger.debug("Extruding sketch: %s distance: %s", sketch_id, distance)
 
-        if not self.sketch_exists(sketch_id):
+        sketch = self.sketches.get(sketch_id)
+        if sketch is None:
             raise ValueError(f"Sketch not found: {sketch_id}")
-
-        sketch = self.sketches[sketch_id]
         
         # Create a face from the specified sketch element (or the whole sketch if element_id is None)
         face_to_extrude = self.get_face_from_sketch(sketch, element_id)
@@ -4493,7 +5225,7 @@ class OCCTEngine:
         # CRITICAL FIX: Also store in main shapes dict for boolean ops and tessellation
         self.shapes[feature_id] = body
 
-        print(f"✅ Extrude feature created: {feature_id}")
+        logger.debug("Extrude feature created: %s", feature_id)
 
         response_data = {
             "feature_id": feature.feature_id,
@@ -4504,16 +5236,7 @@ class OCCTEngine:
             # Re-use tessellation logic to generate mesh data for the new feature
             mesh_data = self.tessellate(body)
             if mesh_data and mesh_data.vertex_count > 0:
-                response_data["mesh_data"] = {
-                    "vertices": mesh_data.vertices,
-                    "faces": mesh_data.faces,
-                    "normals": mesh_data.normals,
-                    "metadata": {
-                        "vertex_count": mesh_data.vertex_count,
-                        "face_count": mesh_data.face_count,
-                        "tessellation_quality": mesh_data.tessellation_quality
-                    }
-                }
+                response_data["mesh_data"] = mesh_data.to_dict()
                 
         return response_data
 
@@ -4638,7 +5361,7 @@ class OCCTEngine:
             raise NotImplementedError(f"Extrusion for element type '{element.element_type.value}' is not yet supported.")
 
         if not wire_builder.IsDone():
-            print("❌ Failed to build wire from sketch element")
+            logger.warning("Failed to build wire from sketch element")
             return None
         
         wire = wire_builder.Wire()
@@ -4646,7 +5369,7 @@ class OCCTEngine:
         # Create a face from the wire
         face_builder = BRepBuilderAPI_MakeFace(plane, wire)
         if not face_builder.IsDone():
-            print("❌ Failed to build face from wire")
+            logger.warning("Failed to build face from wire")
             return None
             
         return face_builder.Face()
@@ -4,6 +4,7 @@ Main entry point for CAD Engine Server - Python version of main.cpp
 import os
 import sys
 import signal
+import threading
 from api_server import CADAPIServer
 from session_manager import SessionManager
 
@@ -11,18 +12,37 @@ from session_manager import SessionManager
 PORT = int(os.environ.get("PORT", 8080))
 HOST = os.environ.get("HOST", "0.0.0.0")
 
+# Seconds to wait for session cleanup before forcing exit
+SHUTDOWN_TIMEOUT = 5.0
+
+# Set by the first shutdown signal; a second signal exits immediately
+_SHUTTING_DOWN = threading.Event()
+
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully"""
+    if _SHUTTING_DOWN.is_set():
+        print(f"\n🛑 Received signal {signum} again, exiting immediately")
+        os._exit(1)
+    _SHUTTING_DOWN.set()
+    
     print(f"\n🛑 Received signal {signum}, shutting down gracefully...")
     
-    # Clean up sessions
-    try:
-        session_manager = SessionManager.get_instance()
-        session_manager.clear_all_sessions()
-        print("✅ Sessions cleaned up")
-    except Exception as e:
-        print(f"❌ Error cleaning up sessions: {e}")
+    # Clean up sessions on a worker thread so a hung engine can't block exit
+    def cleanup():
+        try:
+            session_manager = SessionManager.get_instance()
+            session_manager.clear_all_sessions()
+            print("✅ Sessions cleaned up")
+        except Exception as e:
+            print(f"❌ Error cleaning up sessions: {e}")
+    
+    cleanup_thread = threading.Thread(target=cleanup, daemon=True)
+    cleanup_thread.start()
+    cleanup_thread.join(timeout=SHUTDOWN_TIMEOUT)
+    if cleanup_thread.is_alive():
+        print(f"⚠️  Session cleanup did not finish within {SHUTDOWN_TIMEOUT}s, forcing exit")
+        os._exit(1)
     
     print("👋 CAD Engine Server shutdown complete")
     sys.exit(0)
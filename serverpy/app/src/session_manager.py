@@ -1,6 +1,7 @@
 """
 Session manager for CAD operations - Python version of SessionManager
 """
+import weakref
 from typing import Dict, Optional
 from threading import Lock
 from geometry_engine import OCCTEngine
@@ -9,32 +10,22 @@ from geometry_engine import OCCTEngine
 class SessionManager:
     """
     Python version of the C++ SessionManager
-    Manages OCCTEngine instances per session using singleton pattern
+    Manages OCCTEngine instances per session; a single module-level
+    instance is shared through get_instance()
     """
     
-    _instance: Optional['SessionManager'] = None
-    _lock = Lock()
-    
-    def __new__(cls) -> 'SessionManager':
-        """Singleton implementation"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
         """Initialize session manager"""
-        if not hasattr(self, '_initialized'):
-            self.sessions: Dict[str, OCCTEngine] = {}
-            self._session_lock = Lock()
-            self._initialized = True
-            print("Session Manager initialized (Python)")
+        self.sessions: Dict[str, OCCTEngine] = {}
+        self._session_lock = Lock()
+        # Finalizer holds only the sessions dict, never self
+        weakref.finalize(self, _finalize_sessions, self.sessions)
+        print("Session Manager initialized (Python)")
     
     @classmethod
     def get_instance(cls) -> 'SessionManager':
         """Get singleton instance - equivalent to C++ getInstance"""
-        return cls()
+        return _INSTANCE
     
     def get_or_create_session(self, session_id: str) -> Optional[OCCTEngine]:
         """
@@ -109,13 +100,20 @@ class SessionManager:
         """
         Clear all sessions - equivalent to C++ clearAllSessions
         """
+        # Detach the engines under the lock, then clear them outside it so
+        # slow OCCT teardown doesn't block other API calls
         with self._session_lock:
-            for session_id, engine in self.sessions.items():
+            engines = list(self.sessions.items())
+            self.sessions.clear()
+        
+        for session_id, engine in engines:
+            try:
                 engine.clear_all()
                 print(f"🗑️  Cleared session: {session_id}")
-            
-            self.sessions.clear()
-            print("🗑️  All sessions cleared")
+            except Exception as e:
+                print(f"❌ Failed to clear session {session_id}: {e}")
+        
+        print("🗑️  All sessions cleared")
     
     def get_session_count(self) -> int:
         """
@@ -145,9 +143,11 @@ class SessionManager:
             session_id: Session identifier
         """
         with self._session_lock:
-            if session_id in self.sessions:
-                self.sessions[session_id].clear_all()
-                print(f"🧹 Cleaned up session: {session_id}")
+            engine = self.sessions.get(session_id)
+        
+        if engine is not None:
+            engine.clear_all()
+            print(f"🧹 Cleaned up session: {session_id}")
     
     def get_session_info(self, session_id: str) -> Optional[Dict]:
         """
@@ -164,15 +164,26 @@ class SessionManager:
                 return None
             
             engine = self.sessions[session_id]
+            shape_ids = engine.get_available_shape_ids()
+            parameters = dict(engine.parameters)
             return {
                 "session_id": session_id,
-                "shape_count": len(engine.get_available_shape_ids()),
-                "shape_ids": engine.get_available_shape_ids(),
-                "parameter_count": len(engine.parameters),
-                "parameters": dict(engine.parameters)
+                "shape_count": len(shape_ids),
+                "shape_ids": shape_ids,
+                "parameter_count": len(parameters),
+                "parameters": parameters
             }
-    
-    def __del__(self):
-        """Cleanup on destruction"""
-        if hasattr(self, 'sessions'):
-            self.clear_all_sessions() 
\ No newline at end of file
+
+
+def _finalize_sessions(sessions: Dict[str, OCCTEngine]) -> None:
+    """Release engines when the manager is collected or the interpreter exits"""
+    for engine in list(sessions.values()):
+        try:
+            engine.clear_all()
+        except Exception:
+            pass
+    sessions.clear()
+
+
+# Created eagerly at import so get_instance() needs no locking
+_INSTANCE = SessionManager()
@@ -0,0 +1,80 @@
+"""
+Unit tests for API server request handlers.
+Run with: python test_api_server.py
+"""
+import sys
+import asyncio
+
+
+def test_batch_rollback_restores_shapes():
+    """Test that a batch failing after an operation stored its shape leaves the session unchanged."""
+    from api_server import CADAPIServer, BatchRequest
+    from session_manager import SessionManager
+
+    server = CADAPIServer()
+    session_id = "test_batch_rollback"
+    engine = SessionManager.get_instance().get_or_create_session(session_id)
+    engine.create_box(5.0, 5.0, 5.0, shape_id="keep")
+    shapes_before = dict(engine.shapes)
+
+    # Operation 2 overwrites "keep" with its union, then fails in tessellation
+    tessellate = engine.tessellate
+    engine.tessellate = lambda shape_or_id, *args, **kwargs: (
+        None if shape_or_id == "keep" else tessellate(shape_or_id, *args, **kwargs))
+
+    request = BatchRequest(operations=[
+        {"op": "create", "type": "box", "parameters": {"width": 10.0, "height": 10.0, "depth": 10.0}},
+        {"op": "create", "type": "sphere", "parameters": {"radius": 2.0, "center": {"x": 50.0, "y": 0.0, "z": 0.0}}},
+        {"op": "boolean", "operation": "union", "inputs": ["$0", "$1"], "result_id": "keep"},
+    ])
+
+    try:
+        error = None
+        try:
+            asyncio.run(server._handle_batch(session_id, request))
+        except Exception as e:
+            error = e
+        assert error is not None, "Expected the batch to fail"
+        assert "Batch operation 2" in str(error), f"Unexpected error: {error}"
+
+        assert set(engine.shapes) == set(shapes_before), \
+            f"Expected shapes {sorted(shapes_before)}, got {sorted(engine.shapes)}"
+        assert all(engine.shapes[shape_id] is shape for shape_id, shape in shapes_before.items()), \
+            "Expected overwritten shapes to be restored"
+    finally:
+        SessionManager.get_instance().remove_session(session_id)
+
+    print("✅ test_batch_rollback_restores_shapes passed")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Running API Server Tests")
+    print("=" * 50)
+
+    tests = [
+        test_batch_rollback_restores_shapes,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed with error: {e}")
+            failed += 1
+
+    print("=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
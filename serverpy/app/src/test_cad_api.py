@@ -2,26 +2,144 @@
 Test script for CAD API - validates the Python rewrite functionality
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import argparse
 import json
+import statistics
+import threading
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import count
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; mesh responses are then parsed whole
+    ijson = None
+
+# (connect, read) seconds; a stalled server fails the test instead of hanging it
+DEFAULT_TIMEOUT = (1.0, 30.0)
+
+# Fixed test geometry, shared by the single-shape tests and the setup batch
+BOX_PARAMETERS = {"width": 20.0, "height": 15.0, "depth": 10.0}
+SPHERE_PARAMETERS = {"radius": 8.0, "center": {"x": 5.0, "y": 0.0, "z": 0.0}}
+
+# Create both shapes, then combine them; "$i" refers to the result of operation i
+SETUP_BATCH = [
+    {"op": "create", "type": "box", "parameters": BOX_PARAMETERS},
+    {"op": "create", "type": "sphere", "parameters": SPHERE_PARAMETERS},
+    {"op": "boolean", "operation": "union", "inputs": ["$0", "$1"]},
+    {"op": "boolean", "operation": "cut", "inputs": ["$0", "$1"]},
+]
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request body to UTF-8 JSON, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(body: bytes) -> Any:
+    """Parse a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
 
 
 class CADAPITester:
     """Test client for CAD API endpoints"""
     
-    def __init__(self, base_url: str = "http://localhost:8080"):
+    # Result id suffixes; unique within the process, unlike a seconds timestamp
+    _id_counter = count(1)
+    
+    def __init__(self, base_url: str = "http://localhost:8080", verbose: bool = True):
         self.base_url = base_url
-        self.session_id = f"test_session_{int(time.time())}"
+        self.verbose = verbose  # False prints only the pass/fail line per test
+        # Timestamp keeps separate processes apart, the counter testers within one
+        self.session_id = f"test_session_{int(time.time())}_{next(self._id_counter)}"
         self.created_shapes = []
+        self._shapes_lock = threading.Lock()  # Tests may be run from worker threads
+        
+        # Endpoint URLs, built once per client
+        self._url_health = f"{base_url}/api/v1/health"
+        self._url_models = f"{base_url}/api/v1/models"
+        self._url_operations = f"{base_url}/api/v1/operations"
+        self._url_batch = f"{base_url}/api/v1/batch"
+        self._url_tessellate = f"{base_url}/api/v1/tessellate"
+        self._url_session = f"{base_url}/api/v1/sessions/{self.session_id}"
+        
+        # Only tessellation needs vertices; other calls just report the counts
+        self._metadata_only = {"mesh": "metadata"}
+        
+        # One keep-alive connection pool for every request in the run
+        self.http = requests.Session()
+        # POSTs create shapes, so they are retried only on connect errors (never
+        # sent); read timeouts and 5xx statuses are retried for GET/DELETE alone
+        retry = Retry(total=3, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                      allowed_methods=("GET", "DELETE"))
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        self.http.headers.update({"Accept": "application/json"})
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections"""
+        self.http.close()
+    
+    def _get(self, url: str) -> requests.Response:
+        """GET an API endpoint"""
+        return self.http.get(url, timeout=DEFAULT_TIMEOUT)
+    
+    def _post(self, url: str, payload: Dict[str, Any],
+              params: Optional[Dict[str, str]] = None) -> requests.Response:
+        """POST a pre-serialized JSON payload to an API endpoint"""
+        return self.http.post(url, data=_dumps(payload), params=params, timeout=DEFAULT_TIMEOUT,
+                              headers={"Content-Type": "application/json"})
+    
+    def _delete(self, url: str) -> requests.Response:
+        """DELETE an API endpoint"""
+        return self.http.delete(url, timeout=DEFAULT_TIMEOUT)
+    
+    def _wait_ready(self, timeout_s: float = 10.0) -> bool:
+        """Poll the health endpoint with backoff until the server answers or time runs out"""
+        deadline = time.monotonic() + timeout_s
+        delay = 0.05
+        while time.monotonic() < deadline:
+            try:
+                if self.http.get(self._url_health, timeout=0.5).status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass  # Not listening yet
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        return False
+    
+    def _record_shape(self, shape_id: str) -> None:
+        """Remember a shape created by a test"""
+        with self._shapes_lock:
+            self.created_shapes.append(shape_id)
+    
+    def __enter__(self) -> 'CADAPITester':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def test_health_check(self) -> bool:
         """Test health check endpoint"""
         try:
-            response = requests.get(f"{self.base_url}/api/v1/health")
+            response = self._get(self._url_health)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 print(f"✅ Health check: {data['data']['status']}")
                 return True
             else:
@@ -32,121 +150,107 @@ class CADAPITester:
             print(f"❌ Health check error: {e}")
             return False
     
-    def test_create_box(self) -> str:
-        """Test box creation"""
-        try:
-            payload = {
-                "type": "box",
-                "parameters": {
-                    "width": 20.0,
-                    "height": 15.0,
-                    "depth": 10.0
-                },
-                "session_id": self.session_id
-            }
+    def _run_model_op(self, url: str, payload: Dict[str, Any], id_key: str,
+                      done: str, action: str) -> str:
+        """
+        POST a shape-producing request, report its mesh counts and record the new id
+        
+        Args:
+            url: Endpoint URL
+            payload: Request body
+            id_key: Response field holding the new shape id
+            done: Success message prefix, e.g. "Box created"
+            action: Failure message prefix, e.g. "Box creation"
             
-            response = requests.post(
-                f"{self.base_url}/api/v1/models",
-                json=payload
-            )
+        Returns:
+            The new shape id, or "" on failure
+        """
+        try:
+            response = self._post(url, payload, self._metadata_only)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data["success"]:
-                    model_id = data["data"]["model_id"]
-                    mesh_data = data["data"]["mesh_data"]
-                    print(f"✅ Box created: {model_id}")
-                    print(f"   📊 Vertices: {mesh_data['metadata']['vertex_count']}")
-                    print(f"   📊 Faces: {mesh_data['metadata']['face_count']}")
-                    self.created_shapes.append(model_id)
-                    return model_id
+                    shape_id = data["data"][id_key]
+                    metadata = data["data"]["mesh_data"]["metadata"]
+                    print(f"✅ {done}: {shape_id}")
+                    if self.verbose:
+                        print("\n".join([
+                            f"   📊 Vertices: {metadata['vertex_count']}",
+                            f"   📊 Faces: {metadata['face_count']}",
+                        ]))
+                    self._record_shape(shape_id)
+                    return shape_id
                 else:
-                    print(f"❌ Box creation failed: {data.get('error', 'Unknown error')}")
+                    print(f"❌ {action} failed: {data.get('error', 'Unknown error')}")
                     return ""
             else:
-                print(f"❌ Box creation failed: HTTP {response.status_code}")
+                print(f"❌ {action} failed: HTTP {response.status_code}")
                 return ""
                 
         except Exception as e:
-            print(f"❌ Box creation error: {e}")
+            print(f"❌ {action} error: {e}")
             return ""
     
+    def test_create_box(self) -> str:
+        """Test box creation"""
+        payload = {"type": "box", "parameters": BOX_PARAMETERS, "session_id": self.session_id}
+        return self._run_model_op(self._url_models, payload, "model_id", "Box created", "Box creation")
+    
     def test_create_sphere(self) -> str:
         """Test sphere creation"""
-        try:
-            payload = {
-                "type": "sphere",
-                "parameters": {
-                    "radius": 8.0,
-                    "center": {"x": 5.0, "y": 0.0, "z": 0.0}
-                },
-                "session_id": self.session_id
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/api/v1/models",
-                json=payload
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data["success"]:
-                    model_id = data["data"]["model_id"]
-                    mesh_data = data["data"]["mesh_data"]
-                    print(f"✅ Sphere created: {model_id}")
-                    print(f"   📊 Vertices: {mesh_data['metadata']['vertex_count']}")
-                    print(f"   📊 Faces: {mesh_data['metadata']['face_count']}")
-                    self.created_shapes.append(model_id)
-                    return model_id
-                else:
-                    print(f"❌ Sphere creation failed: {data.get('error', 'Unknown error')}")
-                    return ""
-            else:
-                print(f"❌ Sphere creation failed: HTTP {response.status_code}")
-                return ""
-                
-        except Exception as e:
-            print(f"❌ Sphere creation error: {e}")
-            return ""
+        payload = {"type": "sphere", "parameters": SPHERE_PARAMETERS, "session_id": self.session_id}
+        return self._run_model_op(self._url_models, payload, "model_id", "Sphere created", "Sphere creation")
     
     def test_boolean_operation(self, shape1_id: str, shape2_id: str, operation: str = "union") -> str:
         """Test boolean operations"""
+        payload = {
+            "operation": operation,
+            "parameters": {
+                "shape1_id": shape1_id,
+                "shape2_id": shape2_id,
+                "result_id": f"{operation}_result_{next(self._id_counter)}"
+            },
+            "session_id": self.session_id
+        }
+        name = operation.capitalize()
+        return self._run_model_op(self._url_operations, payload, "result_id", f"{name} completed", name)
+    
+    def test_batch(self, ops: List[Dict[str, Any]]) -> List[str]:
+        """Test batch endpoint - runs every operation in one round-trip"""
         try:
             payload = {
-                "operation": operation,
-                "parameters": {
-                    "shape1_id": shape1_id,
-                    "shape2_id": shape2_id,
-                    "result_id": f"{operation}_result_{int(time.time())}"
-                },
-                "session_id": self.session_id
+                "session_id": self.session_id,
+                "operations": ops
             }
             
-            response = requests.post(
-                f"{self.base_url}/api/v1/operations",
-                json=payload
-            )
+            response = self._post(self._url_batch, payload, self._metadata_only)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data["success"]:
-                    result_id = data["data"]["result_id"]
-                    mesh_data = data["data"]["mesh_data"]
-                    print(f"✅ {operation.capitalize()} completed: {result_id}")
-                    print(f"   📊 Vertices: {mesh_data['metadata']['vertex_count']}")
-                    print(f"   📊 Faces: {mesh_data['metadata']['face_count']}")
-                    self.created_shapes.append(result_id)
-                    return result_id
+                    result_ids = data["data"]["result_ids"]
+                    for op, result_id, result in zip(ops, result_ids, data["data"]["results"]):
+                        label = op.get("type") or op.get("operation")
+                        metadata = result["mesh_data"]["metadata"]
+                        print(f"✅ {label.capitalize()} completed: {result_id}")
+                        if self.verbose:
+                            print("\n".join([
+                                f"   📊 Vertices: {metadata['vertex_count']}",
+                                f"   📊 Faces: {metadata['face_count']}",
+                            ]))
+                        self._record_shape(result_id)
+                    return result_ids
                 else:
-                    print(f"❌ {operation.capitalize()} failed: {data.get('error', 'Unknown error')}")
-                    return ""
+                    print(f"❌ Batch failed: {data.get('error', 'Unknown error')}")
+                    return []
             else:
-                print(f"❌ {operation.capitalize()} failed: HTTP {response.status_code}")
-                return ""
+                print(f"❌ Batch failed: HTTP {response.status_code}")
+                return []
                 
         except Exception as e:
-            print(f"❌ {operation.capitalize()} error: {e}")
-            return ""
+            print(f"❌ Batch error: {e}")
+            return []
     
     def test_tessellate(self, shape_id: str) -> bool:
         """Test tessellation endpoint"""
@@ -157,19 +261,22 @@ class CADAPITester:
                 "session_id": self.session_id
             }
             
-            response = requests.post(
-                f"{self.base_url}/api/v1/tessellate",
-                json=payload
-            )
+            if ijson is not None:
+                return self._stream_tessellate(shape_id, payload)
+            
+            response = self._post(self._url_tessellate, payload)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data["success"]:
-                    mesh_data = data["data"]["mesh_data"]
+                    metadata = data["data"]["mesh_data"]["metadata"]
                     print(f"✅ Tessellation completed for {shape_id}")
-                    print(f"   📊 Vertices: {mesh_data['metadata']['vertex_count']}")
-                    print(f"   📊 Faces: {mesh_data['metadata']['face_count']}")
-                    print(f"   📊 Quality: {mesh_data['metadata']['tessellation_quality']}")
+                    if self.verbose:
+                        print("\n".join([
+                            f"   📊 Vertices: {metadata['vertex_count']}",
+                            f"   📊 Faces: {metadata['face_count']}",
+                            f"   📊 Quality: {metadata['tessellation_quality']}",
+                        ]))
                     return True
                 else:
                     print(f"❌ Tessellation failed: {data.get('error', 'Unknown error')}")
@@ -182,19 +289,66 @@ class CADAPITester:
             print(f"❌ Tessellation error: {e}")
             return False
     
+    def _stream_tessellate(self, shape_id: str, payload: Dict[str, Any]) -> bool:
+        """
+        Tessellation check that parses only the status and mesh metadata of a streamed response
+        
+        The vertex arrays that follow the metadata are drained unparsed, so the
+        connection goes back to the pool instead of being dropped.
+        """
+        with self.http.post(self._url_tessellate, data=_dumps(payload), stream=True, timeout=DEFAULT_TIMEOUT,
+                            headers={"Content-Type": "application/json"}) as response:
+            if response.status_code != 200:
+                print(f"❌ Tessellation failed: HTTP {response.status_code}")
+                return False
+            
+            # "success" leads the body; a failed call has null data and then "error"
+            response.raw.decode_content = True
+            success, error, metadata = None, None, {}
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == "success":
+                    success = value
+                elif prefix == "error" and event == "string":
+                    error = value
+                elif prefix.startswith("data.mesh_data.metadata."):
+                    metadata[prefix.rsplit(".", 1)[1]] = value
+                elif prefix == "data.mesh_data.metadata" and event == "end_map":
+                    break
+            
+            response.content  # Drain the rest of the body
+        
+        if not success:
+            print(f"❌ Tessellation failed: {error or 'Unknown error'}")
+            return False
+        if not metadata:
+            print("❌ Tessellation failed: no mesh data in response")
+            return False
+        
+        print(f"✅ Tessellation completed for {shape_id}")
+        if self.verbose:
+            print("\n".join([
+                f"   📊 Vertices: {metadata['vertex_count']}",
+                f"   📊 Faces: {metadata['face_count']}",
+                f"   📊 Quality: {metadata['tessellation_quality']}",
+            ]))
+        return True
+    
     def test_session_info(self) -> bool:
         """Test session info endpoint"""
         try:
-            response = requests.get(f"{self.base_url}/api/v1/sessions/{self.session_id}")
+            response = self._get(self._url_session)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 if data["success"]:
                     info = data["data"]
                     print(f"✅ Session info retrieved:")
-                    print(f"   📝 Session ID: {info['session_id']}")
-                    print(f"   📊 Shape count: {info['shape_count']}")
-                    print(f"   🔧 Shapes: {', '.join(info['shape_ids'])}")
+                    if self.verbose:
+                        print("\n".join([
+                            f"   📝 Session ID: {info['session_id']}",
+                            f"   📊 Shape count: {info['shape_count']}",
+                            f"   🔧 Shapes: {', '.join(info['shape_ids'])}",
+                        ]))
                     return True
                 else:
                     print(f"❌ Session info failed: {data.get('error', 'Unknown error')}")
@@ -207,6 +361,22 @@ class CADAPITester:
             print(f"❌ Session info error: {e}")
             return False
     
+    def delete_session(self) -> bool:
+        """Delete the test session on the server"""
+        try:
+            response = self._delete(self._url_session)
+            
+            if response.status_code == 200 and _loads(response.content)["success"]:
+                print(f"🗑️  Session deleted: {self.session_id}")
+                return True
+            
+            print(f"❌ Session delete failed: HTTP {response.status_code}")
+            return False
+            
+        except Exception as e:
+            print(f"❌ Session delete error: {e}")
+            return False
+    
     def run_full_test(self) -> bool:
         """Run comprehensive API test"""
         print("🧪 Starting CAD API Test Suite")
@@ -218,24 +388,27 @@ class CADAPITester:
         
         print("\n📦 Testing primitive creation...")
         
-        # Create shapes
-        box_id = self.test_create_box()
-        if not box_id:
-            return False
-        
-        sphere_id = self.test_create_sphere()
-        if not sphere_id:
-            return False
-        
-        print("\n🔀 Testing boolean operations...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Create shapes - independent, so both requests are in flight together
+            box_future = executor.submit(self.test_create_box)
+            sphere_future = executor.submit(self.test_create_sphere)
+            box_id, sphere_id = box_future.result(), sphere_future.result()
+            if not box_id or not sphere_id:
+                return False
+            
+            print("\n🔀 Testing boolean operations...")
+            
+            # Test boolean operations - both only read the box and sphere
+            union_future = executor.submit(self.test_boolean_operation, box_id, sphere_id, "union")
+            cut_future = executor.submit(self.test_boolean_operation, box_id, sphere_id, "cut")
+            union_id, cut_id = union_future.result(), cut_future.result()
+            if not union_id or not cut_id:
+                return False
         
-        # Test boolean operations
-        union_id = self.test_boolean_operation(box_id, sphere_id, "union")
-        if not union_id:
-            return False
+        print("\n📦 Testing batch operations...")
         
-        cut_id = self.test_boolean_operation(box_id, sphere_id, "cut")
-        if not cut_id:
+        # Same shapes and booleans again, in a single round-trip
+        if len(self.test_batch(SETUP_BATCH)) != len(SETUP_BATCH):
             return False
         
         print("\n🔍 Testing tessellation...")
@@ -257,18 +430,63 @@ class CADAPITester:
         return True
 
 
+def _run_iterations(tester: CADAPITester, iterations: int, warmup: int) -> Tuple[bool, List[float]]:
+    """Run the suite repeatedly on one tester; returns success and the timed durations"""
+    timings = []
+    for i in range(warmup + iterations):
+        tester.created_shapes.clear()
+        
+        start = time.perf_counter()
+        success = tester.run_full_test()
+        elapsed = time.perf_counter() - start
+        
+        if not success:
+            return False, timings
+        if i >= warmup:
+            timings.append(elapsed)
+    return True, timings
+
+
 def main():
     """Main test function"""
+    parser = argparse.ArgumentParser(description="CAD API test client")
+    parser.add_argument("--iterations", type=int, default=1, help="Timed runs of the full suite")
+    parser.add_argument("--warmup", type=int, default=0, help="Untimed runs before the timed ones")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent testers, each with its own session")
+    parser.add_argument("--quiet", action="store_true", help="Print only pass/fail lines")
+    parser.add_argument("--interactive", action="store_true", help="Wait for Enter instead of polling /health")
+    args = parser.parse_args()
+    
     print("🧪 CAD API Test Client")
     print("Make sure the CAD server is running on localhost:8080")
     print("")
     
-    tester = CADAPITester()
+    # Each worker reuses one tester for all of its runs, so its connection
+    # pool and server session stay warm
+    with ExitStack() as stack:
+        testers = [stack.enter_context(CADAPITester(verbose=not args.quiet))
+                   for _ in range(max(args.workers, 1))]
+        
+        if args.interactive:
+            input("Press Enter to start tests...")
+        elif not testers[0]._wait_ready():
+            print("❌ Server did not become ready")
+            return 1
+        
+        with ThreadPoolExecutor(max_workers=len(testers)) as executor:
+            results = list(executor.map(
+                lambda tester: _run_iterations(tester, args.iterations, args.warmup), testers))
+        
+        for tester in testers:
+            tester.delete_session()
     
-    # Wait for user confirmation
-    input("Press Enter to start tests...")
+    success = all(ok for ok, _ in results)
+    timings = [elapsed for _, worker_timings in results for elapsed in worker_timings]
     
-    success = tester.run_full_test()
+    if timings:
+        p95 = statistics.quantiles(timings, n=20, method="inclusive")[-1] if len(timings) > 1 else timings[0]
+        print(f"⏱️  {len(timings)} runs: median {statistics.median(timings) * 1000:.1f} ms, "
+              f"p95 {p95 * 1000:.1f} ms")
     
     if success:
         print("🎉 All tests completed successfully!")
@@ -0,0 +1,332 @@
+"""
+Unit tests for geometry engine.
+Run with: python test_geometry_engine.py
+"""
+import sys
+
+
+# Points on both sides of, and on, the mirror lines under test
+MIRROR_SAMPLE_POINTS = [(0.0, 0.0), (7.5, -2.25), (-3.0, 11.0), (4.0, 6.0), (1e3, -1e3)]
+
+
+def _make_sketch():
+    """Create an engine with one sketch on the XY plane; returns (engine, sketch_id)."""
+    from geometry_engine import OCCTEngine
+
+    engine = OCCTEngine()
+    plane_id = engine.create_sketch_plane("XY")
+    sketch_id = engine.create_sketch(plane_id)
+    assert sketch_id, "Failed to create sketch"
+    return engine, sketch_id
+
+
+def _assert_mirror_matches_occt(x1, y1, x2, y2):
+    """Reflect sample points with the closed-form coefficients and compare with gp_Pnt2d.Mirrored."""
+    from OCC.Core.gp import gp_Pnt2d, gp_Dir2d, gp_Lin2d
+
+    engine, sketch_id = _make_sketch()
+    sketch = engine.get_sketch_by_id(sketch_id)
+
+    reflection = sketch._calculate_reflection_from_coordinates(x1, y1, x2, y2)
+    assert reflection is not None, "Expected reflection coefficients for a non-degenerate line"
+
+    axis = gp_Lin2d(gp_Pnt2d(x1, y1), gp_Dir2d(x2 - x1, y2 - y1)).Position()
+    for px, py in MIRROR_SAMPLE_POINTS:
+        mirrored = sketch._reflect_point(gp_Pnt2d(px, py), reflection)
+        expected = gp_Pnt2d(px, py).Mirrored(axis)
+        assert abs(mirrored.X() - expected.X()) < 1e-9 and abs(mirrored.Y() - expected.Y()) < 1e-9, \
+            f"({px},{py}) mirrored to ({mirrored.X()},{mirrored.Y()}), expected ({expected.X()},{expected.Y()})"
+
+
+def test_mirror_diagonal_line():
+    """Test mirroring across a diagonal line, point-wise and through a sketch line element."""
+    from OCC.Core.gp import gp_Pnt2d, gp_Dir2d, gp_Lin2d
+
+    _assert_mirror_matches_occt(1.0, 2.0, 4.0, 6.0)
+
+    engine, sketch_id = _make_sketch()
+    sketch = engine.get_sketch_by_id(sketch_id)
+    line_id = engine.add_line_to_sketch(sketch_id, 0.0, 5.0, 3.0, -1.0)
+
+    mirrored_ids = sketch.mirror_elements_by_two_points([line_id], gp_Pnt2d(1.0, 2.0), gp_Pnt2d(4.0, 6.0))
+    assert len(mirrored_ids) == 1, f"Expected one mirrored element, got {mirrored_ids}"
+
+    axis = gp_Lin2d(gp_Pnt2d(1.0, 2.0), gp_Dir2d(3.0, 4.0)).Position()
+    mirrored = sketch.get_element_by_id(mirrored_ids[0])
+    for actual, original in ((mirrored.start_point, gp_Pnt2d(0.0, 5.0)), (mirrored.end_point, gp_Pnt2d(3.0, -1.0))):
+        expected = original.Mirrored(axis)
+        assert actual.Distance(expected) < 1e-9, \
+            f"Mirrored endpoint ({actual.X()},{actual.Y()}), expected ({expected.X()},{expected.Y()})"
+
+    print("✅ test_mirror_diagonal_line passed")
+    return True
+
+
+def test_mirror_horizontal_line():
+    """Test the axis-aligned fast path for horizontal mirror lines, in both directions."""
+    _assert_mirror_matches_occt(-2.0, 3.0, 5.0, 3.0)
+    _assert_mirror_matches_occt(5.0, 3.0, -2.0, 3.0)
+    print("✅ test_mirror_horizontal_line passed")
+    return True
+
+
+def test_mirror_vertical_line():
+    """Test the axis-aligned fast path for vertical mirror lines, in both directions."""
+    _assert_mirror_matches_occt(1.0, -1.0, 1.0, 4.0)
+    _assert_mirror_matches_occt(1.0, 4.0, 1.0, -1.0)
+    print("✅ test_mirror_vertical_line passed")
+    return True
+
+
+def test_mirror_zero_length_line():
+    """Test that a zero-length mirror line is rejected and leaves the sketch unchanged."""
+    from OCC.Core.gp import gp_Pnt2d
+
+    engine, sketch_id = _make_sketch()
+    sketch = engine.get_sketch_by_id(sketch_id)
+    line_id = engine.add_line_to_sketch(sketch_id, 0.0, 0.0, 1.0, 1.0)
+
+    assert sketch._calculate_reflection_from_coordinates(2.0, 2.0, 2.0, 2.0) is None, \
+        "Expected no reflection for a zero-length line"
+
+    mirrored_ids = sketch.mirror_elements_by_two_points([line_id], gp_Pnt2d(2.0, 2.0), gp_Pnt2d(2.0, 2.0))
+    assert mirrored_ids == [], f"Expected no mirrored elements, got {mirrored_ids}"
+    assert sketch.get_element_count() == 1, f"Expected 1 element, got {sketch.get_element_count()}"
+
+    print("✅ test_mirror_zero_length_line passed")
+    return True
+
+
+def _add_box(engine, shape_id, x, y, z, size=10.0):
+    """Store a size³ box with its minimum corner at (x, y, z) directly in the engine."""
+    from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
+    from OCC.Core.gp import gp_Pnt
+
+    engine.shapes[shape_id] = BRepPrimAPI_MakeBox(gp_Pnt(x, y, z), size, size, size).Shape()
+    return shape_id
+
+
+def _volume(shape):
+    """Volume of a shape."""
+    from OCC.Core.BRepGProp import brepgprop
+    from OCC.Core.GProp import GProp_GProps
+
+    props = GProp_GProps()
+    brepgprop.VolumeProperties(shape, props)
+    return props.Mass()
+
+
+def _solid_count(shape):
+    """Number of solids in a shape."""
+    from OCC.Core.TopExp import TopExp_Explorer
+    from OCC.Core.TopAbs import TopAbs_SOLID
+
+    explorer = TopExp_Explorer(shape, TopAbs_SOLID)
+    count = 0
+    while explorer.More():
+        count += 1
+        explorer.Next()
+    return count
+
+
+def test_boolean_disjoint_shortcuts():
+    """Test union/cut/intersect results when the operand bounding boxes are disjoint."""
+    from OCC.Core.TopAbs import TopAbs_COMPOUND
+    from OCC.Core.TopoDS import TopoDS_Iterator
+    from geometry_engine import OCCTEngine
+
+    engine = OCCTEngine()
+    _add_box(engine, "a", 0.0, 0.0, 0.0)
+    _add_box(engine, "far", 20.0, 0.0, 0.0)
+    assert engine._bounding_boxes_disjoint(engine.shapes["a"], engine.shapes["far"]), \
+        "Expected disjoint bounding boxes"
+
+    # Union: a compound holding both operands unchanged
+    assert engine.union_shapes("a", "far", "union"), "Union failed"
+    union = engine.shapes["union"]
+    assert union.ShapeType() == TopAbs_COMPOUND, f"Expected a compound, got {union.ShapeType()}"
+    assert _solid_count(union) == 2, f"Expected 2 solids, got {_solid_count(union)}"
+    assert abs(_volume(union) - 2000.0) < 1e-6, f"Expected volume 2000, got {_volume(union)}"
+
+    # Cut: shape1 itself
+    assert engine.cut_shapes("a", "far", "cut"), "Cut failed"
+    assert engine.shapes["cut"].IsSame(engine.shapes["a"]), "Expected cut result to be shape1"
+
+    # Intersect: an empty compound
+    assert engine.intersect_shapes("a", "far", "common"), "Intersect failed"
+    common = engine.shapes["common"]
+    assert common.ShapeType() == TopAbs_COMPOUND, f"Expected a compound, got {common.ShapeType()}"
+    assert not TopoDS_Iterator(common).More(), "Expected an empty intersection"
+
+    print("✅ test_boolean_disjoint_shortcuts passed")
+    return True
+
+
+def test_boolean_overlapping_runs_kernel():
+    """Test that overlapping and face-touching bounding boxes still go through the boolean kernel."""
+    from geometry_engine import OCCTEngine
+
+    engine = OCCTEngine()
+    _add_box(engine, "a", 0.0, 0.0, 0.0)
+    _add_box(engine, "overlap", 5.0, 0.0, 0.0)
+    _add_box(engine, "touch", 10.0, 0.0, 0.0)
+
+    # Half-overlapping boxes: volumes only the kernel can produce
+    assert not engine._bounding_boxes_disjoint(engine.shapes["a"], engine.shapes["overlap"])
+    assert engine.union_shapes("a", "overlap", "union"), "Union failed"
+    assert abs(_volume(engine.shapes["union"]) - 1500.0) < 1e-6, \
+        f"Expected union volume 1500, got {_volume(engine.shapes['union'])}"
+    assert engine.cut_shapes("a", "overlap", "cut"), "Cut failed"
+    assert abs(_volume(engine.shapes["cut"]) - 500.0) < 1e-6, \
+        f"Expected cut volume 500, got {_volume(engine.shapes['cut'])}"
+    assert engine.intersect_shapes("a", "overlap", "common"), "Intersect failed"
+    assert abs(_volume(engine.shapes["common"]) - 500.0) < 1e-6, \
+        f"Expected common volume 500, got {_volume(engine.shapes['common'])}"
+
+    # Boxes sharing a face: bounding boxes touch, so the shortcut must not apply
+    assert not engine._bounding_boxes_disjoint(engine.shapes["a"], engine.shapes["touch"]), \
+        "Touching bounding boxes must not count as disjoint"
+    assert engine.union_shapes("a", "touch", "touch_union"), "Union failed"
+    assert _solid_count(engine.shapes["touch_union"]) == 1, \
+        f"Expected the kernel to fuse into 1 solid, got {_solid_count(engine.shapes['touch_union'])}"
+    assert engine.cut_shapes("a", "touch", "touch_cut"), "Cut failed"
+    assert not engine.shapes["touch_cut"].IsSame(engine.shapes["a"]), "Expected a kernel cut result"
+
+    print("✅ test_boolean_overlapping_runs_kernel passed")
+    return True
+
+
+def _decode_int16_positions(compact):
+    """Dequantize uint16 positions with the bounds stored alongside them."""
+    import numpy as np
+
+    bounds_min = np.asarray(compact["bounds_min"], dtype=np.float64)
+    bounds_max = np.asarray(compact["bounds_max"], dtype=np.float64)
+    return bounds_min + compact["vertices"].astype(np.float64) / 65535.0 * (bounds_max - bounds_min)
+
+
+def _decode_octahedral_normals(encoded):
+    """Unfold int8 octahedral normals back to unit vectors."""
+    import numpy as np
+
+    octa = encoded.astype(np.float64) / 127.0
+    x, y = octa[:, 0], octa[:, 1]
+    z = 1.0 - np.abs(x) - np.abs(y)
+    sign_x = np.where(x >= 0.0, 1.0, -1.0)
+    sign_y = np.where(y >= 0.0, 1.0, -1.0)
+    normals = np.stack([
+        np.where(z < 0.0, (1.0 - np.abs(y)) * sign_x, x),
+        np.where(z < 0.0, (1.0 - np.abs(x)) * sign_y, y),
+        z
+    ], axis=1)
+    return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+
+def test_compact_int16_positions_round_trip():
+    """Test that int16-encoded positions decode to within one quantization step."""
+    import numpy as np
+    from geometry_engine import MeshData
+
+    rng = np.random.default_rng(7)
+    vertices = rng.uniform([-50.0, 0.0, -7.0], [120.0, 3.0, -2.0], size=(500, 3))
+    mesh = MeshData(vertices=vertices, faces=[[0, 1, 2]], normals=np.tile([0.0, 0.0, 1.0], (500, 1)))
+
+    compact = mesh.to_compact('int16')
+    assert compact["vertices"].dtype == np.uint16, f"Expected uint16 positions, got {compact['vertices'].dtype}"
+
+    extent = np.asarray(compact["bounds_max"]) - np.asarray(compact["bounds_min"])
+    error = np.abs(_decode_int16_positions(compact) - mesh.vertices.astype(np.float64))
+    assert np.all(error <= extent / 65535.0), f"Max error {error.max(axis=0)} exceeds bbox/65535 {extent / 65535.0}"
+
+    # A flat axis has no extent and must decode to its single value
+    flat = MeshData(vertices=[[0.0, 5.0, 1.0], [2.0, 5.0, 3.0]], faces=[], normals=[[0.0, 0.0, 1.0]] * 2)
+    decoded = _decode_int16_positions(flat.to_compact('int16'))
+    assert np.allclose(decoded[:, 1], 5.0), f"Expected flat y of 5.0, got {decoded[:, 1]}"
+
+    print("✅ test_compact_int16_positions_round_trip passed")
+    return True
+
+
+def test_compact_octahedral_normals_round_trip():
+    """Test that oct-encoded normals decode within int8 precision, in both hemispheres."""
+    import numpy as np
+    from geometry_engine import MeshData
+
+    rng = np.random.default_rng(11)
+    normals = rng.normal(size=(1000, 3))
+    normals = np.vstack([
+        normals / np.linalg.norm(normals, axis=1, keepdims=True),
+        # Poles, axes, and lower-hemisphere normals on the x = 0 / y = 0 fold seams
+        [[0.0, 0.0, 1.0], [0.0, 0.0, -1.0], [1.0, 0.0, 0.0], [0.0, -1.0, 0.0],
+         [0.0, 0.6, -0.8], [0.0, -0.6, -0.8], [0.6, 0.0, -0.8], [-0.6, 0.0, -0.8]]
+    ])
+    assert np.count_nonzero(normals[:, 2] < 0.0) > 400, "Expected plenty of z < 0 normals"
+    mesh = MeshData(vertices=np.zeros_like(normals), faces=[], normals=normals)
+
+    encoded = mesh.to_compact('int16')["normals"]
+    assert encoded.dtype == np.int8 and encoded.shape == (len(normals), 2), \
+        f"Expected (N, 2) int8 normals, got {encoded.dtype} {encoded.shape}"
+
+    # Half a step of rounding per octahedral coordinate, stretched by renormalization
+    error = np.abs(_decode_octahedral_normals(encoded) - mesh.normals.astype(np.float64))
+    assert error.max() <= 2.0 / 127.0, f"Max normal error {error.max()} exceeds 2/127"
+
+    print("✅ test_compact_octahedral_normals_round_trip passed")
+    return True
+
+
+def test_compact_face_index_width():
+    """Test that face indices are uint16 up to 65535 vertices and uint32 beyond."""
+    import numpy as np
+    from geometry_engine import MeshData
+
+    for vertex_count, expected_dtype in ((65535, np.uint16), (65536, np.uint32)):
+        faces = [[0, 1, vertex_count - 1]]
+        mesh = MeshData(vertices=np.zeros((vertex_count, 3)), faces=faces, normals=np.zeros((vertex_count, 3)))
+        compact_faces = mesh.to_compact()["faces"]
+        assert compact_faces.dtype == expected_dtype, \
+            f"{vertex_count} vertices: expected {np.dtype(expected_dtype)}, got {compact_faces.dtype}"
+        assert compact_faces.tolist() == faces, f"Face indices changed: {compact_faces.tolist()}"
+
+    print("✅ test_compact_face_index_width passed")
+    return True
+
+
+def main():
+    """Run all tests."""
+    print("🧪 Running Geometry Engine Tests")
+    print("=" * 50)
+
+    tests = [
+        test_mirror_diagonal_line,
+        test_mirror_horizontal_line,
+        test_mirror_vertical_line,
+        test_mirror_zero_length_line,
+        test_boolean_disjoint_shortcuts,
+        test_boolean_overlapping_runs_kernel,
+        test_compact_int16_positions_round_trip,
+        test_compact_octahedral_normals_round_trip,
+        test_compact_face_index_width,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__} failed with error: {e}")
+            failed += 1
+
+    print("=" * 50)
+    print(f"Results: {passed} passed, {failed} failed")
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())